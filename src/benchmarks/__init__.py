@@ -0,0 +1,6 @@
+'''
+Benchmarks for gqlp. Run them from the src directory, e.g.
+
+    python -m benchmarks.run --size 2000 --output results.json
+    python -m benchmarks.run --compare results.json
+'''
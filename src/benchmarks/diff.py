@@ -0,0 +1,67 @@
+'''
+Compares schema diffs against comparing the repr of every definition
+and field of two parsed copies of a generated schema. Hashing is paid once per schema and
+version; after that, diffing two versions only looks at the buckets
+that changed.
+'''
+import argparse
+from timeit import timeit
+
+from gqlp import GraphQLLexer
+from gqlp.diff import Hashes, diff, hashes
+from gqlp.gql import Enum, Name, Schema
+from gqlp.parser import Parser
+
+from .generate import SHAPES, generate
+
+
+def parse(text):
+    return Schema.match(Parser(GraphQLLexer(text, scanner=True)))
+
+
+def text_of(schema):
+    return [
+        (repr(definition), [repr(field) for field in definition])
+        for definition in schema._types
+    ]
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--shape', action='append', choices=SHAPES,
+        help='shapes to run, all that parse by default'
+    )
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--number', type=int, default=10)
+    options = options.parse_args()
+    number = options.number
+
+    print(
+        f'{"shape":<14} {"repr ms":>8} {"hash ms":>8}'
+        f' {"same ms":>8} {"changed ms":>10}'
+    )
+    for shape in options.shape or list(SHAPES):
+        if not SHAPES[shape].parses:
+            continue
+        text = generate(options.size, shape)
+        old, new = parse(text), parse(text)
+
+        by_repr = timeit(lambda: text_of(old) == text_of(new), number=number)
+        by_hash = timeit(lambda: Hashes(old), number=number)
+        hashes(old), hashes(new)
+        same = timeit(lambda: diff(old, new), number=number)
+
+        new.add(Enum(Name('Added'), [Name('ADDED')]))
+        hashes(new)
+        changed = timeit(lambda: diff(old, new), number=number)
+
+        print(
+            f'{shape:<14} {by_repr / number * 1e3:>8.2f}'
+            f' {by_hash / number * 1e3:>8.2f}'
+            f' {same / number * 1e3:>8.3f} {changed / number * 1e3:>10.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+'''
+Synthetic schemas of configurable size and shape.
+
+    python -m benchmarks.generate --shape wide_types --size 100 > wide.graphql
+'''
+import argparse
+import random
+
+
+class Shape(object):
+    '''
+    Describes what a generated schema looks like. Sizes are per
+    definition, size passed to generate() scales the definition
+    count.
+    '''
+
+    def __init__(
+        self, types=0, fields=5, list_depth=1, comments=0,
+        comment_length=40, strings=0, string_length=80,
+        enums=0, enum_values=8, queries=0, parses=True
+    ):
+        self.types = types
+        self.fields = fields
+        self.list_depth = list_depth
+        self.comments = comments
+        self.comment_length = comment_length
+        self.strings = strings
+        self.string_length = string_length
+        self.enums = enums
+        self.enum_values = enum_values
+        self.queries = queries
+        self.parses = parses
+
+
+SHAPES = {
+    'many_types': Shape(types=1, fields=5),
+    'wide_types': Shape(types=0.01, fields=500),
+    'nested_lists': Shape(types=0.1, fields=10, list_depth=40),
+    'comments': Shape(types=1, fields=5, comments=3, comment_length=120),
+    'strings': Shape(types=1, fields=5, strings=2, string_length=400,
+                     parses=False),
+    'large_enums': Shape(enums=0.01, enum_values=2000),
+    'queries': Shape(queries=1),
+    'mixed': Shape(types=1, fields=8, list_depth=2, comments=1,
+                   enums=0.1, queries=0.1),
+}
+
+SCALARS = ('String', 'Int', 'Float', 'Boolean', 'ID')
+WORDS = (
+    'weasel', 'badger', 'otter', 'marten', 'stoat', 'ferret', 'mink',
+    'wolverine', 'polecat', 'ermine'
+)
+
+
+def _count(share, size):
+    return max(1, int(share * size)) if share else 0
+
+
+def _text(random_, length):
+    words = []
+    while sum(map(len, words)) + len(words) < length:
+        words.append(random_.choice(WORDS))
+    return ' '.join(words)
+
+
+def _field_type(random_, candidates, depth):
+    type_ = random_.choice(candidates)
+    for _ in range(random_.randint(0, depth)):
+        type_ = f'[{type_}{random_.choice(("", "!"))}]'
+    return type_ + random_.choice(('', '!'))
+
+
+def _type(random_, index, shape, candidates):
+    keyword = 'input' if index % 10 == 9 else 'type'
+    lines = [f'{keyword} Type{index} {{']
+    for field in range(shape.fields):
+        for _ in range(shape.comments):
+            lines.append(f'  # {_text(random_, shape.comment_length)}')
+        for _ in range(shape.strings):
+            lines.append(f'  """{_text(random_, shape.string_length)}"""')
+        type_ = _field_type(random_, candidates, shape.list_depth)
+        lines.append(f'  field{field}: {type_}')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def _enum(index, shape):
+    values = ' '.join(f'VALUE_{value}' for value in range(shape.enum_values))
+    return f'enum Enum{index} {{\n  {values}\n}}'
+
+
+def _query(random_, index):
+    fields = ' '.join(random_.sample(WORDS, 4))
+    return (
+        f'query Query{index}($id: ID!) {{\n'
+        f'  node(id: $id) {{\n    {fields}\n  }}\n'
+        f'}}'
+    )
+
+
+def generate(size: int, shape='many_types', seed: int = 0):
+    '''
+    Returns the text of a schema with roughly size definitions
+    per unit of each definition kind in shape.
+    '''
+    if isinstance(shape, str):
+        shape = SHAPES[shape]
+
+    random_ = random.Random(seed)
+    count = _count(shape.types, size)
+    # Built once, field types are picked from it for every field
+    candidates = SCALARS + tuple(f'Type{index}' for index in range(count))
+
+    definitions = [
+        _type(random_, index, shape, candidates) for index in range(count)
+    ]
+    definitions.extend(
+        _enum(index, shape) for index in range(_count(shape.enums, size))
+    )
+    definitions.extend(
+        _query(random_, index)
+        for index in range(_count(shape.queries, size))
+    )
+    return '\n\n'.join(definitions) + '\n'
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument('--shape', choices=SHAPES, default='many_types')
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--seed', type=int, default=0)
+    options = options.parse_args()
+    print(generate(options.size, options.shape, options.seed), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''
+Compares re-parsing a Document after an edit with parsing the
+whole schema again.
+
+    python -m benchmarks.incremental
+
+The first table keeps the edit fixed and grows the schema, the
+second one keeps the schema fixed and grows the edit. Incremental
+re-parse time should follow the edit, not the schema. It includes
+getting the schema and a position from the document, as a full
+parse includes building the schema.
+'''
+from timeit import timeit
+
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.incremental import Document
+from gqlp.parser import Parser
+
+from .generate import generate
+
+
+def full(text):
+    return Schema.match(Parser(GraphQLLexer(text, scanner=True)))
+
+
+def result(document):
+    return document.schema._types[-1]._name.line
+
+
+def incremental(document, edit):
+    offset, removed, inserted = edit
+    original = document.text[offset:offset + removed]
+    document.edit(offset, removed, inserted)
+    result(document)
+    # Undo, so every run edits the same text.
+    document.edit(offset, len(inserted), original)
+    result(document)
+
+
+def measure(text, edit, number):
+    document = Document(text)
+    reparse = timeit(lambda: incremental(document, edit), number=number)
+    parse = timeit(lambda: full(text), number=1)
+    return reparse / number / 2, parse
+
+
+def main():
+    print(f'{"types":>8} {"edit":>8} {"incremental ms":>15} {"full ms":>10}')
+
+    for types in (100, 1000, 10000):
+        text = generate(types)
+        offset = text.index('field1', len(text) // 2)
+        edit = offset, 6, 'title1'
+        reparse, parse = measure(text, edit, 200)
+        print(f'{types:>8} {6:>8} {reparse * 1e3:>15.3f} {parse * 1e3:>10.1f}')
+
+    text = generate(10000)
+    for edited in (1, 10, 100):
+        block = generate(edited)
+        offset = text.index('type', len(text) // 2)
+        edit = offset, 0, block
+        reparse, parse = measure(text, edit, 50)
+        print(
+            f'{10000:>8} {len(block):>8}'
+            f' {reparse * 1e3:>15.3f} {parse * 1e3:>10.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+'''
+Compares the table-driven LL(1) parser with the hand-written one on
+generated schemas. Both parse the same lexed tokens.
+'''
+import argparse
+from timeit import timeit
+
+from gqlp import GraphQLLexer
+from gqlp import ll1
+from gqlp.gql import Schema
+from gqlp.parser import Parser
+
+from .generate import SHAPES, generate
+
+
+def measure(text, number):
+    tokens = list(GraphQLLexer(text, ignore=Parser.IGNORED))
+    # Generates the tables outside of the timing
+    ll1.parse(Parser(tokens))
+
+    hand_written = timeit(
+        lambda: Schema.match(Parser(tokens)), number=number
+    ) / number
+    table_driven = timeit(
+        lambda: ll1.parse(Parser(tokens)), number=number
+    ) / number
+    return len(tokens), hand_written, table_driven
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--shape', action='append', choices=SHAPES,
+        help='shapes to run, all that parse by default'
+    )
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--number', type=int, default=3)
+    options = options.parse_args()
+
+    print(
+        f'{"shape":<14} {"tokens":>8} {"hand ms":>9} {"ll1 ms":>9}'
+        f' {"ll1/hand":>9}'
+    )
+    for shape in options.shape or list(SHAPES):
+        if not SHAPES[shape].parses:
+            continue
+        tokens, hand_written, table_driven = measure(
+            generate(options.size, shape), options.number
+        )
+        print(
+            f'{shape:<14} {tokens:>8} {hand_written * 1e3:>9.1f}'
+            f' {table_driven * 1e3:>9.1f}'
+            f' {table_driven / hand_written:>8.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+'''
+Measures how much memory a parsed schema keeps alive, in bytes per
+definition, on generated schemas.
+'''
+import argparse
+import gc
+import json
+import tracemalloc
+
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.parser import Parser
+
+from .generate import SHAPES, generate
+
+
+def retained(text):
+    '''
+    Bytes allocated by parsing text that are still in use once the
+    parser is gone, and the parsed schema.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        schema = Schema.match(Parser(GraphQLLexer(text, scanner=True)))
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, schema
+
+
+def measure(shapes, size):
+    results = {}
+    for shape in shapes:
+        if not SHAPES[shape].parses:
+            continue
+        size_, schema = retained(generate(size, shape))
+        results[shape] = {
+            'definitions': len(schema._types),
+            'bytes': size_,
+            'bytes_per_definition': size_ / len(schema._types),
+        }
+    return results
+
+
+def report(results, baseline=None):
+    header = f'{"shape":<14} {"defs":>7} {"KiB":>9} {"bytes/def":>10}'
+    if baseline:
+        header += f' {"vs base":>8}'
+    print(header)
+
+    for shape, result in results.items():
+        line = (
+            f'{shape:<14} {result["definitions"]:>7}'
+            f' {result["bytes"] / 1024:>9.0f}'
+            f' {result["bytes_per_definition"]:>10.0f}'
+        )
+        before = (baseline or {}).get(shape)
+        if before:
+            ratio = (
+                result['bytes_per_definition']
+                / before['bytes_per_definition']
+            )
+            line += f' {ratio:>7.2f}x'
+        print(line)
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--shape', action='append', choices=SHAPES,
+        help='shapes to run, all by default'
+    )
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--output', help='write the results as JSON')
+    options.add_argument('--compare', help='JSON results to compare with')
+    options = options.parse_args()
+
+    results = measure(options.shape or list(SHAPES), options.size)
+
+    baseline = None
+    if options.compare:
+        with open(options.compare) as file:
+            baseline = json.load(file)
+
+    report(results, baseline)
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
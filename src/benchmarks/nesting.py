@@ -0,0 +1,66 @@
+'''
+Times parsing of deeply nested list types and query selections.
+'''
+import argparse
+from timeit import timeit
+
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.parser import Parser
+
+
+def nested_list(depth):
+    return f'type Deep {{\n  field: {"[" * depth}String{"!]" * depth}\n}}\n'
+
+
+def nested_selection(depth):
+    selection = ' { field' * depth + ' }' * depth
+    return (
+        'query Deep($id: ID) {\n'
+        f'  deep(id: $id) {{ field{selection} }}\n'
+        '}\n'
+    )
+
+
+SHAPES = {
+    'list': nested_list,
+    'selection': nested_selection,
+}
+
+
+def measure(shape, depth, number):
+    text = SHAPES[shape](depth)
+    tokens = list(GraphQLLexer(text, ignore=Parser.IGNORED))
+    try:
+        seconds = timeit(
+            lambda: Schema.match(Parser(tokens)), number=number
+        ) / number
+    except RecursionError:
+        return None
+    return seconds
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--depth', type=int, action='append',
+        help='nesting depths, 10 to 50000 by default'
+    )
+    options.add_argument('--number', type=int, default=5)
+    options = options.parse_args()
+
+    print(f'{"shape":<10} {"depth":>7} {"parse ms":>9} {"us/level":>9}')
+    for shape in SHAPES:
+        for depth in options.depth or (10, 100, 1000, 10000, 50000):
+            seconds = measure(shape, depth, options.number)
+            if seconds is None:
+                print(f'{shape:<10} {depth:>7} {"RecursionError":>19}')
+                continue
+            print(
+                f'{shape:<10} {depth:>7} {seconds * 1e3:>9.2f}'
+                f' {seconds / depth * 1e6:>9.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
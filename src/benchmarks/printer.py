@@ -0,0 +1,55 @@
+'''
+Measures how fast the printer writes generated schemas as SDL, in MB
+of output per second.
+'''
+import argparse
+import io
+import os
+from timeit import timeit
+
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.parser import Parser
+from gqlp.printer import print_schema
+
+from .generate import SHAPES, generate
+
+
+def measure(schema, minified, number):
+    stream = io.BytesIO()
+    print_schema(schema, stream, minified)
+    size = len(stream.getvalue())
+
+    with open(os.devnull, 'wb') as devnull:
+        seconds = timeit(
+            lambda: print_schema(schema, devnull, minified), number=number
+        ) / number
+    return size, seconds
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--shape', action='append', choices=SHAPES,
+        help='shapes to run, all that parse by default'
+    )
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--number', type=int, default=3)
+    options = options.parse_args()
+
+    print(f'{"shape":<14} {"minified":>8} {"MB":>7} {"ms":>8} {"MB/s":>7}')
+    for shape in options.shape or list(SHAPES):
+        if not SHAPES[shape].parses:
+            continue
+        text = generate(options.size, shape)
+        schema = Schema.match(Parser(GraphQLLexer(text, scanner=True)))
+        for minified in (False, True):
+            size, seconds = measure(schema, minified, options.number)
+            print(
+                f'{shape:<14} {str(minified):>8} {size / 1e6:>7.2f}'
+                f' {seconds * 1e3:>8.1f} {size / 1e6 / seconds:>7.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+'''
+Times every phase of the parse pipeline on generated schemas and
+reports tokens and definitions per second.
+'''
+import argparse
+import json
+import platform
+import sys
+import time
+from time import perf_counter
+
+import gqlp
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.ignore_tokens import IgnoreTokens
+from gqlp.parser import Parser
+from gqlp.terminals import Comment, NewLine
+
+from .generate import SHAPES, generate
+
+
+def _best(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        seconds = perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def _match(tokens):
+    parser = Parser(tokens)
+    start = perf_counter()
+    schema = Schema.match(parser)
+    return perf_counter() - start, schema
+
+
+def measure(text, repeat=3, scanner=True, parses=True, skip=False):
+    if skip:
+        # The lexer drops NewLine and Comment itself
+        lex, tokens = _best(
+            lambda: list(GraphQLLexer(text, ignore=Parser.IGNORED)), repeat
+        )
+        ignore, significant = 0.0, tokens
+    else:
+        lex, tokens = _best(
+            lambda: list(GraphQLLexer(text, scanner=scanner)), repeat
+        )
+        ignore, significant = _best(
+            lambda: list(IgnoreTokens(tokens, [NewLine, Comment])), repeat
+        )
+
+    phases = {'lex': lex, 'ignore': ignore}
+    definitions = 0
+    if parses:
+        runs = [_match(significant) for _ in range(repeat)]
+        phases['match'] = min(seconds for seconds, _ in runs)
+        definitions = len(runs[0][1]._types)
+
+    total = sum(phases.values())
+    return {
+        'bytes': len(text.encode('utf-8')),
+        'tokens': len(tokens),
+        'definitions': definitions,
+        'seconds': phases,
+        'tokens_per_second': len(tokens) / total,
+        'definitions_per_second': definitions / total,
+    }
+
+
+def run(shapes, size, repeat=3, scanner=True, skip=False):
+    return {
+        'gqlp': gqlp.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'size': size,
+        'scanner': scanner,
+        'skip': skip,
+        'shapes': {
+            shape: measure(
+                generate(size, shape), repeat, scanner,
+                SHAPES[shape].parses, skip
+            )
+            for shape in shapes
+        },
+    }
+
+
+def report(results, baseline=None, file=sys.stdout):
+    header = (
+        f'{"shape":<14} {"tokens":>9} {"lex ms":>9} {"ignore ms":>10}'
+        f' {"match ms":>9} {"tokens/s":>11} {"defs/s":>9}'
+    )
+    if baseline:
+        header += f' {"vs base":>8}'
+    print(header, file=file)
+
+    for shape, result in results['shapes'].items():
+        seconds = result['seconds']
+        match = seconds.get('match')
+        match = f'{match * 1e3:.1f}' if match is not None else '-'
+        line = (
+            f'{shape:<14} {result["tokens"]:>9}'
+            f' {seconds["lex"] * 1e3:>9.1f}'
+            f' {seconds["ignore"] * 1e3:>10.1f}'
+            f' {match:>9}'
+            f' {result["tokens_per_second"]:>11.0f}'
+            f' {result["definitions_per_second"]:>9.0f}'
+        )
+        before = (baseline or {}).get('shapes', {}).get(shape)
+        if before:
+            speedup = result['tokens_per_second'] / before['tokens_per_second']
+            line += f' {speedup:>7.2f}x'
+        print(line, file=file)
+
+
+def main():
+    options = argparse.ArgumentParser(description=__doc__)
+    options.add_argument(
+        '--shape', action='append', choices=SHAPES,
+        help='shapes to run, all by default'
+    )
+    options.add_argument('--size', type=int, default=1000)
+    options.add_argument('--repeat', type=int, default=3)
+    options.add_argument(
+        '--reference', action='store_true',
+        help='use the character by character Lexer instead of the Scanner'
+    )
+    options.add_argument(
+        '--skip', action='store_true',
+        help='let the lexer skip newlines and comments'
+    )
+    options.add_argument('--output', help='write the results as JSON')
+    options.add_argument('--compare', help='JSON results to compare with')
+    options = options.parse_args()
+
+    results = run(
+        options.shape or list(SHAPES), options.size,
+        options.repeat, not options.reference, options.skip
+    )
+
+    baseline = None
+    if options.compare:
+        with open(options.compare) as file:
+            baseline = json.load(file)
+
+    report(results, baseline)
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
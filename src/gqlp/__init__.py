@@ -1,10 +1,87 @@
+from collections import Counter
+
 from .lexer import Lexer
+from .scanner import Scanner
+from .source import is_binary, mapped, open_schema
 from .terminals import *
+from .token_table import TokenTable
+
+__version__ = '0.1.0'
 
 
 class GraphQLLexer(Lexer):
-    def __init__(self, graqhql_schema: str):
-        grammar = Terminals(
+    '''
+    Lexes a schema given as text, as bytes, memoryview or mmap,
+    or as a path to a file, which is mapped into memory. Binary
+    schemas are always lexed by the Scanner. The mapping of a path
+    is closed once all tokens are lexed, unless trivia or a table
+    still need it; close does so at any time.
+
+    Token kinds in ignore, e.g. NewLine and Comment, are skipped by
+    the Scanner without making tokens for them. With trivia=True,
+    skipped comments are kept in the trivia side table.
+
+    With invalid=True, a character that starts no token is lexed as
+    an Invalid token instead of raising UnexpectedCharacter. Parser
+    asks for these tokens with lex(invalid=True), so that it can
+    report the error where it parses.
+    '''
+
+    def __init__(
+        self,
+        graqhql_schema,
+        scanner: bool = False,
+        metrics=None,
+        ignore=(),
+        trivia: bool = False,
+        invalid: bool = False
+    ):
+        opened = open_schema(graqhql_schema)
+        self._mapping = None
+        if opened is not graqhql_schema and mapped(opened):
+            self._mapping = opened
+        graqhql_schema = opened
+        grammar = self.terminals()
+        super().__init__(graqhql_schema, grammar, invalid)
+        self._metrics = metrics
+        self.ignored = tuple(ignore)
+        if scanner or ignore or is_binary(graqhql_schema):
+            self._scanner = Scanner(
+                graqhql_schema, grammar, ignore=ignore, trivia=trivia
+            )
+        else:
+            self._scanner = None
+
+    def close(self):
+        '''
+        Closes the mapping of a schema given as a path. Tokens keep
+        their values and positions, tables and trivia can no longer
+        be read.
+        '''
+        if self._mapping is not None:
+            # Positions of tokens lexed so far still resolve after this
+            self._scanner._lines.build()
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _scan(self, invalid):
+        yield from self._scanner.lex(invalid)
+        if self.trivia is None:
+            self.close()
+
+    @property
+    def trivia(self):
+        return self._scanner and self._scanner.trivia
+
+    @staticmethod
+    def terminals():
+        return Terminals(
             Eof=Eof,
             NewLine=NewLine,
             Whitespace=Whitespace,
@@ -25,4 +102,29 @@ class GraphQLLexer(Lexer):
                 RightSquareBracket
             ]
         )
-        super().__init__(graqhql_schema, grammar)
+
+    def table(self):
+        metrics = self._metrics
+        if not metrics:
+            return TokenTable.scan(
+                self._schema, self._terminals, self.ignored, self.invalid,
+                self.trivia is not None
+            )
+
+        with metrics.phase('lex'):
+            table = TokenTable.scan(
+                self._schema, self._terminals, self.ignored, self.invalid,
+                self.trivia is not None
+            )
+        for id_, count in Counter(table._ids).items():
+            metrics.tokens[table._kinds[id_].__name__] += count
+        return table
+
+    def lex(self, invalid: bool = False):
+        if self._scanner:
+            tokens = self._scan(invalid)
+        else:
+            tokens = super().lex(invalid)
+        if self._metrics:
+            return self._metrics.lexed(tokens)
+        return tokens
@@ -0,0 +1,77 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from . import GraphQLLexer
+from .gql import Schema
+from .parser import Parser
+
+
+SUFFIXES = ('.graphql', '.gql')
+
+
+class FileResult(object):
+    def __init__(self, path, schema=None, error=None, seconds=0.0):
+        self.path = path
+        self.schema = schema
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else self.error
+        return f'<FileResult: {self.path} {status} {self.seconds:.3f}s>'
+
+
+def parse_file(path):
+    start = perf_counter()
+    try:
+        with GraphQLLexer(Path(path), scanner=True) as lexer:
+            schema = Schema.match(Parser(lexer))
+    except Exception as e:
+        # Exceptions are reported as text, most of ours cannot
+        # be unpickled in the parent process.
+        error = f'{type(e).__name__}: {e}'
+        return FileResult(path, error=error, seconds=perf_counter() - start)
+    return FileResult(path, schema, seconds=perf_counter() - start)
+
+
+def expand(inputs):
+    '''
+    Turns files, directories and glob patterns into a sorted list
+    of schema files. Directories are searched recursively.
+    '''
+    paths = []
+    for input_ in inputs:
+        input_ = str(input_)
+        if os.path.isdir(input_):
+            paths.extend(sorted(
+                str(path) for path in Path(input_).rglob('*')
+                if path.suffix in SUFFIXES and path.is_file()
+            ))
+        elif glob.has_magic(input_):
+            paths.extend(sorted(glob.glob(input_, recursive=True)))
+        else:
+            paths.append(input_)
+    return paths
+
+
+def parse_files(paths, jobs: int = None):
+    '''
+    Parses many schema files in a process pool. Results are
+    returned in the order of paths. jobs=1 parses in this process,
+    jobs=None uses one process per core.
+    '''
+    paths = list(paths)
+    if jobs == 1 or len(paths) < 2:
+        return [parse_file(path) for path in paths]
+
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(parse_file, paths, chunksize=chunksize))
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from . import GraphQLLexer, __version__
+from .gql import Schema
+from .parser import Parser
+
+
+class ParseCache(object):
+    '''
+    Keeps parsed schemas on disk, keyed by a hash of the schema
+    text and the gqlp version. Entries that cannot be loaded are
+    dropped and parsed again. When the entries grow beyond
+    max_bytes, the least recently used ones are removed.
+    '''
+    SUFFIX = '.schema'
+
+    def __init__(self, directory, max_bytes: int = 256 * 2 ** 20):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    @staticmethod
+    def key(graqhql_schema: str):
+        digest = hashlib.sha256(__version__.encode())
+        digest.update(b'\0')
+        digest.update(graqhql_schema.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self._directory / f'{key}{self.SUFFIX}'
+
+    def schema(self, graqhql_schema: str):
+        key = self.key(graqhql_schema)
+        schema = self._load(key)
+        if schema is not None:
+            self.hits += 1
+            return schema
+
+        self.misses += 1
+        schema = self._parse(graqhql_schema)
+        self._store(key, schema)
+        return schema
+
+    @staticmethod
+    def _parse(graqhql_schema):
+        lexer = GraphQLLexer(graqhql_schema, scanner=True)
+        return Schema.match(Parser(lexer))
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                version, schema = pickle.load(file)
+        except FileNotFoundError:
+            return
+        except Exception:
+            self._remove(path)
+            return
+
+        if version != __version__ or not isinstance(schema, Schema):
+            self._remove(path)
+            return
+
+        # Loading counts as a use for the eviction order. Another
+        # worker may have evicted the entry since, the schema is
+        # loaded all the same.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return schema
+
+    def _store(self, key, schema):
+        '''
+        Writes an entry. The cache is only an optimization, so an
+        entry that cannot be written, e.g. on a full disk or for a
+        schema too deep to pickle, is dropped.
+        '''
+        temporary = None
+        try:
+            descriptor, temporary = tempfile.mkstemp(
+                dir=self._directory, suffix='.tmp'
+            )
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(
+                    (__version__, schema), file, pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(temporary, self._path(key))
+        except Exception:
+            if temporary is not None:
+                self._remove(Path(temporary))
+            return
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self._directory.glob(f'*{self.SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_bytes:
+                break
+            self._remove(path)
+            size -= entry_size
+            self.evictions += 1
+
+    @staticmethod
+    def _remove(path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
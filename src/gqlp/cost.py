@@ -0,0 +1,144 @@
+from .gql import *
+from .validation import named_type
+
+
+class Analysis(object):
+    '''
+    The result of a cost analysis. paths maps the dotted path of
+    every selected field to its cost. If a limit was exceeded, the
+    walk stopped early and the numbers only cover what was seen.
+    '''
+
+    def __init__(self):
+        self.depth = 0
+        self.fields = 0
+        self.cost = 0
+        self.paths = {}
+        self.exceeded = False
+
+    def __repr__(self):
+        exceeded = ' exceeded' if self.exceeded else ''
+        return (
+            f'<Analysis depth={self.depth} fields={self.fields}'
+            f' cost={self.cost}{exceeded}>'
+        )
+
+
+class CostTable(object):
+    '''
+    Estimates how expensive a query is. Every selected field costs
+    as many units as objects it is expected to return: a List or
+    NonNullableList field multiplies the cost of itself and of
+    everything below it by its factor, one factor per level of
+    nesting. Factors can be set per field as 'Type.field', all
+    other lists use default_factor.
+
+    The factors of a type's fields are computed from the schema's
+    index the first time a query selects the type, and kept until
+    the schema's version changes. Create one table per schema and
+    reuse it.
+    '''
+
+    def __init__(
+        self,
+        schema,
+        default_factor: int = 10,
+        factors: dict = None,
+        root: str = 'Query'
+    ):
+        self._schema = schema
+        self._default_factor = default_factor
+        self._factors = factors or {}
+        self._root = root
+        self._version = schema.version
+        # type name -> field name -> (named type, factor)
+        self._fields = {}
+
+    def _fields_of(self, type_name):
+        fields = self._fields.get(type_name)
+        if fields is not None:
+            return fields
+
+        fields = self._fields[type_name] = {}
+        if isinstance(self._schema.type(type_name), Input):
+            return fields
+        for name, field in self._schema.fields(type_name).items():
+            factor = self._factors.get(f'{type_name}.{name}')
+            if factor is None:
+                factor = 1
+                type_ = field._type
+                while isinstance(type_, List):
+                    factor *= self._default_factor
+                    type_ = type_._type
+            fields[name] = named_type(field._type), factor
+        return fields
+
+    def _field(self, type_name, name):
+        return self._fields_of(type_name).get(str(name), (None, 1))
+
+    def analyze(self, query, max_cost=None, max_depth=None):
+        '''
+        Walks query, a Query or QueryDocument, once. Stops as soon
+        as max_cost or max_depth is exceeded.
+        '''
+        if self._version != self._schema.version:
+            self._version = self._schema.version
+            self._fields = {}
+
+        document = query
+        if isinstance(query, Query):
+            document = query._document
+
+        analysis = Analysis()
+        signature = document._signature
+        type_name, factor = self._field(self._root, signature._name)
+        name = str(signature._name)
+
+        stack = []
+        if self._count(analysis, name, factor, 1, max_cost, max_depth):
+            stack.append(
+                (type_name, factor, name, 1, iter(document._document))
+            )
+
+        while stack:
+            parent, multiplier, path, depth, items = stack[-1]
+            field = None
+            for item in items:
+                if isinstance(item, (list, tuple)):
+                    if field is None:
+                        continue
+                    stack.append((*field, depth + 1, iter(item)))
+                    break
+
+                type_name, factor = self._field(parent, item)
+                cost = multiplier * factor
+                field_path = f'{path}.{item}'
+                if not self._count(
+                    analysis, field_path, cost, depth + 1,
+                    max_cost, max_depth
+                ):
+                    return analysis
+                field = type_name, cost, field_path
+            else:
+                stack.pop()
+
+        return analysis
+
+    @staticmethod
+    def _count(analysis, path, cost, depth, max_cost, max_depth):
+        analysis.fields += 1
+        analysis.cost += cost
+        analysis.paths[path] = analysis.paths.get(path, 0) + cost
+        analysis.depth = max(analysis.depth, depth)
+
+        if (
+            max_cost is not None and analysis.cost > max_cost
+            or max_depth is not None and analysis.depth > max_depth
+        ):
+            analysis.exceeded = True
+            return False
+        return True
+
+
+def analyze(schema, query, **limits):
+    return CostTable(schema).analyze(query, **limits)
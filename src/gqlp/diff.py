@@ -0,0 +1,225 @@
+import zlib
+from hashlib import blake2b
+from weakref import WeakKeyDictionary
+
+from .gql import *
+from .printer import Printer
+
+
+TYPE_ADDED = 'type added'
+TYPE_REMOVED = 'type removed'
+TYPE_CHANGED = 'type changed'
+FIELD_ADDED = 'field added'
+FIELD_REMOVED = 'field removed'
+FIELD_TYPE_CHANGED = 'field type changed'
+NULLABILITY_CHANGED = 'nullability changed'
+ARGUMENT_CHANGED = 'argument changed'
+ENUM_VALUE_ADDED = 'enum value added'
+ENUM_VALUE_REMOVED = 'enum value removed'
+
+# schema -> (version, Hashes)
+_hashes = WeakKeyDictionary()
+
+
+def _digest(*parts):
+    digest = blake2b(digest_size=16)
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8')
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.digest()
+
+
+class Change(object):
+    def __init__(self, kind, path, old=None, new=None):
+        self.kind = kind
+        self.path = path
+        self.old = old
+        self.new = new
+
+    def __eq__(self, other):
+        return isinstance(other, Change) and (
+            (self.kind, self.path, self.old, self.new)
+            == (other.kind, other.path, other.old, other.new)
+        )
+
+    def __repr__(self):
+        change = ''
+        if self.old is not None or self.new is not None:
+            change = f': {self.old} -> {self.new}'
+        return f'<{self.kind} {self.path}{change}>'
+
+
+class Hashes(object):
+    '''
+    Structural hashes of the Type, Input and Enum definitions of a
+    schema, built bottom up: fields from their type references and
+    arguments, definitions from their fields, buckets from the
+    definitions whose names fall into them, and the root from the
+    buckets. Hashes only depend on the structure, so two schemas
+    parsed from different text, or in different processes, compare
+    equal when they define the same types.
+
+    Queries are not hashed.
+    '''
+    BUCKETS = 256
+
+    def __init__(self, schema, buckets: int = BUCKETS):
+        self._buckets = buckets
+        # name -> (kind, parent)
+        self.headers = {}
+        # name -> hash
+        self.types = {}
+        # name -> field or enum value name -> (hash, type reference, argument)
+        self.fields = {}
+        self.members = [[] for _ in range(buckets)]
+
+        for definition in schema._types:
+            if isinstance(definition, (Type, Enum)):
+                self._add(definition)
+
+        self.buckets = [
+            _digest(*(
+                part for name in sorted(members)
+                for part in (name, self.types[name])
+            ))
+            for members in self.members
+        ]
+        self.root = _digest(*self.buckets)
+
+    def bucket(self, name):
+        return zlib.crc32(name.encode('utf-8')) % self._buckets
+
+    def _add(self, definition):
+        name = str(definition._name)
+        header, fields, hash_ = _structure(definition)
+        self.headers[name] = header
+        self.fields[name] = fields
+        self.types[name] = hash_
+        self.members[self.bucket(name)].append(name)
+
+
+def _field(field):
+    reference = Printer.type_reference(
+        field._type, isinstance(field, NonNullableField)
+    )
+    argument = field._argument
+    if argument is not None:
+        argument = (
+            f'{argument._name}: '
+            f'{Printer.type_reference(argument._type)}'
+            f' = {argument._default_value}'
+        )
+    return _digest(field._name, reference, argument), reference, argument
+
+
+def _structure(definition):
+    '''
+    The header, (kind, parent), the fields by name and the hash of a
+    Type, Input or Enum. Reordering fields or enum values leaves the
+    hash as it is.
+    '''
+    if isinstance(definition, Enum):
+        header = 'enum', None
+        # Values have no structure below their name
+        fields = {str(item): (b'', None, None) for item in definition}
+    else:
+        kind = 'input' if isinstance(definition, Input) else 'type'
+        parent = str(definition._parent) if definition._parent else None
+        header = kind, parent
+        fields = {str(field._name): _field(field) for field in definition}
+
+    # Fields are compared by name, so their order does not count
+    hash_ = _digest(
+        *header, *(
+            part for field in sorted(fields)
+            for part in (field, fields[field][0])
+        )
+    )
+    return header, fields, hash_
+
+
+def definition_hash(definition):
+    '''
+    The structural hash of a Type, Input or Enum, the same for equal
+    definitions from different schemas.
+    '''
+    return _structure(definition)[2]
+
+
+def hashes(schema):
+    '''
+    The Hashes of schema, built once per schema and version.
+    '''
+    cached = _hashes.get(schema)
+    if cached is None or cached[0] != schema.version:
+        cached = _hashes[schema] = schema.version, Hashes(schema)
+    return cached[1]
+
+
+def diff(old, new):
+    '''
+    Changes between two schemas. Compares the root hashes, and only
+    descends into the buckets, definitions and fields whose hashes
+    differ.
+    '''
+    old, new = hashes(old), hashes(new)
+    if old.root == new.root:
+        return []
+
+    changes = []
+    for bucket, (before, after) in enumerate(zip(old.buckets, new.buckets)):
+        if before == after:
+            continue
+        names = set(old.members[bucket]) | set(new.members[bucket])
+        for name in sorted(names):
+            _diff_definition(old, new, name, changes)
+    return changes
+
+
+def _diff_definition(old, new, name, changes):
+    before, after = old.types.get(name), new.types.get(name)
+    if before == after:
+        return
+    if before is None:
+        changes.append(Change(TYPE_ADDED, name))
+        return
+    if after is None:
+        changes.append(Change(TYPE_REMOVED, name))
+        return
+
+    header, new_header = old.headers[name], new.headers[name]
+    if header != new_header:
+        changes.append(Change(TYPE_CHANGED, name, header, new_header))
+        if header[0] != new_header[0]:
+            return
+
+    enum = header[0] == 'enum'
+    fields, new_fields = old.fields[name], new.fields[name]
+    for field, (hash_, reference, argument) in fields.items():
+        path = f'{name}.{field}'
+        if field not in new_fields:
+            changes.append(
+                Change(ENUM_VALUE_REMOVED if enum else FIELD_REMOVED, path)
+            )
+            continue
+
+        new_hash, new_reference, new_argument = new_fields[field]
+        if hash_ == new_hash:
+            continue
+        if reference != new_reference:
+            kind = FIELD_TYPE_CHANGED
+            if reference.replace('!', '') == new_reference.replace('!', ''):
+                kind = NULLABILITY_CHANGED
+            changes.append(Change(kind, path, reference, new_reference))
+        if argument != new_argument:
+            changes.append(
+                Change(ARGUMENT_CHANGED, path, argument, new_argument)
+            )
+
+    for field in new_fields:
+        if field not in fields:
+            changes.append(Change(
+                ENUM_VALUE_ADDED if enum else FIELD_ADDED, f'{name}.{field}'
+            ))
@@ -1,3 +1,6 @@
+from collections import defaultdict
+
+from .parser import KeywordExpected, EndOfStream, UnexpectedToken
 from .terminals import *
 
 
@@ -13,17 +16,21 @@ class BasicTypeExpected(Exception):
 
 
 class Argument(object):
+    __slots__ = ('_name', '_type', '_default_value', '_target')
+
     def __init__(self, name, type, default_value):
         self._name = name
         self._type = type
         self._default_value = default_value
+        # Set by the linker
+        self._target = None
 
     @classmethod
     def match(cls, parser):
         parser.match(LeftBracket)
         name = parser.match(Name)
         parser.match(Colon)
-        type_ = parser.match(Name)
+        type_ = shared(parser.match(Name))
 
         default_value = None
         if parser.peek(Equals):
@@ -40,6 +47,8 @@ class Argument(object):
 
 
 class Entity(object):
+    __slots__ = ()
+
     def __str__(self):
         return f'{self._name}'
 
@@ -47,19 +56,64 @@ class Entity(object):
         return f'<Type: {self._name}>'
 
 
+class Scalar(Entity):
+    __slots__ = ('_name',)
+    NAMES = ('String', 'Int', 'Float', 'Boolean', 'ID')
+
+    def __init__(self, name):
+        self._name = name
+
+    def __repr__(self):
+        return f'<Scalar: {self._name}>'
+
+
+SCALARS = {name: Scalar(name) for name in Scalar.NAMES}
+
+# References to the built-in scalars are by far the most common
+# leaves, so they all share one Name per scalar. These carry no
+# position.
+SCALAR_NAMES = {name: Name(name) for name in Scalar.NAMES}
+
+
+def shared(name):
+    return SCALAR_NAMES.get(name._value, name)
+
+
 class FieldType:
+    '''
+    A Name, wrapped in any number of Lists. The opening brackets
+    are counted on the way in and the Lists are built on the way
+    out, so deep nesting needs no recursion.
+    '''
     @classmethod
     def match(cls, parser):
-        if parser.peek(LeftSquareBracket):
-            return List.match(parser)
-        return parser.match(Name)
+        depth = 0
+        while parser.peek(LeftSquareBracket):
+            parser.match(LeftSquareBracket)
+            depth += 1
+
+        type_ = shared(parser.match(Name))
+
+        for _ in range(depth):
+            if parser.peek(ExclamationMark):
+                parser.match(ExclamationMark)
+                parser.match(RightSquareBracket)
+                type_ = NonNullableList(type_)
+            else:
+                parser.match(RightSquareBracket)
+                type_ = List(type_)
+        return type_
 
 
 class Field(Entity):
+    __slots__ = ('_name', '_type', '_argument', '_target')
+
     def __init__(self, name: Name, type: Name, argument: Argument = None):
         self._name = name
         self._type = type
         self._argument = argument
+        # Set by the linker
+        self._target = None
 
     def __repr__(self):
         return f'<{self._name}: {self._type}>'
@@ -92,33 +146,39 @@ class Field(Entity):
 
 
 class List(object):
+    __slots__ = ('_type', '_target')
+
     def __init__(self, type):
         self._type = type
+        # Set by the linker
+        self._target = None
 
     def __repr__(self):
-        return f'<List:{self._type}>'
+        # Written level by level, so deep lists need no recursion
+        opening = []
+        type_ = self
+        while isinstance(type_, List):
+            opening.append(
+                '<List!: ' if isinstance(type_, NonNullableList)
+                else '<List:'
+            )
+            type_ = type_._type
+        return ''.join(opening) + str(type_) + '>' * len(opening)
 
     @classmethod
     def match(cls, parser):
-        parser.match(LeftSquareBracket)
-
-        type_ = FieldType.match(parser)
-
-        if parser.peek(ExclamationMark):
-            parser.match(ExclamationMark)
-            parser.match(RightSquareBracket)
-            return NonNullableList(type_)
-
-        parser.match(RightSquareBracket)
-        return List(type_)
+        if not parser.peek(LeftSquareBracket):
+            parser.raise_unexpected_token(LeftSquareBracket)
+        return FieldType.match(parser)
 
 
 class NonNullableList(List):
-    def __repr__(self):
-        return f'<List!: {self._type}>'
+    __slots__ = ()
 
 
 class NonNullableField(Field):
+    __slots__ = ()
+
     def __repr__(self):
         return f'<{self._name}: {self._type}!>'
 
@@ -139,10 +199,14 @@ class FieldList:
 
 
 class Type(Entity):
+    __slots__ = ('_name', '_fields', '_parent', '_parent_target')
+
     def __init__(self, name, fields, parent=None):
         self._name = name
         self._fields = fields
         self._parent = parent
+        # Set by the linker
+        self._parent_target = None
 
     def __repr__(self):
         t = self.__class__.__name__
@@ -162,8 +226,6 @@ class Type(Entity):
             parser.match_keyword('implements')
             parent = parser.match(Name)
 
-        # Todo: Remove
-        parser._complex_types.append(name.__str__())
         return cls(
             name=name,
             fields=FieldList.match(parser),
@@ -172,6 +234,8 @@ class Type(Entity):
 
 
 class Input(Type):
+    __slots__ = ()
+
     @classmethod
     def match(cls, parser):
         parser.match_keyword('input')
@@ -182,8 +246,6 @@ class Input(Type):
             parser.match_keyword('implements')
             parent = parser.match(Name)
 
-        # Todo: Remove
-        parser._complex_types.append(name.__str__())
         return cls(
             name=name,
             fields=FieldList.match(parser),
@@ -192,6 +254,8 @@ class Input(Type):
 
 
 class Enum(object):
+    __slots__ = ('_name', '_items', '_fields')
+
     def __init__(self, name, items):
         self._name = name
         self._items = self._fields = items
@@ -223,14 +287,143 @@ class Enum(object):
 
 
 class Schema(object):
+    '''
+    Keeps the definitions in order and indexes them by name. Use
+    add, add_field and remove to change a schema, so that the
+    indexes stay in sync. Each change counts up version, which
+    tells caches built from the schema that they are stale.
+
+    A name that is defined more than once is indexed to its first
+    definition, until that one is removed.
+    '''
+
     def __init__(self, types):
         self._types = types
+        self._index()
+
+    def __getstate__(self):
+        return {'_types': self._types}
+
+    def __setstate__(self, state):
+        self._types = state['_types']
+        self._index()
+
+    @property
+    def version(self):
+        return self._version
+
+    def _index(self):
+        self._version = 0
+        self._types_by_name = {}
+        self._fields_by_name = {}
+        self._enum_values = {}
+        self._implementors = defaultdict(list)
+        self._duplicates = defaultdict(list)
+        for definition in self._types:
+            self._add_to_index(definition)
+
+    def _add_to_index(self, definition):
+        name = str(definition._name)
+        if isinstance(definition, (Type, Enum)) and (
+            name in self._types_by_name
+        ):
+            # The first definition of a name stays indexed, later
+            # ones take its place when it is removed.
+            self._duplicates[name].append(definition)
+        else:
+            self._index_definition(definition)
+
+    def _index_definition(self, definition):
+        name = str(definition._name)
+        if isinstance(definition, Enum):
+            self._types_by_name[name] = definition
+            self._enum_values[name] = {str(item) for item in definition}
+        elif isinstance(definition, Type):
+            self._types_by_name[name] = definition
+            self._fields_by_name[name] = {
+                str(field._name): field for field in definition
+            }
+            if definition._parent:
+                self._implementors[str(definition._parent)].append(
+                    definition
+                )
+
+    def _remove_from_index(self, definition):
+        name = str(definition._name)
+        duplicates = self._duplicates.get(name)
+        if self._types_by_name.get(name) is not definition:
+            if duplicates and definition in duplicates:
+                duplicates.remove(definition)
+            return
+
+        del self._types_by_name[name]
+        self._fields_by_name.pop(name, None)
+        self._enum_values.pop(name, None)
+        if getattr(definition, '_parent', None):
+            implementors = self._implementors[str(definition._parent)]
+            if definition in implementors:
+                implementors.remove(definition)
+        if duplicates:
+            self._index_definition(duplicates.pop(0))
+
+    def type(self, name):
+        return self._types_by_name.get(name)
+
+    def fields(self, type_name):
+        return self._fields_by_name.get(type_name, {})
+
+    def field(self, type_name, field_name):
+        return self.fields(type_name).get(field_name)
+
+    def enum_values(self, name):
+        return self._enum_values.get(name, set())
+
+    def implementors(self, interface):
+        return list(self._implementors.get(interface, ()))
+
+    def duplicates(self, name):
+        '''
+        Definitions of name after the first one, which type returns.
+        '''
+        return list(self._duplicates.get(name, ()))
+
+    def add(self, definition):
+        self._types.append(definition)
+        self._add_to_index(definition)
+        self._version += 1
+
+    def add_field(self, type_name, field):
+        fields = self._fields_by_name[type_name]
+        self._types_by_name[type_name]._fields.append(field)
+        fields[str(field._name)] = field
+        self._version += 1
+
+    def replace(self, start, stop, definitions):
+        '''
+        Puts definitions in the place of _types[start:stop], for
+        callers that keep the definitions in the order of the text.
+        '''
+        for definition in self._types[start:stop]:
+            self._remove_from_index(definition)
+        self._types[start:stop] = definitions
+        for definition in definitions:
+            self._add_to_index(definition)
+        self._version += 1
+
+    def remove(self, name):
+        definition = self._types_by_name[name]
+        self._types.remove(definition)
+        self._remove_from_index(definition)
+        self._version += 1
+        return definition
 
     @classmethod
     def _match_object(cls, keyword, TypeWeasel, parser):
         if parser.peek_keyword(keyword):
             return TypeWeasel.match(parser)
 
+    KEYWORDS = ('type', 'enum', 'query', 'input')
+
     @classmethod
     def _match_type_weasel(cls, parser):
         WEASEL = {
@@ -248,13 +441,57 @@ class Schema(object):
         parser.raise_unexpected_token(expected="type, enum, query, input")
 
     @classmethod
-    def match(cls, parser):
+    def match(cls, parser, metrics=None):
+        metrics = metrics or parser._metrics
+        if not metrics:
+            return cls._match(parser)
+
+        with metrics.phase('match'):
+            schema = cls._match(parser, metrics)
+        metrics.buffer(parser.buffered())
+        metrics.report()
+        return schema
+
+    @classmethod
+    def recover(cls, parser, metrics=None):
+        '''
+        Parses like match, but does not stop at the first error. A
+        definition with an error is left out, its error is recorded
+        and parsing goes on behind it. Characters that start no
+        token are errors of the definition they are found in. Returns
+        the schema of the definitions that parsed and the list of
+        errors.
+        '''
+        metrics = metrics or parser._metrics
+        errors = []
+        if not metrics:
+            return cls._match(parser, errors=errors), errors
+
+        with metrics.phase('match'):
+            schema = cls._match(parser, metrics, errors)
+        metrics.buffer(parser.buffered())
+        metrics.report()
+        return schema, errors
+
+    @classmethod
+    def _match(cls, parser, metrics=None, errors=None):
         types = []
 
         parser.consume()
         while not parser.peek(Eof):
 
-            type_weasel = cls._match_type_weasel(parser)
+            start = parser._index
+            try:
+                type_weasel = cls._match_type_weasel(parser)
+            except RECOVERABLE as error:
+                if errors is None:
+                    raise
+                errors.append(error)
+                cls._synchronize(parser, start)
+                continue
+
+            if metrics:
+                metrics.definition(type_weasel)
 
             types.append(
                 type_weasel
@@ -264,8 +501,129 @@ class Schema(object):
             types=types
         )
 
+    @classmethod
+    def _depth(cls, parser, start):
+        '''
+        Number of curly brackets opened and not closed between
+        start and the current token, or None if those tokens have
+        left a streaming parser's window.
+        '''
+        depth = 0
+        try:
+            for index in range(start, parser._index):
+                token = parser._tokens[index]
+                if isinstance(token, LeftCurlyBracket):
+                    depth += 1
+                elif isinstance(token, RightCurlyBracket):
+                    depth -= 1
+        except IndexError:
+            return
+        return depth
+
+    @classmethod
+    def _synchronize(cls, parser, start):
+        '''
+        Skips the rest of a broken definition: up to the curly
+        bracket that closes it, or up to the next keyword that
+        starts a definition outside of any brackets. If the depth
+        is not known, a keyword right after a closing bracket, or
+        at the start, counts as outside.
+        '''
+        depth = cls._depth(parser, start)
+        previous = None
+        if parser._index > start:
+            previous = type(parser._tokens[parser._index - 1])
+
+        while not parser.peek(Eof):
+            token = parser.token()
+            outside = depth == 0 or (
+                depth is None and previous is RightCurlyBracket
+            )
+            if (
+                outside
+                and parser._index > start
+                and isinstance(token, Name)
+                and str(token) in cls.KEYWORDS
+            ):
+                return
+
+            parser.consume()
+            previous = type(token)
+            if depth is None:
+                continue
+            if isinstance(token, LeftCurlyBracket):
+                depth += 1
+            elif isinstance(token, RightCurlyBracket):
+                depth -= 1
+                if depth <= 0:
+                    return
+
+
+RECOVERABLE = (
+    UnexpectedToken, KeywordExpected, BasicTypeExpected, EndOfStream,
+    Terminals.UnexpectedCharacter
+)
+
+
+class Frozen(AttributeError):
+    def __init__(self, node):
+        super().__init__(f'{type(node).__name__} is frozen')
+
+
+class Freezable(object):
+    '''
+    A node that can be made read-only, so that it can be shared.
+    Lists below it become tuples and setting attributes raises
+    Frozen.
+    '''
+    __slots__ = ('_frozen',)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise Frozen(self)
+        super().__setattr__(name, value)
+
+    def freeze(self):
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                value = getattr(self, name, None)
+                object.__setattr__(self, name, _freeze(value))
+        object.__setattr__(self, '_frozen', True)
+        return self
+
+
+def _freeze(value):
+    '''
+    Turns value into tuples all the way down. The lists that are
+    still being frozen are kept on a stack, so deeply nested
+    selections need no recursion.
+    '''
+    if isinstance(value, Freezable):
+        return value.freeze()
+    if not isinstance(value, (list, tuple)):
+        return value
+
+    frozen = []
+    stack = [(iter(value), frozen)]
+    while stack:
+        items, done = stack[-1]
+        for item in items:
+            if isinstance(item, (list, tuple)):
+                stack.append((iter(item), []))
+                break
+            if isinstance(item, Freezable):
+                item = item.freeze()
+            done.append(item)
+        else:
+            stack.pop()
+            if stack:
+                stack[-1][1].append(tuple(done))
+    return tuple(frozen)
+
+
+class Query(Freezable):
+    __slots__ = ('_name', '_arguments', '_document')
 
-class Query(object):
     def __init__(self, name, arguments, document):
         self._name = name
         self._arguments = arguments
@@ -291,7 +649,17 @@ class Query(object):
         )
 
 
-class QueryDocumentSignature(object):
+class QueryDocumentSignature(Freezable):
+    __slots__ = ('_name', '_argument', '_variable')
+
+    def __init__(self, name, argument, variable):
+        self._name = name
+        self._argument = argument
+        self._variable = variable
+
+    def __repr__(self):
+        return f'<{self._name}({self._argument}: ${self._variable})>'
+
     @classmethod
     def match(cls, parser):
 
@@ -300,42 +668,53 @@ class QueryDocumentSignature(object):
         parser.match(LeftBracket)
 
         # TBD: More than one param
-        name = parser.match(Name)
+        argument = parser.match(Name)
         parser.match(Colon)
         parser.match(Dollar)
-        variable_name = parser.match(Name)
+        variable = parser.match(Name)
 
         parser.match(RightBracket)
 
+        return QueryDocumentSignature(name, argument, variable)
+
 
 class QueryProjectionList(object):
+    '''
+    The names of the selected fields. A field with a selection of
+    its own is followed by the list of that selection. The lists
+    that are still open are kept on a stack rather than in nested
+    calls.
+    '''
     @classmethod
     def match(cls, parser):
 
         parser.match(LeftCurlyBracket)
 
-        fields = []
-        fields.append(parser.match(Name))
-
-        while not parser.peek(RightCurlyBracket):
-
-            if parser.peek(RightCurlyBracket):
-                break
-
+        projection = []
+        open_ = [projection]
+        while True:
+            fields = open_[-1]
             fields.append(
                 parser.match(Name)
             )
 
             if parser.peek(LeftCurlyBracket):
-                fields.append(
-                    parser.match_query_projection()
-                )
+                parser.match(LeftCurlyBracket)
+                nested = []
+                fields.append(nested)
+                open_.append(nested)
+                continue
 
-        parser.match(RightCurlyBracket)
-        return fields
+            while parser.peek(RightCurlyBracket):
+                parser.match(RightCurlyBracket)
+                open_.pop()
+                if not open_:
+                    return projection
 
 
-class QueryDocument(object):
+class QueryDocument(Freezable):
+    __slots__ = ('_signature', '_document')
+
     def __init__(self, signature, document):
         self._signature = signature
         self._document = document
@@ -354,12 +733,18 @@ class QueryDocument(object):
         )
 
 
-class QueryArgument(object):
+class QueryArgument(Freezable):
+    __slots__ = (
+        '_name', '_type', '_required', '_default_value', '_target'
+    )
+
     def __init__(self, name, type, required, default_value):
         self._name = name
         self._type = type
         self._required = required
         self._default_value = default_value
+        # Set by the linker
+        self._target = None
 
     @classmethod
     def match(cls, parser):
@@ -368,7 +753,7 @@ class QueryArgument(object):
         parser.match(Dollar)
         name = parser.match(Name)
         parser.match(Colon)
-        type_ = parser.match(Name)
+        type_ = shared(parser.match(Name))
 
         required = False
         if parser.peek(ExclamationMark):
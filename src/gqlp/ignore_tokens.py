@@ -10,6 +10,9 @@ class IgnoreTokens(object):
             isinstance(token, TokenType) for TokenType in self._tokens
         )
 
+    def table(self):
+        return self._lexer.without(self._tokens)
+
     def __iter__(self):
         for token in self._lexer:
             if self._should_drop(token):
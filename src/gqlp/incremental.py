@@ -0,0 +1,284 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from . import GraphQLLexer
+from .gql import Schema
+from .lines import LineIndex
+from .parser import Parser
+from .scanner import Scanner
+from .terminals import *
+
+
+class Definition(object):
+    '''
+    A top-level Type, Input, Enum or Query together with the
+    span of text it was parsed from. The span reaches up to the
+    first token of the next definition.
+
+    Definitions in front of the document's gap store their start
+    relative to the beginning of the text, those behind it relative
+    to the end. Edits at the gap therefore move every following
+    definition without touching it. The tokens of a definition are
+    located relative to its start, so they move along.
+    '''
+
+    def __init__(self, document, node, start, length):
+        self._document = document
+        self._node = node
+        self._start = start
+        self._length = length
+        self._tail = False
+
+    @property
+    def node(self):
+        return self._node
+
+    @property
+    def start(self):
+        if self._tail:
+            return self._start + len(self._document._text)
+        return self._start
+
+    @property
+    def end(self):
+        return self.start + self._length
+
+    def _attach_to_end(self):
+        self._start = self.start - len(self._document._text)
+        self._tail = True
+
+    def _attach_to_start(self):
+        self._start = self.start
+        self._tail = False
+
+    def offset(self, offset):
+        return self.start + offset
+
+    def position(self, offset):
+        return self._document.lines().position(self.start + offset)
+
+    def line(self, offset):
+        return self.position(offset)[0]
+
+    def column(self, offset):
+        return self.position(offset)[1]
+
+    def __repr__(self):
+        return f'<Definition {self.start}:{self.end} {self._node!r}>'
+
+
+class EditableLineIndex(LineIndex):
+    '''
+    A LineIndex that follows the edits of a Document. Like its
+    definitions, line starts in front of the gap are stored from the
+    beginning of the text, those behind it as their distance to the
+    end, nearest first. An edit only moves the starts between the
+    gap and the edit, and adds the ones of the inserted text.
+    '''
+    NEWLINE = re.compile('\n')
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.build()
+        self._length = len(text)
+        self._tail = array('L')
+
+    def __getstate__(self):
+        starts = array('L', self._starts)
+        starts.extend(self._length - start for start in reversed(self._tail))
+        state = dict(self.__dict__)
+        state.update(_starts=starts, _tail=array('L'))
+        return state
+
+    def edit(self, offset, removed, inserted):
+        head, tail, length = self._starts, self._tail, self._length
+        while head[-1] > offset:
+            tail.append(length - head.pop())
+        while tail and length - tail[-1] <= offset:
+            head.append(length - tail.pop())
+
+        # Lines that started in the removed text
+        while tail and length - tail[-1] <= offset + removed:
+            tail.pop()
+        head.extend(
+            offset + newline.end()
+            for newline in self.NEWLINE.finditer(inserted)
+        )
+        self._length = length + len(inserted) - removed
+
+    def position(self, offset):
+        head, tail = self._starts, self._tail
+        if not tail or offset < self._length - tail[-1]:
+            line = bisect_right(head, offset)
+            start = head[line - 1]
+        else:
+            index = bisect_left(tail, self._length - offset)
+            line = len(head) + len(tail) - index
+            start = self._length - tail[index]
+        return line, offset - start + 1
+
+
+class Document(object):
+    '''
+    A parsed schema that can be edited. After an edit, only the
+    definitions whose text was touched are lexed and parsed again,
+    the others are reused as they are.
+    '''
+
+    def __init__(self, graqhql_schema: str):
+        self._text = graqhql_schema
+        self._lines = None
+        self._definitions = []
+        self._gap = 0
+        self._definitions, _ = self._parse(0)
+        self._gap = len(self._definitions)
+        self._schema = Schema(
+            types=[definition.node for definition in self._definitions]
+        )
+
+    @property
+    def text(self):
+        return self._text
+
+    @property
+    def definitions(self):
+        return list(self._definitions)
+
+    @property
+    def schema(self):
+        '''
+        The Schema of the document. Edits keep it up to date by
+        replacing the definitions they parsed again, it is not meant
+        to be changed otherwise.
+        '''
+        return self._schema
+
+    def lines(self):
+        if self._lines is None:
+            self._lines = EditableLineIndex(self._text)
+        return self._lines
+
+    def edit(self, offset: int, removed: int, inserted: str):
+        if not 0 <= offset <= offset + removed <= len(self._text):
+            raise IndexError(
+                f'Edit {offset}:{offset + removed} is outside of the text'
+            )
+
+        definitions = self._definitions
+        first = self._search(lambda definition: definition.end >= offset)
+        last = self._search(
+            lambda definition: definition.start > offset + removed
+        )
+
+        self._move_gap(last)
+        # Text in front of the first definition may be in the middle
+        # of a comment, so edits there are lexed from the beginning.
+        start = 0
+        if first < last and offset >= definitions[first].start:
+            start = definitions[first].start
+
+        text = self._text
+        self._text = text[:offset] + inserted + text[offset + removed:]
+        if self._lines is not None:
+            self._lines.edit(offset, removed, inserted)
+
+        try:
+            parsed, skipped = self._parse(
+                start, offset + len(inserted), last
+            )
+        except Exception:
+            self._text = text
+            if self._lines is not None:
+                self._lines.edit(
+                    offset, len(inserted), text[offset:offset + removed]
+                )
+            raise
+
+        definitions[first:last + skipped] = parsed
+        self._schema.replace(
+            first, last + skipped, [definition.node for definition in parsed]
+        )
+        self._gap = first + len(parsed)
+        return self
+
+    def _search(self, predicate, lo=0):
+        '''
+        Index of the first definition from lo on for which predicate
+        holds. Definitions are ordered, so predicate must be false for
+        a prefix of them and true for the rest.
+        '''
+        hi = len(self._definitions)
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if predicate(self._definitions[middle]):
+                hi = middle
+            else:
+                lo = middle + 1
+        return lo
+
+    def _move_gap(self, index):
+        definitions = self._definitions
+        while self._gap < index:
+            definitions[self._gap]._attach_to_start()
+            self._gap += 1
+        while self._gap > index:
+            self._gap -= 1
+            definitions[self._gap]._attach_to_end()
+
+    def _sync(self, offset, damage, following):
+        '''
+        Number of definitions behind the damaged region that were
+        skipped once the parser arrived at `offset`, or None if
+        offset is not the start of one of them.
+        '''
+        if offset < damage:
+            return
+
+        definitions = self._definitions
+        index = self._search(
+            lambda definition: definition.start >= offset, following
+        )
+        if index < len(definitions) and definitions[index].start == offset:
+            return index - following
+
+    def _parse(self, start, damage=None, following=None):
+        scanned = []
+
+        def tokens():
+            scanner = Scanner(self._text, GraphQLLexer.terminals(), start)
+            for token in scanner:
+                scanned.append(token)
+                yield token
+
+        parser = Parser(tokens(), stream=True)
+        parser.consume()
+
+        parsed = []
+        while not parser.peek(Eof):
+            begin = parser.token().offset
+            node = Schema._match_type_weasel(parser)
+            end = parser.token().offset
+
+            definition = Definition(self, node, begin, end - begin)
+            for token in self._take(scanned, end):
+                token.locate(token.offset - begin, definition)
+            parsed.append(definition)
+
+            if damage is not None and not parser.peek(Eof):
+                skipped = self._sync(end, damage, following)
+                if skipped is not None:
+                    return parsed, skipped
+
+        if damage is None:
+            return parsed, 0
+        return parsed, len(self._definitions) - following
+
+    @staticmethod
+    def _take(scanned, end):
+        count = 0
+        while count < len(scanned) and scanned[count].offset < end:
+            count += 1
+        taken = scanned[:count]
+        del scanned[:count]
+        return taken
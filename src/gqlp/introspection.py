@@ -0,0 +1,229 @@
+import json
+from weakref import WeakKeyDictionary
+
+from .gql import *
+
+
+ROOTS = {
+    'queryType': 'Query',
+    'mutationType': 'Mutation',
+    'subscriptionType': 'Subscription',
+}
+
+# schema -> (version, result, serialized)
+_results = WeakKeyDictionary()
+
+
+class Introspection(object):
+    '''
+    Builds the result of the standard introspection query for a
+    schema, i.e. what {"__schema": {...}} resolves to: all types
+    with their fields, arguments, input fields, enum values and
+    interfaces, and type references with their LIST and NON_NULL
+    wrappers.
+
+    gqlp has no interface keyword. A type that other types
+    implement is reported as an INTERFACE with its implementors as
+    possibleTypes. Names that no definition declares are reported
+    as scalars, like the built-in ones.
+    '''
+
+    def __init__(self, schema):
+        self._schema = schema
+        self._kinds = {name: 'SCALAR' for name in Scalar.NAMES}
+        for definition in schema._types:
+            name = str(definition._name)
+            if isinstance(definition, Enum):
+                self._kinds[name] = 'ENUM'
+            elif isinstance(definition, Input):
+                self._kinds[name] = 'INPUT_OBJECT'
+            elif isinstance(definition, Type):
+                self._kinds[name] = (
+                    'INTERFACE' if schema.implementors(name) else 'OBJECT'
+                )
+
+    def _kind(self, name):
+        return self._kinds.setdefault(name, 'SCALAR')
+
+    def _named(self, name):
+        return {'kind': self._kind(name), 'name': name, 'ofType': None}
+
+    def type_reference(self, type_, non_null=False):
+        '''
+        The reference to type_ with its wrappers, built from the
+        inside out. NonNullableList is a list of non-null items.
+        '''
+        wrappers = []
+        if non_null:
+            wrappers.append('NON_NULL')
+        while isinstance(type_, List):
+            wrappers.append('LIST')
+            if isinstance(type_, NonNullableList):
+                wrappers.append('NON_NULL')
+            type_ = type_._type
+
+        reference = self._named(str(type_))
+        for kind in reversed(wrappers):
+            reference = {'kind': kind, 'name': None, 'ofType': reference}
+        return reference
+
+    def _argument(self, argument):
+        default_value = argument._default_value
+        return {
+            'name': str(argument._name),
+            'description': None,
+            'type': self.type_reference(argument._type),
+            'defaultValue': None if default_value is None else str(
+                default_value
+            ),
+        }
+
+    def _field(self, field):
+        return {
+            'name': str(field._name),
+            'description': None,
+            'args': [self._argument(field._argument)]
+            if field._argument else [],
+            'type': self.type_reference(
+                field._type, isinstance(field, NonNullableField)
+            ),
+            'isDeprecated': False,
+            'deprecationReason': None,
+        }
+
+    def _input_field(self, field):
+        return {
+            'name': str(field._name),
+            'description': None,
+            'type': self.type_reference(
+                field._type, isinstance(field, NonNullableField)
+            ),
+            'defaultValue': None,
+        }
+
+    def _type(self, name, definition=None):
+        kind = self._kind(name)
+        result = {
+            'kind': kind,
+            'name': name,
+            'description': None,
+            'fields': None,
+            'inputFields': None,
+            'interfaces': None,
+            'enumValues': None,
+            'possibleTypes': None,
+        }
+
+        if kind in ('OBJECT', 'INTERFACE'):
+            result['fields'] = [self._field(field) for field in definition]
+            result['interfaces'] = []
+            if definition._parent:
+                result['interfaces'].append(
+                    self._named(str(definition._parent))
+                )
+        if kind == 'INTERFACE':
+            result['possibleTypes'] = [
+                self._named(str(implementor._name))
+                for implementor in self._schema.implementors(name)
+            ]
+        elif kind == 'INPUT_OBJECT':
+            result['inputFields'] = [
+                self._input_field(field) for field in definition
+            ]
+        elif kind == 'ENUM':
+            result['enumValues'] = [
+                {
+                    'name': str(item),
+                    'description': None,
+                    'isDeprecated': False,
+                    'deprecationReason': None,
+                }
+                for item in definition
+            ]
+        return result
+
+    def result(self):
+        schema = self._schema
+        types = [
+            self._type(str(definition._name), definition)
+            for definition in schema._types
+            if isinstance(definition, (Type, Enum))
+        ]
+        # Built-in and undeclared scalars, now that all references
+        # have been seen.
+        types += [
+            self._type(name) for name, kind in self._kinds.items()
+            if kind == 'SCALAR'
+        ]
+
+        result = {
+            root: {'name': name} if schema.type(name) else None
+            for root, name in ROOTS.items()
+        }
+        result['types'] = types
+        result['directives'] = []
+        return {'__schema': result}
+
+
+def _dumps(value):
+    '''
+    Compact JSON like json.dumps, written from a stack instead of
+    by recursion, for type references nested deeper than json.dumps
+    can go.
+    '''
+    parts = []
+    stack = [(False, value)]
+    while stack:
+        raw, item = stack.pop()
+        if raw:
+            parts.append(item)
+            continue
+
+        if isinstance(item, dict):
+            pieces = [(True, '{')]
+            for key, child in item.items():
+                if len(pieces) > 1:
+                    pieces.append((True, ','))
+                pieces += [(True, f'{json.dumps(key)}:'), (False, child)]
+            pieces.append((True, '}'))
+        elif isinstance(item, list):
+            pieces = [(True, '[')]
+            for child in item:
+                if len(pieces) > 1:
+                    pieces.append((True, ','))
+                pieces.append((False, child))
+            pieces.append((True, ']'))
+        else:
+            parts.append(json.dumps(item))
+            continue
+        stack.extend(reversed(pieces))
+    return ''.join(parts)
+
+
+def _cached(schema):
+    cached = _results.get(schema)
+    if cached is None or cached[0] != schema.version:
+        result = Introspection(schema).result()
+        try:
+            serialized = json.dumps({'data': result}, separators=(',', ':'))
+        except RecursionError:
+            serialized = _dumps({'data': result})
+        serialized = serialized.encode('utf-8')
+        cached = _results[schema] = schema.version, result, serialized
+    return cached
+
+
+def introspect(schema):
+    '''
+    The introspection result of schema. It is built once per schema
+    and version, callers share it and must not change it.
+    '''
+    return _cached(schema)[1]
+
+
+def introspect_json(schema):
+    '''
+    The introspection response for schema, {"data": ...}, as UTF-8
+    encoded JSON. Cached like introspect.
+    '''
+    return _cached(schema)[2]
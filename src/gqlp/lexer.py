@@ -1,20 +1,23 @@
-from .terminals import Terminals
+from .lines import LineIndex
+from .source import skip_byte_order_mark
+from .terminals import Invalid, Terminals
 
 
 class Lexer(object):
     class EndOfFile(Exception):
         pass
 
-    def __init__(self, graqhql_schema: str, terminals: Terminals):
+    def __init__(
+        self, graqhql_schema: str, terminals: Terminals, invalid=False
+    ):
+        self.invalid = invalid
         self._schema = graqhql_schema
         self._terminals = terminals
-        self._index = -1
-        self._lines = 0
-        self._column = 0
-        self._character = None
+        self._lines = LineIndex(graqhql_schema)
+        self._index = skip_byte_order_mark(graqhql_schema) - 1
 
     def position(self):
-        return self._lines + 1, self._column - 1
+        return self._lines.position(self._index)
 
     def character(self):
         try:
@@ -35,27 +38,42 @@ class Lexer(object):
         self._index -= 1
         return ''.join(buffer_)
 
-    def _increment_line(self):
-        self._lines += 1
-        self._column = 0
+    def consume_pattern(self, pattern):
+        '''
+        Consumes the match of pattern at the current character, if
+        any, and returns its text.
+        '''
+        found = pattern.match(self._schema, self._index)
+        if not found or not found.group():
+            return None
+        self._index = found.end() - 1
+        return found.group()
 
     def _consume(self):
-        self._column += 1
         self._index += 1
 
-    def _read(self):
+    def _read(self, invalid):
         while True:
             self._consume()
+            offset = self._index
             try:
                 token = self._terminals.match(self)
-                if token:
-                    yield token
-            except self._terminals.NewLine as e:
-                self._increment_line()
-                yield e.token
+            except Terminals.UnexpectedCharacter:
+                if not invalid:
+                    raise
+                token = Invalid(self.character())
+            if token:
+                yield token.locate(offset, self._lines)
 
-    def __iter__(self):
+    def lex(self, invalid: bool = False):
+        '''
+        The tokens, with invalid given for this pass instead of the
+        one the lexer was made with.
+        '''
         try:
-            yield from self._read()
+            yield from self._read(invalid)
         except self.EndOfFile:
-            yield self._terminals.eof()
+            yield self._terminals.eof().locate(self._index, self._lines)
+
+    def __iter__(self):
+        return self.lex(self.invalid)
@@ -0,0 +1,104 @@
+from array import array
+from bisect import bisect_right
+
+from .source import continuations, is_binary, newlines
+
+
+class LineIndex(object):
+    '''
+    Offsets at which the lines of a schema start. Built as far as
+    lookups need it, and turns a character offset into a 1-based
+    line and column. Scanners of mapped files build it as they go,
+    so that the pages they have passed can be released.
+
+    For binary schemas, offsets count bytes while columns still
+    count characters: the runs of UTF-8 continuation bytes are
+    recorded along with the line starts. Once built, the index lets
+    go of the schema, so that tokens do not keep it alive.
+    '''
+
+    # Lookups build the index this far ahead of the offset at once
+    CHUNK = 2 ** 20
+
+    def __init__(self, graqhql_schema: str):
+        self._schema = graqhql_schema
+        self._binary = graqhql_schema is not None and is_binary(
+            graqhql_schema
+        )
+        self._starts = None
+        self._built = 0
+        # Binary schemas: where the runs of continuation bytes start
+        # and end, and how many such bytes come before each run.
+        self._runs = self._ends = self._before = None
+
+    def build(self, end=None):
+        '''
+        Adds the line starts in front of end, all remaining ones by
+        default.
+        '''
+        schema = self._schema
+        if schema is None:
+            return
+        if self._starts is None:
+            # Four bytes per offset, unless the schema needs more
+            code = 'I' if len(schema) < 2 ** 32 else 'Q'
+            self._starts = array(code, [0])
+            if self._binary:
+                self._runs, self._ends = array(code), array(code)
+                self._before = array(code)
+
+        if end is None or end > len(schema):
+            end = len(schema)
+        if end > self._built:
+            self._starts.extend(
+                newline.end()
+                for newline in newlines(schema, self._built, end)
+            )
+            if self._binary:
+                self._add_runs(continuations(schema, self._built, end))
+            self._built = end
+        if self._built >= len(schema):
+            self._schema = None
+
+    def _add_runs(self, runs):
+        before = self._before
+        count = before[-1] + self._ends[-1] - self._runs[-1] if before else 0
+        for run in runs:
+            self._runs.append(run.start())
+            self._ends.append(run.end())
+            before.append(count)
+            count += run.end() - run.start()
+
+    def _continuations(self, offset):
+        '''
+        Number of continuation bytes in front of offset.
+        '''
+        run = bisect_right(self._runs, offset) - 1
+        if run < 0:
+            return 0
+        return self._before[run] + (
+            min(offset, self._ends[run]) - self._runs[run]
+        )
+
+    def __getstate__(self):
+        self.build()
+        return dict(self.__dict__)
+
+    def position(self, offset):
+        if self._schema is not None and offset >= self._built:
+            self.build(max(offset + 1, self._built + self.CHUNK))
+        line = bisect_right(self._starts, offset)
+        start = self._starts[line - 1]
+        column = offset - start + 1
+        if self._binary:
+            column -= self._continuations(offset) - self._continuations(start)
+        return line, column
+
+    def offset(self, offset):
+        return offset
+
+    def line(self, offset):
+        return self.position(offset)[0]
+
+    def column(self, offset):
+        return self.position(offset)[1]
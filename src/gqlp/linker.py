@@ -0,0 +1,77 @@
+from .gql import *
+
+
+class UnknownType(Exception):
+    def __init__(self, name):
+        self.name = name
+        message = f'Unknown type "{name}"'
+        if isinstance(name, Token):
+            message += f' in line {name.line}, column {name.column}'
+        super().__init__(f'{message}.')
+
+
+class LinkError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        message = '\n'.join(str(error) for error in errors)
+        super().__init__(f'{len(errors)} unknown types:\n{message}')
+
+
+class Linker(object):
+    '''
+    Resolves the type names used by fields, lists, arguments and
+    implements to the Type, Input, Enum or built-in Scalar they
+    refer to. Fields, lists and arguments get the named type at the
+    bottom of their wrappers as _target, types get _parent_target.
+    All unknown types are collected and raised together.
+    '''
+
+    def __init__(self, schema, scalars=SCALARS):
+        self._schema = schema
+        self._scalars = scalars
+        self._errors = []
+
+    def _resolve(self, name):
+        type_name = str(name)
+        target = self._schema.type(type_name) or self._scalars.get(type_name)
+        if target is None:
+            self._errors.append(UnknownType(name))
+        return target
+
+    def _link_type(self, node):
+        '''
+        Walks down the List wrappers of node, then sets the named
+        type on node and on every wrapper on the way.
+        '''
+        wrappers = [node]
+        type_ = node._type
+        while isinstance(type_, List):
+            wrappers.append(type_)
+            type_ = type_._type
+
+        target = self._resolve(type_)
+        for wrapper in wrappers:
+            wrapper._target = target
+
+    def _link_definition(self, definition):
+        if isinstance(definition, Type):
+            if definition._parent:
+                definition._parent_target = self._resolve(definition._parent)
+            for field in definition:
+                self._link_type(field)
+                if field._argument:
+                    self._link_type(field._argument)
+        elif isinstance(definition, Query):
+            if definition._arguments:
+                self._link_type(definition._arguments)
+
+    def link(self):
+        for definition in self._schema._types:
+            self._link_definition(definition)
+        if self._errors:
+            raise LinkError(self._errors)
+        return self._schema
+
+
+def link(schema):
+    return Linker(schema).link()
@@ -0,0 +1,496 @@
+import re
+from pathlib import Path
+
+from .gql import *
+from .parser import UnexpectedToken
+
+
+GRAMMAR = Path(__file__).with_name('schema.grammar')
+
+TOKEN_KINDS = {'NAME': Name, 'NUMBER': Number, 'STRING': String}
+
+PUNCTUATORS = {
+    Token.MATCH: Token for Token in (
+        Colon, Equals, Dollar, ExclamationMark, LeftBracket, RightBracket,
+        LeftCurlyBracket, RightCurlyBracket, LeftSquareBracket,
+        RightSquareBracket
+    )
+}
+
+
+class GrammarError(Exception):
+    pass
+
+
+class Terminal(object):
+    '''
+    A token kind, or a keyword. The key of a keyword is the keyword
+    itself, the key of a token kind is its class.
+    '''
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __repr__(self):
+        if isinstance(self.key, str):
+            return f"'{self.key}'"
+        return self.key.__name__
+
+
+class Nonterminal(object):
+    __slots__ = ('name', 'productions', 'row')
+
+    def __init__(self, name):
+        self.name = name
+        self.productions = []
+        # Set by the generator: terminal key -> Production
+        self.row = None
+
+    def __repr__(self):
+        return self.name
+
+
+class Production(object):
+    '''
+    expansion is what the driver pushes for the production: itself,
+    to build the value once its symbols are done, then its symbols
+    in reverse. A production that only passes the value of its one
+    symbol on leaves itself out.
+    '''
+    __slots__ = ('head', 'symbols', 'action', 'expansion')
+
+    def __init__(self, head, symbols, action):
+        self.head = head
+        self.symbols = tuple(symbols)
+        self.action = action
+        expansion = self.symbols[::-1]
+        if not (action is _first and len(self.symbols) == 1):
+            expansion = (self, *expansion)
+        self.expansion = expansion
+
+    def __repr__(self):
+        symbols = ' '.join(repr(symbol) for symbol in self.symbols)
+        return f'{self.head!r} = {symbols}'
+
+
+def _first(values):
+    return values[0]
+
+
+def _second(values):
+    return values[1]
+
+
+def _none(values):
+    return None
+
+
+def _new(values):
+    return []
+
+
+def _push(values):
+    # Lists are built back to front, so that every step appends
+    item, items = values
+    items.append(item)
+    return items
+
+
+def _reverse(values):
+    items = values[0]
+    items.reverse()
+    return items
+
+
+class Grammar(object):
+    '''
+    Productions read from a grammar description, see schema.grammar
+    for the notation. Repetitions and options are turned into
+    productions of their own.
+    '''
+    SYMBOL = re.compile(r"'([^']+)'|([A-Za-z_]\w*)([*+?]?)|\{(\w+)\}|(\|)")
+
+    def __init__(self, text: str, actions: dict):
+        self._actions = actions
+        self.nonterminals = {}
+        self.terminals = {}
+        self.start = None
+
+        head = None
+        for number, line in enumerate(text.splitlines(), 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            if '=' in line and not line.startswith('|'):
+                name, line = (part.strip() for part in line.split('=', 1))
+                head = self._nonterminal(name)
+                if self.start is None:
+                    self.start = head
+            elif head is None:
+                raise GrammarError(f'Line {number}: production expected')
+            else:
+                line = line[1:]
+            self._alternatives(head, line, number)
+
+        for nonterminal in self.nonterminals.values():
+            if not nonterminal.productions:
+                raise GrammarError(f'{nonterminal} has no productions')
+
+    @classmethod
+    def load(cls, path=GRAMMAR, actions=None):
+        return cls(Path(path).read_text(), actions or ACTIONS)
+
+    def _nonterminal(self, name):
+        if name not in self.nonterminals:
+            self.nonterminals[name] = Nonterminal(name)
+        return self.nonterminals[name]
+
+    def _terminal(self, key):
+        if key not in self.terminals:
+            self.terminals[key] = Terminal(key)
+        return self.terminals[key]
+
+    def _action(self, name, number):
+        if name not in self._actions:
+            raise GrammarError(f'Line {number}: unknown action "{name}"')
+        return self._actions[name]
+
+    def _alternatives(self, head, line, number):
+        symbols, action = [], None
+        position = 0
+        line = line.strip()
+        while position < len(line):
+            found = self.SYMBOL.match(line, position)
+            if not found:
+                raise GrammarError(
+                    f'Line {number}: cannot read "{line[position:]}"'
+                )
+            position = found.end()
+            while position < len(line) and line[position] == ' ':
+                position += 1
+
+            literal, name, suffix, action_name, bar = found.groups()
+            if bar:
+                self._add(head, symbols, action, number)
+                symbols, action = [], None
+            elif action_name:
+                action = self._action(action_name, number)
+            elif literal:
+                symbols.append(self._terminal(
+                    PUNCTUATORS.get(literal, literal)
+                ))
+            else:
+                symbols.append(self._symbol(name, suffix))
+        self._add(head, symbols, action, number)
+
+    def _add(self, head, symbols, action, number):
+        if action is None:
+            if len(symbols) != 1:
+                raise GrammarError(
+                    f'Line {number}: {head} needs an action'
+                )
+            action = _first
+        head.productions.append(Production(head, symbols, action))
+
+    def _symbol(self, name, suffix):
+        if name in TOKEN_KINDS:
+            symbol = self._terminal(TOKEN_KINDS[name])
+        else:
+            symbol = self._nonterminal(name)
+        if not suffix:
+            return symbol
+
+        wrapper = self._nonterminal(f'{name}{suffix}')
+        if wrapper.productions:
+            return wrapper
+
+        if suffix == '?':
+            wrapper.productions += [
+                Production(wrapper, [symbol], _first),
+                Production(wrapper, [], _none),
+            ]
+            return wrapper
+
+        reversed_ = self._nonterminal(f'{name}*~')
+        if not reversed_.productions:
+            reversed_.productions += [
+                Production(reversed_, [symbol, reversed_], _push),
+                Production(reversed_, [], _new),
+            ]
+        if suffix == '*':
+            wrapper.productions.append(
+                Production(wrapper, [reversed_], _reverse)
+            )
+        else:
+            first = self._nonterminal(f'{name}+~')
+            first.productions.append(
+                Production(first, [symbol, reversed_], _push)
+            )
+            wrapper.productions.append(
+                Production(wrapper, [first], _reverse)
+            )
+        return wrapper
+
+
+class Tables(object):
+    '''
+    LL(1) prediction tables for a grammar: for every nonterminal,
+    the production to use for each terminal that can come next.
+    Conflicts raise GrammarError.
+    '''
+
+    def __init__(self, grammar: Grammar):
+        self.grammar = grammar
+        self.keywords = {
+            key: key for key in grammar.terminals if isinstance(key, str)
+        }
+        self._nullable = set()
+        self._first = {}
+        self._follow = {}
+        self._first_sets()
+        self._follow_sets()
+        self._predict()
+
+    def _first_of(self, symbols):
+        '''
+        Terminal keys that can start symbols, and whether symbols
+        can be empty.
+        '''
+        first = set()
+        for symbol in symbols:
+            if isinstance(symbol, Terminal):
+                first.add(symbol.key)
+                return first, False
+            first |= self._first[symbol]
+            if symbol not in self._nullable:
+                return first, False
+        return first, True
+
+    def _first_sets(self):
+        nonterminals = self.grammar.nonterminals.values()
+        self._first = {nonterminal: set() for nonterminal in nonterminals}
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal in nonterminals:
+                for production in nonterminal.productions:
+                    first, nullable = self._first_of(production.symbols)
+                    if not first <= self._first[nonterminal]:
+                        self._first[nonterminal] |= first
+                        changed = True
+                    if nullable and nonterminal not in self._nullable:
+                        self._nullable.add(nonterminal)
+                        changed = True
+
+    def _follow_sets(self):
+        nonterminals = self.grammar.nonterminals.values()
+        self._follow = {nonterminal: set() for nonterminal in nonterminals}
+        self._follow[self.grammar.start].add(Eof)
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal in nonterminals:
+                for production in nonterminal.productions:
+                    symbols = production.symbols
+                    for index, symbol in enumerate(symbols):
+                        if isinstance(symbol, Terminal):
+                            continue
+                        follow, nullable = self._first_of(symbols[index + 1:])
+                        if nullable:
+                            follow |= self._follow[nonterminal]
+                        if not follow <= self._follow[symbol]:
+                            self._follow[symbol] |= follow
+                            changed = True
+
+    def _predict(self):
+        for nonterminal in self.grammar.nonterminals.values():
+            row = nonterminal.row = {}
+            for production in nonterminal.productions:
+                first, nullable = self._first_of(production.symbols)
+                if nullable:
+                    first |= self._follow[nonterminal]
+                for key in first:
+                    other = row.setdefault(key, production)
+                    if other is not production:
+                        raise GrammarError(
+                            f'{nonterminal} is not LL(1): {Terminal(key)!r}'
+                            f' predicts both "{other}" and "{production}"'
+                        )
+
+
+class Driver(object):
+    '''
+    Parses the tokens of a Parser by walking the prediction tables
+    with an explicit stack. Each expansion of a nonterminal is one
+    lookup of the next token in the nonterminal's row. A keyword
+    that the row does not expect is looked up as a Name.
+
+    Every production leaves the value its action built on a value
+    stack, terminals leave their token.
+    '''
+
+    def __init__(self, tables: Tables):
+        self._tables = tables
+
+    def parse(self, parser):
+        keywords = self._tables.keywords
+        start = self._tables.grammar.start
+        consume = parser.consume
+        next_token = parser.token
+
+        consume()
+        token = next_token()
+        kind = type(token)
+        key = keywords.get(token._value, Name) if kind is Name else kind
+
+        stack = [start]
+        values = []
+        while stack:
+            symbol = stack.pop()
+            type_ = type(symbol)
+
+            if type_ is Nonterminal:
+                row = symbol.row
+                production = row.get(key)
+                if production is None and kind is Name:
+                    production = row.get(Name)
+                if production is None:
+                    self._unexpected(token, row)
+                stack.extend(production.expansion)
+
+            elif type_ is Production:
+                count = len(symbol.symbols)
+                if count:
+                    arguments = values[-count:]
+                    del values[-count:]
+                else:
+                    arguments = ()
+                values.append(symbol.action(arguments))
+
+            else:
+                if symbol.key is not key and not (
+                    symbol.key is Name and kind is Name
+                ):
+                    self._unexpected(token, {symbol.key: None})
+                values.append(token)
+                consume()
+                token = next_token()
+                kind = type(token)
+                if kind is Name:
+                    key = keywords.get(token._value, Name)
+                else:
+                    key = kind
+
+        if kind is not Eof:
+            self._unexpected(token, {Eof: None})
+        return values[0]
+
+    @staticmethod
+    def _unexpected(token, row):
+        if isinstance(token, Invalid):
+            raise token.error()
+        expected = ', '.join(sorted(repr(Terminal(key)) for key in row))
+        raise UnexpectedToken(token, expected)
+
+
+def _schema(values):
+    return Schema(types=values[0])
+
+
+def _type(values):
+    _, name, parent, fields = values
+    return Type(name=name, fields=fields, parent=parent)
+
+
+def _input(values):
+    _, name, parent, fields = values
+    return Input(name=name, fields=fields, parent=parent)
+
+
+def _field(values):
+    name, argument, _, type_, non_nullable = values
+    Kind = NonNullableField if non_nullable else Field
+    return Kind(name=name, type=type_, argument=argument)
+
+
+def _argument(values):
+    _, name, _, type_, default_value, _ = values
+    return Argument(
+        name=name, type=shared(type_), default_value=default_value
+    )
+
+
+def _list(values):
+    _, type_, List_ = values
+    return List_(type_)
+
+
+def _enum(values):
+    _, name, _, items, _ = values
+    return Enum(name, items)
+
+
+def _query(values):
+    _, name, arguments, _, document, _ = values
+    return Query(name, arguments, document)
+
+
+def _query_argument(values):
+    _, _, name, _, type_, required, default_value, _ = values
+    return QueryArgument(
+        name=name,
+        type=shared(type_),
+        required=required is not None,
+        default_value=default_value
+    )
+
+
+def _signature(values):
+    name, _, argument, _, _, variable, _ = values
+    return QueryDocumentSignature(name, argument, variable)
+
+
+def _projection(values):
+    fields = []
+    for name, nested in values[1]:
+        fields.append(name)
+        if nested is not None:
+            fields.append(nested)
+    return fields
+
+
+ACTIONS = {
+    'first': _first,
+    'second': _second,
+    'schema': _schema,
+    'type': _type,
+    'input': _input,
+    'field': _field,
+    'argument': _argument,
+    'named_type': lambda values: shared(values[0]),
+    'list': _list,
+    'non_nullable_list': lambda values: NonNullableList,
+    'nullable_list': lambda values: List,
+    'enum': _enum,
+    'query': _query,
+    'query_argument': _query_argument,
+    'query_document': lambda values: QueryDocument(*values),
+    'signature': _signature,
+    'projection': _projection,
+    'selection': tuple,
+}
+
+
+_driver = None
+
+
+def parse(parser):
+    '''
+    Parses a schema like Schema.match does, with tables generated
+    from schema.grammar on first use.
+    '''
+    global _driver
+    if _driver is None:
+        _driver = Driver(Tables(Grammar.load()))
+    return _driver.parse(parser)
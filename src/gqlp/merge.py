@@ -0,0 +1,120 @@
+import io
+
+from .gql import *
+from .diff import definition_hash
+from .linker import Linker, UnknownType
+from .printer import Printer
+
+
+class ConflictingDefinition(Exception):
+    def __init__(self, name, first, second):
+        self.name = name
+        self.sources = first, second
+        super().__init__(
+            f'Conflicting definitions of "{name}" in {first} and {second}.'
+        )
+
+
+class UnresolvedReference(UnknownType):
+    def __init__(self, name, source):
+        self.name = name
+        self.source = source
+        message = f'Unknown type "{name}" in {source}'
+        if isinstance(name, Token):
+            message += f', line {name.line}, column {name.column}'
+        Exception.__init__(self, f'{message}.')
+
+
+class UnparsedFile(Exception):
+    def __init__(self, path, error):
+        self.path = path
+        self.error = error
+        super().__init__(f'{path} was not parsed: {error}')
+
+
+class Merger(object):
+    '''
+    Combines the definitions of many schemas into one. Definitions
+    are looked up by name: a repeated definition that is equal to
+    the first one, by its structural hash, is dropped, one that
+    differs is a conflict and the first one is kept. Once all
+    schemas are added, the merged schema is linked, so references
+    and implements may point into other files.
+
+    The merged schema takes over the definitions of the schemas that
+    were added.
+    '''
+
+    def __init__(self, scalars=SCALARS):
+        self._scalars = scalars
+        self._types = []
+        self._sources = []
+        # name -> (hash, source), types and queries are named apart
+        self._seen = {}
+        self._queries = {}
+        self.errors = []
+
+    def add(self, schema, source=None):
+        '''
+        Adds a Schema, or the FileResult of batch.parse_file. A
+        FileResult that holds an error is reported as UnparsedFile.
+        '''
+        if not isinstance(schema, Schema):
+            source = schema.path if source is None else source
+            if not schema.ok:
+                self.errors.append(UnparsedFile(source, schema.error))
+                return
+            schema = schema.schema
+
+        for definition in schema._types:
+            if isinstance(definition, Query):
+                seen, hash_ = self._queries, self._query_text(definition)
+            else:
+                seen, hash_ = self._seen, definition_hash(definition)
+
+            name = str(definition._name)
+            first = seen.get(name)
+            if first is None:
+                seen[name] = hash_, source
+                self._types.append(definition)
+                self._sources.append(source)
+            elif first[0] != hash_:
+                self.errors.append(
+                    ConflictingDefinition(name, first[1], source)
+                )
+
+    @staticmethod
+    def _query_text(query):
+        stream = io.StringIO()
+        printer = Printer(stream, minified=True)
+        printer.query(query)
+        printer.flush()
+        return stream.getvalue()
+
+    def schema(self):
+        '''
+        The merged and linked schema. Unknown types are added to
+        errors as UnresolvedReference, with the source that uses them.
+        '''
+        schema = Schema(self._types)
+        linker = Linker(schema, self._scalars)
+        for definition, source in zip(self._types, self._sources):
+            linker._errors = []
+            linker._link_definition(definition)
+            self.errors.extend(
+                UnresolvedReference(error.name, source)
+                for error in linker._errors
+            )
+        return schema
+
+
+def merge(schemas, scalars=SCALARS):
+    '''
+    Merges Schemas, or the results of batch.parse_files, into one
+    schema. Returns the schema and the list of errors. Plain schemas
+    are named by their position in schemas.
+    '''
+    merger = Merger(scalars)
+    for index, schema in enumerate(schemas):
+        merger.add(schema, index if isinstance(schema, Schema) else None)
+    return merger.schema(), merger.errors
@@ -0,0 +1,79 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Metrics(object):
+    '''
+    Collects timings and counts while a schema is lexed and parsed.
+    Pass the same instance to GraphQLLexer, Parser and Schema.match.
+
+    Phases nest: time spent lexing while the parser pulls tokens
+    counts towards "lex", not towards "ignore" or "match".
+    '''
+
+    def __init__(self, callback=None):
+        self.seconds = defaultdict(float)
+        self.tokens = Counter()
+        self.definitions = Counter()
+        self.peak_buffer = 0
+        self._callback = callback
+        self._phases = []
+        self._mark = None
+
+    def _switch(self):
+        now = perf_counter()
+        if self._phases:
+            self.seconds[self._phases[-1]] += now - self._mark
+        self._mark = now
+
+    def start(self, phase):
+        self._switch()
+        self._phases.append(phase)
+
+    def stop(self):
+        self._switch()
+        self._phases.pop()
+
+    @contextmanager
+    def phase(self, phase):
+        self.start(phase)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def timed(self, iterable, phase):
+        iterator = iter(iterable)
+        while True:
+            self.start(phase)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.stop()
+            yield item
+
+    def lexed(self, tokens):
+        for token in self.timed(tokens, 'lex'):
+            self.tokens[type(token).__name__] += 1
+            yield token
+
+    def definition(self, node):
+        self.definitions[type(node).__name__] += 1
+
+    def buffer(self, size):
+        self.peak_buffer = max(self.peak_buffer, size)
+
+    def as_dict(self):
+        return {
+            'seconds': dict(self.seconds),
+            'tokens': dict(self.tokens),
+            'definitions': dict(self.definitions),
+            'peak_buffer': self.peak_buffer,
+        }
+
+    def report(self):
+        if self._callback:
+            self._callback(self.as_dict())
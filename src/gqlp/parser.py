@@ -1,5 +1,9 @@
+from contextlib import nullcontext
+
 from .ignore_tokens import IgnoreTokens
 from .terminals import *
+from .token_stream import TokenStream
+from .token_table import TokenTable
 
 
 class KeywordExpected(Exception):
@@ -24,22 +28,32 @@ class UnexpectedToken(Exception):
         super().__init__(message)
 
 
-# def _match_data_type(self):
-#     basic_types = ("String", "Int", "Float", "Boolean", "ID")
-#     type_ = self._match(Name)
-#     typename = type_.__str__()
-#     if not ((typename in basic_types) or (typename in self._complex_types)):
-#         raise BasicTypeExpected(type_, basic_types)
-
 class EndOfStream(Exception):
     pass
 
 
 class Parser:
-    def __init__(self, tokens):
-        self._tokens = list(IgnoreTokens(tokens, [NewLine, Comment]))
+    IGNORED = (NewLine, Comment)
+
+    def __init__(self, tokens, stream: bool = False, metrics=None):
+        self._metrics = metrics
+        table = isinstance(tokens, TokenTable)
+        ignored = getattr(tokens, 'ignored', ())
+        # Characters that start no token become Invalid tokens, so
+        # that the error is raised where the parser gets to them.
+        if hasattr(tokens, 'lex'):
+            tokens = tokens.lex(invalid=True)
+        # Lexers that skip these already need no filtering
+        if not set(self.IGNORED) <= set(ignored):
+            tokens = IgnoreTokens(tokens, self.IGNORED)
+        if table:
+            with metrics.phase('ignore') if metrics else nullcontext():
+                self._tokens = tokens.table()
+        else:
+            if metrics:
+                tokens = metrics.timed(tokens, 'ignore')
+            self._tokens = TokenStream(tokens) if stream else list(tokens)
         self._index = -1
-        self._complex_types = []
 
     def token(self):
         try:
@@ -47,12 +61,17 @@ class Parser:
         except IndexError:
             raise EndOfStream()
 
+    def buffered(self):
+        if isinstance(self._tokens, TokenStream):
+            return self._tokens.buffered
+        return len(self._tokens)
+
     def consume(self):
         self._index += 1
 
     def match(self, Token):
         if not self.peek(Token):
-            raise UnexpectedToken(self.token(), Expected=Token)
+            raise self._unexpected(Token)
         token = self.token()
         self.consume()
         return token
@@ -76,4 +95,10 @@ class Parser:
         return ' '.join(token.__str__() for token in self._lexer)
 
     def raise_unexpected_token(self, expected):
-        raise UnexpectedToken(self.token(), expected)
+        raise self._unexpected(expected)
+
+    def _unexpected(self, expected):
+        token = self.token()
+        if isinstance(token, Invalid):
+            return token.error()
+        return UnexpectedToken(token, expected)
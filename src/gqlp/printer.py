@@ -0,0 +1,192 @@
+import io
+
+from .gql import *
+
+
+class Printer(object):
+    '''
+    Writes schemas back out as SDL to a text or binary stream. The
+    output is collected in a small buffer that is written whenever
+    it holds BUFFER characters, so memory use does not grow with
+    the schema. Minified output leaves out all whitespace that is
+    not needed to separate two names.
+    '''
+    BUFFER = 2 ** 16
+    INDENT = '  '
+
+    def __init__(self, stream, minified: bool = False, encoding='utf-8'):
+        self._stream = stream
+        self._binary = not isinstance(stream, io.TextIOBase)
+        self._encoding = encoding
+        self._minified = minified
+        self._pieces = []
+        self._size = 0
+
+        if minified:
+            self._space, self._newline, self._indent = '', '', ''
+        else:
+            self._space, self._newline, self._indent = ' ', '\n', self.INDENT
+
+    def _write(self, *pieces):
+        text = ''.join(pieces)
+        self._pieces.append(text)
+        self._size += len(text)
+        if self._size >= self.BUFFER:
+            self.flush()
+
+    def flush(self):
+        text = ''.join(self._pieces)
+        self._pieces.clear()
+        self._size = 0
+        if self._binary:
+            text = text.encode(self._encoding)
+        self._stream.write(text)
+
+    @staticmethod
+    def type_reference(type_, non_null=False):
+        '''
+        SDL for a field type, e.g. [[Int!]]!. The brackets are
+        counted on the way in, so deep lists need no recursion.
+        '''
+        closing = []
+        if type(type_) is Name:
+            return f'{type_}!' if non_null else str(type_)
+
+        while isinstance(type_, List):
+            non_null_items = isinstance(type_, NonNullableList)
+            closing.append('!]' if non_null_items else ']')
+            type_ = type_._type
+        closing.reverse()
+        opening = '[' * len(closing)
+        if non_null:
+            closing.append('!')
+        return opening + str(type_) + ''.join(closing)
+
+    def schema(self, schema):
+        first = True
+        for definition in schema._types:
+            if not first and not self._minified:
+                self._write('\n')
+            first = False
+            self.definition(definition)
+        if self._minified:
+            self._write('\n')
+        self.flush()
+
+    def definition(self, definition):
+        if isinstance(definition, Input):
+            self.type(definition, 'input')
+        elif isinstance(definition, Type):
+            self.type(definition, 'type')
+        elif isinstance(definition, Enum):
+            self.enum(definition)
+        elif isinstance(definition, Query):
+            self.query(definition)
+        else:
+            raise TypeError(f'Cannot print {definition!r}')
+
+    def _open(self, *header):
+        self._write(*header, self._space, '{', self._newline)
+
+    def _close(self, indent=''):
+        self._write(indent, '}', self._newline)
+
+    def type(self, type_, keyword='type'):
+        parent = ''
+        if type_._parent:
+            parent = f' implements {type_._parent}'
+        self._open(keyword, ' ', str(type_._name), parent)
+
+        separator = ' ' if self._minified else self._newline
+        self._write(separator.join(
+            f'{self._indent}{self.field(field)}' for field in type_
+        ), self._newline)
+        self._close()
+
+    def field(self, field):
+        '''
+        SDL for one field, e.g. friends(first: Int = 10): [Character].
+        '''
+        space = self._space
+        type_ = self.type_reference(
+            field._type, isinstance(field, NonNullableField)
+        )
+        argument = field._argument
+        if argument is None:
+            return f'{field._name}:{space}{type_}'
+
+        default = ''
+        if argument._default_value is not None:
+            default = f'{space}={space}{argument._default_value}'
+        return (
+            f'{field._name}({argument._name}:{space}'
+            f'{self.type_reference(argument._type)}{default}):{space}{type_}'
+        )
+
+    def enum(self, enum):
+        self._open('enum ', str(enum._name))
+        separator = ' ' if self._minified else self._newline
+        self._write(separator.join(
+            f'{self._indent}{item}' for item in enum
+        ), self._newline)
+        self._close()
+
+    def query(self, query):
+        arguments = query._arguments
+        required = '!' if arguments._required else ''
+        self._write(
+            'query ', str(query._name), '($', str(arguments._name), ':',
+            self._space, str(arguments._type), required
+        )
+        if arguments._default_value is not None:
+            self._write(
+                self._space, '=', self._space, str(arguments._default_value)
+            )
+        self._write(')')
+
+        document = query._document
+        signature = document._signature
+        self._open()
+        self._write(
+            self._indent, str(signature._name), '(',
+            str(signature._argument), ':', self._space, '$',
+            str(signature._variable), ')'
+        )
+        self.selection(document._document, 2)
+        self._close()
+
+    def selection(self, fields, depth=1):
+        '''
+        Writes a selection with its nested selections. The ones that
+        are still open are kept on a stack rather than in nested
+        calls.
+        '''
+        self._open()
+        after_name = False
+        stack = [(fields, 0, depth)]
+        while stack:
+            fields, index, depth = stack.pop()
+            indent = self._indent * depth
+            while index < len(fields):
+                if after_name and self._minified:
+                    self._write(' ')
+                self._write(indent, str(fields[index]))
+                after_name = True
+                index += 1
+
+                if index < len(fields) and isinstance(
+                    fields[index], (list, tuple)
+                ):
+                    self._open()
+                    after_name = False
+                    stack.append((fields, index + 1, depth))
+                    stack.append((fields[index], 0, depth + 1))
+                    break
+                self._write(self._newline)
+            else:
+                self._close(self._indent * (depth - 1))
+                after_name = False
+
+
+def print_schema(schema, stream, minified: bool = False):
+    Printer(stream, minified).schema(schema)
@@ -0,0 +1,143 @@
+import codecs
+from array import array
+
+from . import GraphQLLexer
+from .lines import LineIndex
+from .scanner import Scanner
+from .terminals import *
+
+
+class GrowingLineIndex(LineIndex):
+    '''
+    A LineIndex for text that arrives in pieces. Line starts are
+    added as the text is added.
+    '''
+
+    def __init__(self):
+        super().__init__(None)
+        self._starts = array('L', [0])
+
+    def add(self, text, offset):
+        start = text.find('\n')
+        while start != -1:
+            self._starts.append(offset + start + 1)
+            start = text.find('\n', start + 1)
+
+
+class PushLexer(object):
+    '''
+    Lexes a schema that arrives in chunks, as text or as UTF-8
+    bytes. feed returns the tokens that are complete so far. A
+    Name, Number, String or Comment that reaches the end of a chunk
+    might go on in the next one, so it is kept back until it ends
+    or close is called. close returns the remaining tokens and Eof.
+
+    Emits the same tokens as the Scanner. Offsets count characters,
+    also for byte chunks. With invalid=True, a character that starts
+    no token is emitted as an Invalid token instead of raising
+    UnexpectedCharacter.
+    '''
+
+    def __init__(self, terminals: Terminals = None, invalid: bool = False):
+        self.invalid = invalid
+        self._terminals = terminals or GraphQLLexer.terminals()
+        self._tokens = self._terminals.tokens()
+        self._pattern = Scanner.compile(self._tokens)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._lines = GrowingLineIndex()
+        self._pending = ''
+        self._offset = 0
+        self._started = False
+        self._closed = False
+
+    def feed(self, chunk):
+        if self._closed:
+            raise ValueError('Cannot feed a closed PushLexer')
+        if not isinstance(chunk, str):
+            chunk = self._decoder.decode(chunk)
+        return self._lex(chunk, final=False)
+
+    def close(self):
+        if self._closed:
+            return []
+        tokens = self._lex(self._decoder.decode(b'', final=True), final=True)
+        self._closed = True
+        end = self._offset + len(self._pending)
+        tokens.append(self._terminals.eof().locate(end, self._lines))
+        return tokens
+
+    def _lex(self, chunk, final):
+        if not self._started and chunk:
+            self._started = True
+            if chunk[0] == UnicodeByteOrderMark.MATCH:
+                chunk = chunk[1:]
+                self._offset += 1
+
+        self._lines.add(chunk, self._offset + len(self._pending))
+        text = self._pending + chunk
+        offset = self._offset
+        lines = self._lines
+        match = self._pattern.match
+        Whitespace = self._tokens[0]
+        tokens = [None, *self._tokens]
+
+        emitted = []
+        index = 0
+        end = len(text)
+        while index < end:
+            found = match(text, index)
+            if not found:
+                if index == end - 1 and not final and text[index] == '-':
+                    # Might start a number in the next chunk
+                    break
+                if not self.invalid:
+                    raise Terminals.UnexpectedCharacter(
+                        text[index], *lines.position(offset + index)
+                    )
+                emitted.append(
+                    Invalid(text[index], 0, 0, offset + index, lines)
+                )
+                index += 1
+                continue
+
+            Token = tokens[found.lastindex]
+            if (
+                not final
+                and issubclass(Token, CompoundToken)
+                and (
+                    found.end() == end
+                    or Token is Number and text[found.end():] == '.'
+                )
+            ):
+                # Might go on in the next chunk, a number also when
+                # only its dot is in this one
+                break
+
+            start = index
+            index = found.end()
+            if Token is Whitespace:
+                continue
+
+            emitted.append(Token(
+                Token.convert(found.group()), 0, 0, offset + start, lines
+            ))
+
+        self._pending = text[index:]
+        self._offset = offset + index
+        return emitted
+
+
+async def lex_stream(reader, size: int = 2 ** 16):
+    '''
+    Yields the tokens of a schema read from an asyncio.StreamReader
+    as they become complete.
+    '''
+    lexer = PushLexer()
+    while True:
+        chunk = await reader.read(size)
+        if not chunk:
+            break
+        for token in lexer.feed(chunk):
+            yield token
+    for token in lexer.close():
+        yield token
@@ -0,0 +1,117 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+from . import GraphQLLexer
+from .gql import Query
+from .parser import Parser
+from .terminals import *
+
+
+class QueryCache(object):
+    '''
+    Keeps the most recently used parsed queries in memory, keyed by
+    the query text or, with hashed=True, by a hash of it. When there
+    are more than capacity entries or they take up more than
+    max_bytes, the least recently used ones are evicted.
+
+    Cached queries are frozen, because every caller receives the
+    same instance.
+    '''
+    # Rough size of a parsed token in memory, including the node
+    # that refers to it.
+    TOKEN_BYTES = 200
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        max_bytes: int = None,
+        hashed: bool = False
+    ):
+        self._capacity = capacity
+        self._max_bytes = max_bytes
+        self._hashed = hashed
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, query: str):
+        return self.key(query) in self._entries
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def key(self, query: str):
+        if self._hashed:
+            return hashlib.sha256(
+                query.encode('utf-8', 'surrogatepass')
+            ).digest()
+        return query
+
+    def query(self, query: str):
+        key = self.key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Parsing happens outside of the lock. Two threads may parse
+        # the same text at once, the later one wins.
+        parsed, size = self._parse(query)
+        size += sys.getsizeof(key)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = parsed, size
+            self._bytes += size
+            self._evict()
+        return parsed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _parse(self, query):
+        lexer = GraphQLLexer(query, scanner=True)
+        parser = Parser(lexer)
+
+        parser.consume()
+        parsed = Query.match(parser)
+        if not parser.peek(Eof):
+            parser.raise_unexpected_token(Eof)
+        return parsed.freeze(), parser.buffered() * self.TOKEN_BYTES
+
+    def _evict(self):
+        entries = self._entries
+        while entries and (
+            len(entries) > self._capacity
+            or self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, (_, size) = entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
@@ -0,0 +1,137 @@
+import re
+
+from . import source
+from .lines import LineIndex
+from .terminals import Invalid, Terminals
+from .trivia import Trivia
+
+
+class Scanner(object):
+    '''
+    Lexes a schema with a single compiled pattern that is
+    assembled from the token classes known to the terminals.
+    Emits the same tokens as the Lexer does.
+
+    Binary schemas (bytes, memoryviews and mmaps) are matched as
+    they are, only token values are decoded.
+
+    Tokens of the kinds in ignore are skipped like whitespace,
+    without making tokens for them. With trivia=True, skipped
+    comments are recorded in the Trivia side table instead.
+
+    With invalid=True, a character that starts no token is emitted
+    as an Invalid token instead of raising UnexpectedCharacter.
+    '''
+    RELEASE = 16 * 2 ** 20
+
+    def __init__(
+        self,
+        graqhql_schema: str,
+        terminals: Terminals,
+        start=0,
+        ignore=(),
+        trivia: bool = False,
+        invalid: bool = False
+    ):
+        self.invalid = invalid
+        self._schema = graqhql_schema
+        self._start = start
+        self._terminals = terminals
+        self._lines = LineIndex(graqhql_schema)
+        self._tokens = terminals.tokens()
+
+        self._recorded = ()
+        self.trivia = None
+        if trivia:
+            self._recorded = tuple(
+                Token for Token in ignore if Token in Trivia.KINDS
+            )
+            self.trivia = Trivia(graqhql_schema, self._lines)
+        skip = [Token for Token in ignore if Token not in self._recorded]
+
+        self._pattern = self.compile(
+            self._tokens, source.is_binary(graqhql_schema), skip
+        )
+
+    @staticmethod
+    def compile(tokens, binary=False, skip=()):
+        '''
+        The kinds in skip are folded into the pattern of the first
+        token, Whitespace, so that a whole run of them is matched
+        and skipped at once.
+        '''
+        patterns = [Token.pattern() for Token in tokens]
+        if skip:
+            folded = '|'.join(
+                Token.pattern() for Token in (tokens[0], *skip)
+            )
+            patterns[0] = f'(?:{folded})+'
+        pattern = '|'.join(f'({pattern})' for pattern in patterns)
+        if binary:
+            pattern = pattern.encode('utf-8')
+        return re.compile(pattern)
+
+    def _read(self, invalid):
+        schema = self._schema
+        lines = self._lines
+        match = self._pattern.match
+        Whitespace = self._tokens[0]
+        tokens = [None, *self._tokens]
+        recorded = self._recorded
+        trivia = self.trivia
+
+        binary = source.is_binary(schema)
+        release = self.RELEASE if source.releasable(schema) else None
+
+        index = self._start or source.skip_byte_order_mark(schema)
+        end = len(schema)
+
+        while index < end:
+            found = match(schema, index)
+            if not found:
+                character = source.character(schema, index)
+                if not invalid:
+                    raise Terminals.UnexpectedCharacter(
+                        character, *lines.position(index)
+                    )
+                yield Invalid(character, 0, 0, index, lines)
+                index += source.width(schema, index)
+                continue
+
+            Token = tokens[found.lastindex]
+            start = index
+            index = found.end()
+
+            if Token is Whitespace:
+                continue
+            if Token in recorded:
+                trivia.add(start, index)
+                continue
+
+            value = found.group()
+            if binary:
+                value = str(value, 'utf-8')
+                if release and index > release:
+                    lines.build(start)
+                    source.release(schema, start)
+                    release += self.RELEASE
+
+            yield Token(Token.convert(value), 0, 0, start, lines)
+
+        if source.mapped(schema):
+            # The index is done while the end of the file is still in
+            # memory, after that it does not need the file any more.
+            lines.build()
+            if release:
+                source.release(schema, end)
+        yield self._terminals.eof().locate(end, lines)
+
+    def lex(self, invalid: bool = False):
+        '''
+        The tokens, with invalid given for this pass instead of the
+        one the scanner was made with.
+        '''
+        yield from self._read(invalid)
+
+    def __iter__(self):
+        return self.lex(self.invalid)
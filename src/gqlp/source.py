@@ -0,0 +1,101 @@
+import mmap
+import os
+import re
+
+from .terminals import UnicodeByteOrderMark
+
+
+NEWLINE = re.compile('\n')
+BINARY_NEWLINE = re.compile(b'\n')
+CONTINUATION = re.compile(b'[\x80-\xbf]+')
+
+
+def open_schema(schema):
+    '''
+    Maps schema files into memory, so they do not have to be read
+    and decoded as a whole. Text, bytes, memoryviews and mmaps are
+    passed through.
+    '''
+    if not isinstance(schema, os.PathLike):
+        return schema
+
+    with open(schema, 'rb') as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return file.read()
+
+
+def is_binary(schema):
+    return not isinstance(schema, str)
+
+
+def newlines(schema, start=0, end=None):
+    newline = BINARY_NEWLINE if is_binary(schema) else NEWLINE
+    return newline.finditer(schema, start, len(schema) if end is None else end)
+
+
+def continuations(schema, start=0, end=None):
+    '''
+    Runs of UTF-8 continuation bytes in a binary schema, i.e. of the
+    bytes that do not start a character.
+    '''
+    end = len(schema) if end is None else end
+    return CONTINUATION.finditer(schema, start, end)
+
+
+def skip_byte_order_mark(schema):
+    mark = UnicodeByteOrderMark.MATCH
+    if is_binary(schema):
+        mark = mark.encode('utf-8')
+    if schema[:len(mark)] == mark:
+        return len(mark)
+    return 0
+
+
+def decode(text):
+    if isinstance(text, str):
+        return text
+    return str(text, 'utf-8')
+
+
+def character(schema, index):
+    if not is_binary(schema):
+        return schema[index]
+    return bytes(schema[index:index + 4]).decode('utf-8', 'replace')[:1]
+
+
+def width(schema, index):
+    '''
+    Length of the character at index, in bytes for binary schemas.
+    A byte that cannot start a character counts as one.
+    '''
+    if not is_binary(schema):
+        return 1
+    lead = schema[index]
+    if lead >= 0xF0:
+        return 4
+    if lead >= 0xE0:
+        return 3
+    if lead >= 0xC0:
+        return 2
+    return 1
+
+
+def mapped(schema):
+    return isinstance(schema, mmap.mmap)
+
+
+def releasable(schema):
+    return mapped(schema) and hasattr(mmap, 'MADV_DONTNEED')
+
+
+def release(schema, end):
+    '''
+    Drops the pages of a mapped schema in front of end from memory.
+    They are read from the file again should they be needed.
+    '''
+    end -= end % mmap.PAGESIZE
+    if end:
+        schema.madvise(mmap.MADV_DONTNEED, 0, end)
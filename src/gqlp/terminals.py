@@ -1,12 +1,40 @@
+import re
 import string
+import sys
 
 
 class Token(object):
+    __slots__ = ('_value', '_line', '_column', '_offset', '_lines')
 
-    def __init__(self, value='', line=0, column=0):
+    def __init__(self, value='', line=0, column=0, offset=None, lines=None):
         self._value = value
-        self.line = line
-        self.column = column
+        self._line = line
+        self._column = column
+        self._offset = offset
+        self._lines = lines
+
+    def locate(self, offset, lines):
+        self._offset = offset
+        self._lines = lines
+        return self
+
+    @property
+    def offset(self):
+        if self._lines is None:
+            return self._offset
+        return self._lines.offset(self._offset)
+
+    @property
+    def line(self):
+        if self._lines is None:
+            return self._line
+        return self._lines.line(self._offset)
+
+    @property
+    def column(self):
+        if self._lines is None:
+            return self._column
+        return self._lines.column(self._offset)
 
     def __repr__(self):
         value = f': {self._value}' if self._value else ''
@@ -20,24 +48,37 @@ class Token(object):
     def test(cls, character):
         return character in cls.MATCH
 
+    @classmethod
+    def pattern(cls):
+        return f'[{re.escape(cls.MATCH)}]'
+
+    @classmethod
+    def convert(cls, value):
+        return ''
+
     @classmethod
     def match(cls, lexer):
         if not cls.test(lexer.character()):
             return
-        line, column = lexer.position()
-        return cls(line=line, column=column)
+        return cls()
 
     def __str__(self):
         return self.MATCH
 
 
 class CompoundToken(Token):
+    __slots__ = ()
     FIRST = ''
 
     @classmethod
     def test_first(cls, character):
         return character in (cls.FIRST or cls.MATCH)
 
+    @classmethod
+    def pattern(cls):
+        first = re.escape(cls.FIRST or cls.MATCH)
+        return f'[{first}][{re.escape(cls.MATCH)}]*'
+
     @classmethod
     def convert(cls, value):
         return value
@@ -47,16 +88,16 @@ class CompoundToken(Token):
         if not cls.test_first(lexer.character()):
             return
 
-        line, column = lexer.position()
         value = lexer.consume_while(cls.test)
         value = cls.convert(value)
-        return cls(value, line=line, column=column)
+        return cls(value)
 
     def __str__(self):
         return str(self._value)
 
 
 class Whitespace(CompoundToken):
+    __slots__ = ()
     MATCH = ' \t'
 
 
@@ -64,16 +105,31 @@ class Name(CompoundToken):
     '''
     Matches: [a-zA-Z][a-zA-Z0-9]+
     '''
+    __slots__ = ()
     FIRST = string.ascii_letters + '_'
     MATCH = string.digits + FIRST
 
+    @classmethod
+    def convert(cls, value):
+        # Names repeat a lot, interning lets them share one string.
+        return sys.intern(value)
+
 
 class Number(CompoundToken):
     '''
-    Matches [0-9]+(\..[0-9]+)
+    Matches -?[0-9]+(\\.[0-9]+)?
+
+    A number ends in front of anything else, so the second dot of
+    1.2.3 or a lone minus are characters that start no token.
     '''
+    __slots__ = ()
     FIRST = string.digits + '-'
     MATCH = string.digits + '.-'
+    PATTERN = re.compile(r'-?[0-9]+(?:\.[0-9]+)?')
+
+    @classmethod
+    def pattern(cls):
+        return cls.PATTERN.pattern
 
     @classmethod
     def convert(cls, value):
@@ -81,10 +137,28 @@ class Number(CompoundToken):
             return float(value)
         return int(value)
 
+    @classmethod
+    def match(cls, lexer):
+        if not cls.test_first(lexer.character()):
+            return
+
+        value = lexer.consume_pattern(cls.PATTERN)
+        if value:
+            return cls(cls.convert(value))
+
 
 class String(CompoundToken):
+    __slots__ = ()
     DOUBLE_QUOTE = '\"'
 
+    @classmethod
+    def pattern(cls):
+        return '"+[^"]*"*'
+
+    @classmethod
+    def convert(cls, value):
+        return value.strip(cls.DOUBLE_QUOTE).strip()
+
     @classmethod
     def match(cls, lexer):
         if not lexer.character() == cls.DOUBLE_QUOTE:
@@ -97,7 +171,6 @@ class String(CompoundToken):
         # while " -- " should not, and should actually break when
         # \n is encountered.
 
-        line, column = lexer.position()
         # Read all \"
         lexer.consume_while(lambda c: c == cls.DOUBLE_QUOTE)
         # Swallow newline character
@@ -105,90 +178,127 @@ class String(CompoundToken):
         # Read all text until \" is reached
         value = lexer.consume_while(lambda c: c != cls.DOUBLE_QUOTE)
         # Eat leftover \" characters
+        lexer._consume()
         lexer.consume_while(lambda c: c == cls.DOUBLE_QUOTE)
-        return cls(value.strip(), line, column)
+        return cls(value.strip())
 
     def __str__(self):
         return f'"{self._value}"'
 
 
 class Comment(CompoundToken):
+    __slots__ = ()
     HASH = '#'
 
+    @classmethod
+    def pattern(cls):
+        return '#[^\n]*'
+
+    @classmethod
+    def convert(cls, value):
+        return value[1:].strip()
+
     @classmethod
     def match(cls, lexer):
         if not lexer.character() == cls.HASH:
             return
 
-        line, column = lexer.position()
-
         # Swallow hash
         lexer._consume()
 
         value = lexer.consume_while(lambda c: c != '\n')
-        return cls(value.strip(), line, column)
+        return cls(value.strip())
 
 
 class Colon(Token):
+    __slots__ = ()
     MATCH = ':'
 
 
 class ExclamationMark(Token):
+    __slots__ = ()
     MATCH = '!'
 
 
 class Dollar(Token):
+    __slots__ = ()
     MATCH = '$'
 
 
 class NewLine(Token):
+    __slots__ = ()
     MATCH = '\n'
 
 
 class LeftSquareBracket(Token):
+    __slots__ = ()
     MATCH = '['
 
 
 class RightSquareBracket(Token):
+    __slots__ = ()
     MATCH = ']'
 
 
 class LeftBracket(Token):
+    __slots__ = ()
     MATCH = '('
 
 
 class RightBracket(Token):
+    __slots__ = ()
     MATCH = ')'
 
 
 class Equals(Token):
+    __slots__ = ()
     MATCH = '='
 
 
 class LeftCurlyBracket(Token):
+    __slots__ = ()
     MATCH = '{'
 
 
 class RightCurlyBracket(Token):
+    __slots__ = ()
     MATCH = '}'
 
 
 class Eof(Token):
+    __slots__ = ()
     def __str__(self):
         return '✔️'
 
 
+class Invalid(Token):
+    '''
+    A character that starts no token. Lexers with invalid=True emit
+    it instead of raising UnexpectedCharacter, so that lexing can go
+    on. The error is raised by whoever gets to the token.
+    '''
+    __slots__ = ()
+
+    @classmethod
+    def convert(cls, value):
+        return value
+
+    def error(self):
+        return Terminals.UnexpectedCharacter(
+            self._value, self.line, self.column
+        )
+
+    def __str__(self):
+        return self._value
+
+
 # Todo:
 class UnicodeByteOrderMark(Token):
+    __slots__ = ()
     MATCH = '\uFEFF'
 
 
 class Terminals(object):
-    class NewLine(Exception):
-        def __init__(self, token):
-            self.token = token
-            super().__init__(token)
-
     class UnexpectedCharacter(Exception):
         def __init__(self, character, line, column):
             self.character = character
@@ -206,12 +316,16 @@ class Terminals(object):
     def eof(self):
         return self._Eof()
 
+    def tokens(self):
+        return [self._Whitespace, self._NewLine, *self._terminals]
+
     def match(self, lexer):
         if self._Whitespace.match(lexer):
             return
 
-        if self._NewLine.match(lexer):
-            raise self.NewLine(self._NewLine())
+        token = self._NewLine.match(lexer)
+        if token:
+            return token
 
         for Token in self._terminals:
             token = Token.match(lexer)
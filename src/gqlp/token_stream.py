@@ -0,0 +1,52 @@
+from collections import deque
+
+
+class TokenStream(object):
+    '''
+    Indexable view over a token iterator that only keeps
+    the last few tokens in a ring buffer. Tokens are pulled
+    from the iterator as the parser advances.
+    '''
+    SIZE = 16
+
+    class Rewound(IndexError):
+        def __init__(self, index, start):
+            message = (
+                f'Token {index} has left the lookahead window,'
+                f' which starts at token {start}'
+            )
+            super().__init__(message)
+
+    def __init__(self, tokens, size=SIZE):
+        self._tokens = iter(tokens)
+        self._buffer = deque(maxlen=size)
+        self._start = 0
+
+    def __getitem__(self, index):
+        if index < self._start:
+            raise self.Rewound(index, self._start)
+
+        buffer_ = self._buffer
+        while index >= self._start + len(buffer_):
+            try:
+                token = next(self._tokens)
+            except StopIteration:
+                raise IndexError(index)
+            if len(buffer_) == buffer_.maxlen:
+                self._start += 1
+            buffer_.append(token)
+
+        return buffer_[index - self._start]
+
+    @property
+    def buffered(self):
+        return len(self._buffer)
+
+    def __iter__(self):
+        index = self._start
+        while True:
+            try:
+                yield self[index]
+            except IndexError:
+                return
+            index += 1
@@ -0,0 +1,155 @@
+from array import array
+
+from . import source
+from .lines import LineIndex
+from .scanner import Scanner
+from .terminals import Invalid, Terminals
+from .trivia import Trivia
+
+
+class TokenTable(object):
+    '''
+    Columnar token store. Each token is a kind id plus the
+    start and end offset of its text within the schema.
+    Values are only sliced from the schema when asked for.
+
+    Comments that were ignored with trivia=True are kept in the
+    trivia side table instead of being dropped.
+    '''
+
+    def __init__(
+        self, schema, kinds, ids, starts, ends, lines, trivia=None
+    ):
+        self.trivia = trivia
+        self._schema = schema
+        self._kinds = kinds
+        self._ids = ids
+        self._starts = starts
+        self._ends = ends
+        self._lines = lines
+        self._last = None
+
+    @classmethod
+    def scan(
+        cls, graqhql_schema: str, terminals: Terminals, ignore=(),
+        invalid: bool = False, trivia: bool = False
+    ):
+        '''
+        With invalid=True, characters that start no token are stored
+        as Invalid tokens instead of raising UnexpectedCharacter.
+        With trivia=True, ignored comments are recorded in the
+        table's trivia, as the Scanner does.
+        '''
+        tokens = terminals.tokens()
+        binary = source.is_binary(graqhql_schema)
+        lines = LineIndex(graqhql_schema)
+
+        recorded = ()
+        table_trivia = None
+        if trivia:
+            recorded = tuple(
+                Token for Token in ignore if Token in Trivia.KINDS
+            )
+            table_trivia = Trivia(graqhql_schema, lines)
+        skip = [Token for Token in ignore if Token not in recorded]
+        match = Scanner.compile(tokens, binary, skip).match
+        recorded = {tokens.index(Token) + 1 for Token in recorded}
+
+        ids = array('B')
+        starts = array('L')
+        ends = array('L')
+
+        WHITESPACE = 1
+        INVALID = len(tokens) + 1
+        index = source.skip_byte_order_mark(graqhql_schema)
+        end = len(graqhql_schema)
+
+        while index < end:
+            found = match(graqhql_schema, index)
+            if not found:
+                if not invalid:
+                    raise Terminals.UnexpectedCharacter(
+                        source.character(graqhql_schema, index),
+                        *lines.position(index)
+                    )
+                ids.append(INVALID)
+                starts.append(index)
+                index += source.width(graqhql_schema, index)
+                ends.append(index)
+                continue
+
+            id_ = found.lastindex
+            start = index
+            index = found.end()
+
+            if id_ == WHITESPACE:
+                continue
+            if id_ in recorded:
+                table_trivia.add(start, index)
+                continue
+
+            ids.append(id_ - 1)
+            starts.append(start)
+            ends.append(index)
+
+        ids.append(len(tokens))
+        starts.append(end)
+        ends.append(end)
+
+        return cls(
+            graqhql_schema, [*tokens, terminals._Eof, Invalid],
+            ids, starts, ends, lines, table_trivia
+        )
+
+    def __len__(self):
+        return len(self._ids)
+
+    def kind(self, index):
+        return self._kinds[self._ids[index]]
+
+    def text(self, index):
+        text = self._schema[self._starts[index]:self._ends[index]]
+        return source.decode(text)
+
+    def value(self, index):
+        return self.kind(index).convert(self.text(index))
+
+    def position(self, index):
+        return self._lines.position(self._starts[index])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._ids)
+
+        if self._last and self._last[0] == index:
+            return self._last[1]
+
+        Token = self.kind(index)
+        token = Token(
+            self.value(index), 0, 0, self._starts[index], self._lines
+        )
+        self._last = index, token
+        return token
+
+    def __iter__(self):
+        for index in range(len(self._ids)):
+            yield self[index]
+
+    def without(self, Tokens):
+        dropped = {
+            id_ for id_, Kind in enumerate(self._kinds)
+            if issubclass(Kind, tuple(Tokens))
+        }
+        keep = [
+            index for index, id_ in enumerate(self._ids)
+            if id_ not in dropped
+        ]
+        return TokenTable(
+            self._schema,
+            self._kinds,
+            array('B', (self._ids[index] for index in keep)),
+            array('L', (self._starts[index] for index in keep)),
+            array('L', (self._ends[index] for index in keep)),
+            self._lines,
+            self.trivia
+        )
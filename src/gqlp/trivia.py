@@ -0,0 +1,55 @@
+from array import array
+from bisect import bisect_left
+
+from . import source
+from .terminals import Comment
+
+
+class Trivia(object):
+    '''
+    Side table of the comments a lexer skipped. Only the start and
+    end offset of each comment are kept; Comment tokens are made
+    when they are asked for.
+    '''
+    KINDS = (Comment,)
+
+    def __init__(self, schema, lines):
+        self._schema = schema
+        self._lines = lines
+        self._starts = array('L')
+        self._ends = array('L')
+
+    def add(self, start, end):
+        self._starts.append(start)
+        self._ends.append(end)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def range(self, index):
+        return self._starts[index], self._ends[index]
+
+    def text(self, index):
+        text = self._schema[self._starts[index]:self._ends[index]]
+        return source.decode(text)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._starts)
+        return Comment(
+            Comment.convert(self.text(index)), 0, 0,
+            self._starts[index], self._lines
+        )
+
+    def __iter__(self):
+        for index in range(len(self._starts)):
+            yield self[index]
+
+    def between(self, start, end):
+        '''
+        The comments that start at or after start and before end,
+        e.g. those in front of a definition.
+        '''
+        first = bisect_left(self._starts, start)
+        last = bisect_left(self._starts, end, first)
+        return [self[index] for index in range(first, last)]
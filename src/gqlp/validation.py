@@ -0,0 +1,194 @@
+from .gql import *
+
+
+class ValidationError(Exception):
+    def __init__(self, node, message):
+        self.node = node
+        if isinstance(node, Token):
+            message += f' in line {node.line}, column {node.column}'
+        super().__init__(f'{message}.')
+
+
+class UnknownField(ValidationError):
+    def __init__(self, name, type_name):
+        super().__init__(
+            name, f'Type "{type_name}" has no field "{name}"'
+        )
+
+
+class SelectionOnLeaf(ValidationError):
+    def __init__(self, name, type_name):
+        super().__init__(
+            name,
+            f'Field "{name}" of type "{type_name}" has no fields to select'
+        )
+
+
+class UnknownArgument(ValidationError):
+    def __init__(self, name, field):
+        super().__init__(
+            name, f'Field "{field}" has no argument "{name}"'
+        )
+
+
+class UnknownVariable(ValidationError):
+    def __init__(self, name):
+        super().__init__(name, f'Variable "${name}" is not defined')
+
+
+class NotAnInputType(ValidationError):
+    def __init__(self, name, type_name):
+        super().__init__(
+            name,
+            f'Variable "${name}" has type "{type_name}",'
+            ' which is not an input type'
+        )
+
+
+class VariableTypeMismatch(ValidationError):
+    def __init__(self, name, type_name, expected):
+        super().__init__(
+            name,
+            f'Variable "${name}" of type "{type_name}"'
+            f' is used where "{expected}" is expected'
+        )
+
+
+def named_type(type_):
+    while isinstance(type_, List):
+        type_ = type_._type
+    return str(type_)
+
+
+class Validator(object):
+    '''
+    Checks queries against a schema. The fields of a type are looked
+    up in the schema's index the first time a query selects them,
+    and kept until the schema's version changes, so validating a
+    query takes a single walk over its selections. Create one
+    validator per schema and reuse it for all queries.
+
+    The query's root field is looked up on the type named root.
+    '''
+
+    def __init__(self, schema, root='Query', scalars=SCALARS):
+        self._schema = schema
+        self._root = root
+        self._scalars = set(scalars)
+        self._version = schema.version
+        # type name -> field name -> (named type, argument)
+        self._fields = {}
+
+    def _fields_of(self, type_name):
+        fields = self._fields.get(type_name)
+        if fields is None:
+            fields = self._fields[type_name] = {}
+            if self._is_object(type_name):
+                fields.update(
+                    (name, (named_type(field._type), field._argument))
+                    for name, field in self._schema.fields(type_name).items()
+                )
+        return fields
+
+    def _is_object(self, type_name):
+        definition = self._schema.type(type_name)
+        return isinstance(definition, Type) and not isinstance(
+            definition, Input
+        )
+
+    def _is_input(self, type_name):
+        return type_name in self._scalars or isinstance(
+            self._schema.type(type_name), (Enum, Input)
+        )
+
+    def validate(self, query):
+        '''
+        Returns the list of errors found in query, which is empty
+        if the query is valid.
+        '''
+        if self._version != self._schema.version:
+            self._version = self._schema.version
+            self._fields = {}
+
+        errors = []
+        variables = self._check_variables(query, errors)
+
+        document = query._document
+        signature = document._signature
+        root = self._field(signature._name, self._root, errors)
+        if root is None:
+            return errors
+
+        type_name, argument = root
+        self._check_argument(signature, argument, variables, errors)
+        self._check_selection(
+            signature._name, type_name, document._document, errors
+        )
+        return errors
+
+    def _field(self, name, type_name, errors):
+        field = self._fields_of(type_name).get(str(name))
+        if field is None:
+            errors.append(UnknownField(name, type_name))
+        return field
+
+    def _check_variables(self, query, errors):
+        variables = {}
+        # TBD: More than one variable
+        for variable in filter(None, [query._arguments]):
+            type_name = str(variable._type)
+            if not self._is_input(type_name):
+                errors.append(NotAnInputType(variable._name, type_name))
+            variables[str(variable._name)] = type_name
+        return variables
+
+    def _check_argument(self, signature, argument, variables, errors):
+        if argument is None or str(argument._name) != str(signature._argument):
+            errors.append(UnknownArgument(signature._argument, signature._name))
+            return
+
+        variable = str(signature._variable)
+        if variable not in variables:
+            errors.append(UnknownVariable(signature._variable))
+            return
+
+        expected = named_type(argument._type)
+        if variables[variable] != expected:
+            errors.append(VariableTypeMismatch(
+                signature._variable, variables[variable], expected
+            ))
+
+    def _check_selection(self, name, type_name, selection, errors):
+        '''
+        Walks the selection with an explicit stack. A nested list
+        belongs to the field in front of it, whose type was pushed
+        as parent for it.
+        '''
+        if not self._is_object(type_name):
+            errors.append(SelectionOnLeaf(name, type_name))
+            return
+
+        stack = [(type_name, iter(selection))]
+        while stack:
+            parent, items = stack[-1]
+            field_type = None
+            for item in items:
+                if isinstance(item, (list, tuple)):
+                    if field_type is None:
+                        continue
+                    if not self._is_object(field_type):
+                        errors.append(SelectionOnLeaf(field_name, field_type))
+                        field_type = None
+                        continue
+                    stack.append((field_type, iter(item)))
+                    break
+
+                field_name = item
+                field = self._field(item, parent, errors)
+                field_type = field and field[0]
+            else:
+                stack.pop()
+
+
+def validate(schema, query, root='Query'):
+    return Validator(schema, root).validate(query)
@@ -1,19 +1,59 @@
-from pathlib import Path
-from gqlp import GraphQLLexer
-from gqlp.parser import Parser
-from gqlp.gql import Schema
-
-def main(_, path):
-    parser = Parser(
-        GraphQLLexer(Path(path).read_text()),
+import argparse
+import sys
+from time import perf_counter
+
+from gqlp.batch import expand, parse_files
+from gqlp.printer import print_schema
+
+
+def main(_, *arguments):
+    options = argparse.ArgumentParser(
+        description='Parse GraphQL schema files.'
+    )
+    options.add_argument(
+        'paths', nargs='+',
+        help='schema files, directories or glob patterns'
+    )
+    options.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of worker processes, 0 for one per core'
+    )
+    options.add_argument(
+        '-f', '--format', choices=('repr', 'sdl', 'minified'),
+        default='repr', help='how to print the parsed schemas'
+    )
+    options = options.parse_args(arguments)
+
+    start = perf_counter()
+    paths = expand(options.paths)
+    results = parse_files(paths, jobs=options.jobs or None)
+    seconds = perf_counter() - start
+
+    for result in results:
+        if not result.ok:
+            print(f'{result.path}: {result.error}', file=sys.stderr)
+            continue
+
+        if len(results) > 1:
+            print(f'{result.path} ({result.seconds:.3f}s)')
+        if options.format != 'repr':
+            print_schema(
+                result.schema, sys.stdout, options.format == 'minified'
+            )
+            continue
+        for type_ in result.schema._types:
+            print(type_.__repr__())
+            for field in type_:
+                print('  ', field.__repr__())
+
+    failed = sum(1 for result in results if not result.ok)
+    print(
+        f'{len(results)} files, {len(results) - failed} parsed,'
+        f' {failed} failed in {seconds:.2f}s',
+        file=sys.stderr
     )
+    return 1 if failed else 0
 
-    schema = Schema.match(parser)
-    for type_ in schema._types:
-        print(type_.__repr__())
-        for field in type_:
-            print('  ', field.__repr__())
 
 if __name__ == '__main__':
-    import sys
-    main(*sys.argv)
\ No newline at end of file
+    sys.exit(main(*sys.argv))
@@ -0,0 +1,61 @@
+import tempfile
+from pathlib import Path
+
+from nose.tools import *
+
+from gqlp.batch import expand, parse_files
+
+
+def write(directory, name, text):
+    path = Path(directory) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+
+def test_parse_files_in_order():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [
+            write(directory, f'{index}.graphql', f'enum E{index} {{ A }}')
+            for index in range(6)
+        ]
+        paths.insert(2, write(directory, 'bad.graphql', 'type {'))
+
+        results = parse_files(paths, jobs=2)
+
+        assert_equal([result.path for result in results], paths)
+        assert_equal([result.ok for result in results].count(False), 1)
+        assert_true(results[2].error.startswith('UnexpectedToken'))
+        assert_equal(repr(results[3].schema._types), '[<Enum: E2>]')
+        assert_true(all(result.seconds >= 0 for result in results))
+
+
+def test_parse_files_serial():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write(directory, 'a.graphql', 'type A { b: Int }')
+
+        result, = parse_files([path], jobs=1)
+
+        assert_true(result.ok)
+        assert_equal(repr(result.schema._types), '[<Type: A>]')
+
+
+def test_expand():
+    with tempfile.TemporaryDirectory() as directory:
+        a = write(directory, 'a.graphql', '')
+        b = write(directory, 'sub/b.gql', '')
+        write(directory, 'sub/c.txt', '')
+
+        assert_equal(expand([directory]), [a, b])
+        assert_equal(expand([f'{directory}/**/*.gql']), [b])
+        assert_equal(expand([a]), [a])
+
+
+def test_parse_file_errors_keep_positions():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write(directory, 'a.graphql', 'type A { # Größe\n  b: Int # ä\n  c: ]')
+
+        result, = parse_files([path], jobs=1)
+
+        assert_false(result.ok)
+        assert_in('line 3, column 6', result.error)
@@ -0,0 +1,105 @@
+import pickle
+import tempfile
+from pathlib import Path
+
+from nose.tools import *
+
+from gqlp.cache import ParseCache
+from gqlp.gql import *
+
+
+SCHEMA = """
+type Human implements Character {
+  id: ID!
+  friends: [Character]
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+"""
+
+
+def test_cache_hit():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+
+        first = cache.schema(SCHEMA)
+        second = ParseCache(directory).schema(SCHEMA)
+        third = cache.schema(SCHEMA)
+
+        assert_equal(repr(second._types), repr(first._types))
+        assert_equal(second._types[0]._name.line, 2)
+        assert_equal(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0})
+
+
+def test_cache_corrupt_entry():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        cache.schema(SCHEMA)
+
+        path = Path(directory) / f'{ParseCache.key(SCHEMA)}.schema'
+        path.write_bytes(b'weasel')
+
+        schema = cache.schema(SCHEMA)
+
+        assert_equal(len(schema._types), 2)
+        assert_equal(cache.misses, 2)
+        enum = cache.schema(SCHEMA)._types[1]
+        assert_equal(enum._name, schema._types[1]._name)
+        assert_equal(cache.hits, 1)
+
+
+def test_cache_eviction():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory, max_bytes=0)
+
+        cache.schema(SCHEMA)
+        cache.schema(SCHEMA + 'enum Other { A }')
+
+        assert_equal(cache.evictions, 2)
+        assert_equal(list(Path(directory).iterdir()), [])
+
+
+def test_cache_keeps_schemas_it_cannot_store():
+    deep = f"type D {{ f: {'[' * 5000}String{'!]' * 5000} }}"
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+
+        schema = cache.schema(deep)
+
+        assert_equal(repr(schema._types), '[<Type: D>]')
+        assert_equal(list(Path(directory).iterdir()), [])
+        assert_equal(cache.schema(deep)._types[0]._name, Name('D'))
+        assert_equal(cache.misses, 2)
+
+    # The directory is gone, so no temporary file can be created.
+    assert_equal(len(cache.schema(SCHEMA)._types), 2)
+
+
+def test_cache_hit_on_entry_evicted_while_loading():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+        cache.schema(SCHEMA)
+
+        path = Path(directory) / f'{ParseCache.key(SCHEMA)}.schema'
+        load = pickle.load
+
+        def load_and_evict(file):
+            loaded = load(file)
+            path.unlink()
+            return loaded
+
+        pickle.load = load_and_evict
+        try:
+            schema = cache.schema(SCHEMA)
+        finally:
+            pickle.load = load
+
+        assert_equal(len(schema._types), 2)
+        assert_equal(cache.hits, 1)
+
+
+def test_cache_key_depends_on_text():
+    assert_not_equal(ParseCache.key(SCHEMA), ParseCache.key(SCHEMA + ' '))
@@ -0,0 +1,103 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.cost import *
+from gqlp.gql import *
+from gqlp.parser import Parser
+
+
+SCHEMA = """
+type Query {
+  hero(episode: Episode): Character
+  heroes(episode: Episode): [Character!]!
+}
+
+type Character {
+  name: String
+  friends: [[Character]]
+  starships: [Starship]
+}
+
+type Starship {
+  name: String
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+"""
+
+QUERY = """
+query Hero($episode: Episode) {
+  heroes(episode: $episode) {
+    name
+    friends {
+      name
+    }
+    starships {
+      name
+    }
+  }
+}
+"""
+
+
+def parse(gql):
+    parser = Parser(GraphQLLexer(gql))
+    return Schema.match(parser)
+
+
+def test_analyze():
+    analysis = CostTable(parse(SCHEMA)).analyze(parse(QUERY)._types[0])
+
+    assert_equal(analysis.depth, 3)
+    assert_equal(analysis.fields, 6)
+    assert_equal(analysis.paths, {
+        'heroes': 10,
+        'heroes.name': 10,
+        'heroes.friends': 1000,
+        'heroes.friends.name': 1000,
+        'heroes.starships': 100,
+        'heroes.starships.name': 100,
+    })
+    assert_equal(analysis.cost, 2220)
+    assert_false(analysis.exceeded)
+
+
+def test_analyze_factors():
+    table = CostTable(
+        parse(SCHEMA),
+        default_factor=2,
+        factors={'Query.heroes': 5, 'Character.starships': 1}
+    )
+    analysis = table.analyze(parse(QUERY)._types[0]._document)
+
+    assert_equal(analysis.paths['heroes.friends.name'], 20)
+    assert_equal(analysis.paths['heroes.starships.name'], 5)
+    assert_equal(analysis.cost, 5 + 5 + 20 + 20 + 5 + 5)
+
+
+def test_analyze_limits():
+    table = CostTable(parse(SCHEMA))
+    query = parse(QUERY)._types[0]
+
+    analysis = table.analyze(query, max_cost=500)
+    assert_true(analysis.exceeded)
+    assert_equal(list(analysis.paths), ['heroes', 'heroes.name', 'heroes.friends'])
+
+    analysis = table.analyze(query, max_depth=2)
+    assert_true(analysis.exceeded)
+    assert_equal(analysis.fields, 4)
+    assert_equal(analysis.depth, 3)
+
+
+def test_table_follows_schema_changes():
+    schema = parse(SCHEMA)
+    table = CostTable(schema)
+    query = parse(QUERY)._types[0]
+    assert_equal(table.analyze(query).paths['heroes.starships.name'], 100)
+
+    schema.remove('Starship')
+    schema.add(parse('type Starship { name: [String] }')._types[0])
+    assert_equal(table.analyze(query).paths['heroes.starships.name'], 1000)
@@ -0,0 +1,155 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.diff import *
+from gqlp.gql import *
+from gqlp.parser import Parser
+
+
+SCHEMA = """
+type Query {
+  hero(episode: Episode = JEDI): Character
+}
+
+type Character {
+  name: String!
+  friends: [Character!]!
+  appearsIn: [Episode]
+}
+
+type Droid implements Character {
+  name: String!
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+enum Episode {
+  NEWHOPE
+  JEDI
+}
+"""
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def sorted_changes(changes):
+    return sorted(changes, key=lambda change: change.path)
+
+
+def test_equal_schemas_have_equal_roots():
+    old, new = parse(SCHEMA), parse(SCHEMA.replace('\n\n', '\n\n\n'))
+
+    assert_equal(hashes(old).root, hashes(new).root)
+    assert_equal(diff(old, new), [])
+
+
+def test_field_order_does_not_count():
+    old = parse(SCHEMA)
+    new = parse(
+        SCHEMA
+        .replace('  name: String!\n  friends: [Character!]!\n',
+                 '  friends: [Character!]!\n  name: String!\n')
+        .replace('NEWHOPE\n  JEDI', 'JEDI\n  NEWHOPE')
+    )
+
+    assert_equal(hashes(old).root, hashes(new).root)
+    assert_equal(diff(old, new), [])
+
+
+def test_hashes_are_cached_per_version():
+    schema = parse(SCHEMA)
+    first = hashes(schema)
+    assert_is(hashes(schema), first)
+
+    schema.add_field('Droid', Field(Name('model'), Name('String')))
+    assert_is_not(hashes(schema), first)
+    assert_not_equal(hashes(schema).root, first.root)
+
+
+def test_types_added_and_removed():
+    old = parse(SCHEMA)
+    new = parse(SCHEMA.replace('input ReviewInput', 'input Review'))
+
+    assert_equal(sorted_changes(diff(old, new)), [
+        Change(TYPE_ADDED, 'Review'),
+        Change(TYPE_REMOVED, 'ReviewInput'),
+    ])
+
+
+def test_field_changes():
+    old = parse(SCHEMA)
+    new = parse(
+        SCHEMA
+        .replace('friends: [Character!]!', 'friends: [Character!]')
+        .replace('appearsIn: [Episode]', 'appearsIn: [[Episode]]')
+        .replace('name: String!\n  friends', 'nickname: String\n  friends')
+    )
+
+    assert_equal(diff(old, new), [
+        Change(FIELD_REMOVED, 'Character.name'),
+        Change(
+            NULLABILITY_CHANGED, 'Character.friends',
+            '[Character!]!', '[Character!]'
+        ),
+        Change(
+            FIELD_TYPE_CHANGED, 'Character.appearsIn',
+            '[Episode]', '[[Episode]]'
+        ),
+        Change(FIELD_ADDED, 'Character.nickname'),
+    ])
+
+
+def test_argument_and_enum_changes():
+    old = parse(SCHEMA)
+    new = parse(
+        SCHEMA
+        .replace('= JEDI', '= NEWHOPE')
+        .replace('  JEDI\n', '  EMPIRE\n')
+    )
+
+    assert_equal(sorted_changes(diff(old, new)), [
+        Change(ENUM_VALUE_ADDED, 'Episode.EMPIRE'),
+        Change(ENUM_VALUE_REMOVED, 'Episode.JEDI'),
+        Change(
+            ARGUMENT_CHANGED, 'Query.hero',
+            'episode: Episode = JEDI', 'episode: Episode = NEWHOPE'
+        ),
+    ])
+
+
+def test_type_changed():
+    old = parse(SCHEMA)
+    new = parse(
+        SCHEMA
+        .replace('type Droid implements Character', 'type Droid')
+        .replace('input ReviewInput', 'type ReviewInput')
+    )
+
+    assert_equal(sorted_changes(diff(old, new)), [
+        Change(TYPE_CHANGED, 'Droid', ('type', 'Character'), ('type', None)),
+        Change(
+            TYPE_CHANGED, 'ReviewInput', ('input', None), ('type', None)
+        ),
+    ])
+
+
+def test_diff_only_visits_changed_buckets():
+    definitions = ''.join(
+        f'type T{index} {{ a: Int b: [String!] }}\n' for index in range(500)
+    )
+    old = parse(definitions)
+    new = parse(definitions.replace('type T7 { a: Int', 'type T7 { a: Int!'))
+    old_hashes, new_hashes = hashes(old), hashes(new)
+
+    changed = [
+        bucket for bucket in range(Hashes.BUCKETS)
+        if old_hashes.buckets[bucket] != new_hashes.buckets[bucket]
+    ]
+    assert_equal(changed, [old_hashes.bucket('T7')])
+    assert_equal(diff(old, new), [
+        Change(NULLABILITY_CHANGED, 'T7.a', 'Int', 'Int!')
+    ])
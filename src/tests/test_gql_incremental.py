@@ -0,0 +1,159 @@
+import random
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.incremental import Document, EditableLineIndex
+from gqlp.lines import LineIndex
+from gqlp.parser import *
+
+
+SCHEMA = """# Schema
+type Human {
+  id: ID!
+  friends: [Human]
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+
+type Droid {
+  name: String
+}
+"""
+
+
+def dump(schema):
+    dumped = []
+    for type_ in schema._types:
+        dumped.append(
+            (repr(type_), type_._name.line, type_._name.column)
+        )
+        for field in type_:
+            name = getattr(field, '_name', field)
+            dumped.append((repr(field), name.line, name.column))
+    return dumped
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def edit(text, offset, removed, inserted):
+    return text[:offset] + inserted + text[offset + removed:]
+
+
+def assert_reparsed(document, offset, removed, inserted):
+    text = edit(document.text, offset, removed, inserted)
+    document.edit(offset, removed, inserted)
+    assert_equal(document.text, text)
+    assert_equal(dump(document.schema), dump(parse(text)))
+
+
+def test_document_parse():
+    document = Document(SCHEMA)
+
+    assert_equal(dump(document.schema), dump(parse(SCHEMA)))
+    assert_equal(len(document.definitions), 3)
+
+
+def test_edit_inside_definition():
+    document = Document(SCHEMA)
+    human, episode, droid = document.definitions
+
+    offset = SCHEMA.index('EMPIRE')
+    assert_reparsed(document, offset, 6, 'JEDI\n  EMPIRE')
+
+    definitions = document.definitions
+    assert definitions[0] is human
+    assert definitions[1] is not episode
+    assert definitions[2] is droid
+    assert_equal(droid.start, document.text.index('type Droid'))
+
+
+def test_edit_adds_definitions():
+    document = Document(SCHEMA)
+
+    assert_reparsed(document, 0, 0, 'enum Empty { NONE }\n')
+    assert_reparsed(document, len(document.text), 0, 'type Tail { x: Int }')
+    assert_equal(len(document.definitions), 5)
+
+
+def test_edit_merges_definitions():
+    document = Document(SCHEMA)
+
+    offset = SCHEMA.index('}')
+    removed = SCHEMA.index('EMPIRE') + 7 - offset
+    assert_reparsed(document, offset, removed, '')
+    assert_equal(len(document.definitions), 2)
+
+    assert_reparsed(document, offset, 0, '}\nenum Episode {\n  JEDI\n')
+    assert_equal(len(document.definitions), 3)
+
+
+def test_edit_before_first_definition():
+    document = Document(SCHEMA)
+
+    assert_reparsed(document, 3, 6, '\n')
+    assert_equal(len(document.definitions), 3)
+
+    document = Document(SCHEMA)
+    assert_raises(UnexpectedToken, document.edit, 8, 1, '}')
+    assert_equal(document.text, SCHEMA)
+    assert_raises(UnexpectedToken, parse, edit(SCHEMA, 8, 1, '}'))
+
+
+def test_edit_moves_positions():
+    document = Document(SCHEMA)
+    droid = document.definitions[2].node
+
+    assert_reparsed(document, 0, 0, '\n\n')
+
+    assert_equal((droid._name.line, droid._name.column), (14, 6))
+    assert_equal(document.text[droid._name.offset:][:5], 'Droid')
+
+
+def test_edit_keeps_schema_up_to_date():
+    document = Document(SCHEMA)
+    schema = document.schema
+
+    offset = SCHEMA.index('type Droid')
+    assert_reparsed(document, offset, 10, 'type Robot')
+
+    assert_is(document.schema, schema)
+    assert_equal(schema.type('Droid'), None)
+    assert_equal(list(schema.fields('Robot')), ['name'])
+    assert_equal(
+        [definition.node for definition in document.definitions],
+        schema._types
+    )
+
+
+def test_editable_line_index():
+    random_ = random.Random(0)
+    text = 'a\nbc\n\ndef\n'
+    lines = EditableLineIndex(text)
+    for _ in range(200):
+        offset = random_.randint(0, len(text))
+        removed = random_.randint(0, min(3, len(text) - offset))
+        inserted = ''.join(random_.choice('x\n') for _ in range(3))
+        text = text[:offset] + inserted + text[offset + removed:]
+        lines.edit(offset, removed, inserted)
+
+        expected = LineIndex(text)
+        for position in range(len(text) + 1):
+            assert_equal(lines.position(position), expected.position(position))
+
+
+def test_failed_edit_keeps_document():
+    document = Document(SCHEMA)
+    assert_equal(dump(document.schema), dump(parse(SCHEMA)))
+
+    offset = SCHEMA.index('id:')
+    assert_raises(UnexpectedToken, document.edit, offset + 2, 1, '')
+
+    assert_equal(document.text, SCHEMA)
+    assert_reparsed(document, offset, 2, 'key')
@@ -0,0 +1,127 @@
+import json
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.introspection import *
+from gqlp.parser import Parser
+
+
+SCHEMA = """
+type Query {
+  hero(episode: Episode = JEDI): Character
+}
+
+type Character {
+  name: String!
+  friends: [Character!]!
+  appearsIn: [Episode]
+}
+
+type Droid implements Character {
+  name: String!
+  born: Date
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+enum Episode {
+  NEWHOPE
+  JEDI
+}
+"""
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def types(result):
+    return {type_['name']: type_ for type_ in result['__schema']['types']}
+
+
+def test_introspect():
+    result = introspect(parse(SCHEMA))
+    by_name = types(result)
+
+    assert_equal(result['__schema']['queryType'], {'name': 'Query'})
+    assert_is_none(result['__schema']['mutationType'])
+    assert_equal(
+        [by_name[name]['kind'] for name in (
+            'Query', 'Character', 'Droid', 'ReviewInput', 'Episode',
+            'String', 'Date'
+        )],
+        ['OBJECT', 'INTERFACE', 'OBJECT', 'INPUT_OBJECT', 'ENUM',
+         'SCALAR', 'SCALAR']
+    )
+
+    hero = by_name['Query']['fields'][0]
+    assert_equal(hero['args'][0]['defaultValue'], 'JEDI')
+    assert_equal(hero['args'][0]['type'], {
+        'kind': 'ENUM', 'name': 'Episode', 'ofType': None
+    })
+
+    friends = by_name['Character']['fields'][1]
+    assert_equal(friends['type'], {
+        'kind': 'NON_NULL', 'name': None, 'ofType': {
+            'kind': 'LIST', 'name': None, 'ofType': {
+                'kind': 'NON_NULL', 'name': None, 'ofType': {
+                    'kind': 'INTERFACE', 'name': 'Character', 'ofType': None
+                }
+            }
+        }
+    })
+
+    assert_equal(by_name['Character']['possibleTypes'], [
+        {'kind': 'OBJECT', 'name': 'Droid', 'ofType': None}
+    ])
+    assert_equal(by_name['Droid']['interfaces'], [
+        {'kind': 'INTERFACE', 'name': 'Character', 'ofType': None}
+    ])
+    assert_equal(by_name['ReviewInput']['inputFields'][0]['name'], 'stars')
+    assert_equal(
+        [value['name'] for value in by_name['Episode']['enumValues']],
+        ['NEWHOPE', 'JEDI']
+    )
+
+
+def test_introspect_json_is_cached():
+    schema = parse(SCHEMA)
+
+    first = introspect_json(schema)
+    assert_is(introspect_json(schema), first)
+    assert_is(introspect(schema), introspect(schema))
+    assert_equal(json.loads(first)['data'], introspect(schema))
+
+
+def test_introspection_follows_changes():
+    schema = parse(SCHEMA)
+    before = introspect_json(schema)
+
+    schema.add_field('Droid', Field(Name('model'), Name('String')))
+    after = introspect(schema)
+    assert_is_not(introspect_json(schema), before)
+    assert_in('model', [
+        field['name'] for field in types(after)['Droid']['fields']
+    ])
+
+    schema.remove('ReviewInput')
+    assert_not_in('ReviewInput', types(introspect(schema)))
+    assert_equal(schema.version, 2)
+
+
+def test_introspect_json_deep_type_reference():
+    depth = 5000
+    schema = parse(f"type Deep {{ field: {'[' * depth}Int{']' * depth} }}")
+
+    serialized = introspect_json(schema).decode('utf-8')
+
+    reference = (
+        '{"kind":"LIST","name":null,"ofType":' * depth
+        + '{"kind":"SCALAR","name":"Int","ofType":null}' + '}' * depth
+    )
+    assert_in(f'"type":{reference},"isDeprecated":false', serialized)
+    assert_true(serialized.startswith('{"data":{"__schema":{'))
@@ -126,6 +126,19 @@ def test_negative_number_float():
     assert_equal(list(tokens), expected_tokens)
 
 
+def test_malformed_numbers():
+    gql = '1.2.3 - 4.'
+
+    for scanner in (False, True):
+        tokens = list(GraphQLLexer(gql, scanner=scanner, invalid=True))
+
+        assert_equal(tokens, [
+            Number(1.2), Invalid('.'), Number(3), Invalid('-'), Number(4),
+            Invalid('.'), Eof()
+        ])
+    assert_raises(Terminals.UnexpectedCharacter, list, GraphQLLexer(gql))
+
+
 def test_comment():
     gql = """
     type Type {
@@ -0,0 +1,58 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.lines import LineIndex
+from gqlp.terminals import *
+
+
+def test_line_index():
+    lines = LineIndex('type\n  Images {\n\n}')
+
+    assert_equal(lines.position(0), (1, 1))
+    assert_equal(lines.position(4), (1, 5))
+    assert_equal(lines.position(7), (2, 3))
+    assert_equal(lines.position(16), (3, 1))
+    assert_equal(lines.position(17), (4, 1))
+
+
+def test_token_positions_are_resolved_lazily():
+    gql = """
+    type Images {
+        TEASER: Image
+    }"""
+
+    tokens = list(GraphQLLexer(gql))
+    name = tokens[5]
+
+    assert_equal(name, Name('TEASER'))
+    assert_equal(name.offset, 27)
+    assert_equal((name.line, name.column), (3, 9))
+    assert_equal((tokens[-1].line, tokens[-1].column), (4, 6))
+
+
+def test_line_index_lets_go_of_text():
+    lines = LineIndex('type\n  Images {\n\n}')
+
+    assert_equal(lines.position(7), (2, 3))
+    assert_is_none(lines._schema)
+    assert_equal(lines.position(17), (4, 1))
+
+
+def test_token_explicit_positions():
+    token = Name('weasel', 3, 7)
+
+    assert_equal(token.offset, None)
+    assert_equal((token.line, token.column), (3, 7))
+
+
+def test_binary_line_index_is_built_in_chunks():
+    text = 'größe\n  "ünd" ä\n\nö'
+    data = text.encode('utf-8')
+    lines = LineIndex(data)
+    lines.CHUNK = 3
+
+    expected = LineIndex(text)
+    for index, character in enumerate(text):
+        offset = len(text[:index].encode('utf-8'))
+        assert_equal(lines.position(offset), expected.position(index))
+    assert_is_none(lines._schema)
@@ -0,0 +1,73 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.linker import LinkError, link
+from gqlp.parser import *
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def test_link():
+    schema = link(parse("""
+    type Character {
+      name: String
+    }
+
+    type Human implements Character {
+      id: ID!
+      friends: [[Character!]]!
+      length(unit: LengthUnit = METER): Float
+      appearsIn: Episode
+    }
+
+    enum Episode { JEDI }
+    enum LengthUnit { METER }
+    """))
+
+    character, human, episode, unit = schema._types
+    id_, friends, length, appears_in = human._fields
+
+    assert human._parent_target is character
+    assert id_._target is SCALARS['ID']
+    assert friends._target is character
+    assert friends._type._target is character
+    assert friends._type._type._target is character
+    assert length._argument._target is unit
+    assert length._target is SCALARS['Float']
+    assert appears_in._target is episode
+
+
+def test_link_query_arguments():
+    schema = link(parse("""
+    query DroidById($id: ID!) {
+      droid(id: $id) {
+        name
+      }
+    }
+    """))
+
+    assert schema._types[0]._arguments._target is SCALARS['ID']
+
+
+def test_link_reports_all_unknown_types():
+    schema = parse("""
+    type Human implements Character {
+      friends: [Character]
+      starship: Starship
+      length(unit: LengthUnit): Float
+    }
+    """)
+
+    with assert_raises(LinkError) as context:
+        link(schema)
+
+    errors = context.exception.errors
+    assert_equal(
+        [str(error.name) for error in errors],
+        ['Character', 'Character', 'Starship', 'LengthUnit']
+    )
+    assert_equal((errors[2].name.line, errors[2].name.column), (4, 17))
+    assert 'line 3, column 17' in str(context.exception)
@@ -0,0 +1,119 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.ll1 import *
+from gqlp.parser import Parser, UnexpectedToken
+
+from benchmarks.generate import SHAPES, generate
+
+
+SCHEMA = """
+type Human implements Character {
+  id: ID!
+  type: String
+  friends(first: Int = ten): [[Character!]]!
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+enum Episode {
+  NEWHOPE
+  type
+}
+
+query DroidById($id: ID! = R2) {
+  droid(id: $id) {
+    name
+    friends {
+      name
+      type
+    }
+  }
+}
+"""
+
+
+def nodes(node):
+    '''
+    The nodes of a tree in depth-first order, described by their
+    class, name or value and line.
+    '''
+    found = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            found.append(len(node))
+            stack.extend(reversed(node))
+        elif isinstance(node, Token):
+            found.append((type(node), node._value, node.line, node.column))
+        elif isinstance(node, Schema):
+            stack.append(node._types)
+        elif node is None or isinstance(node, bool):
+            found.append(node)
+        else:
+            found.append(type(node))
+            slots = [
+                slot for Class in type(node).__mro__
+                for slot in getattr(Class, '__slots__', ())
+                if slot not in ('_frozen', '_target', '_parent_target')
+            ]
+            stack.extend(getattr(node, slot) for slot in reversed(slots))
+    return found
+
+
+def both(gql):
+    expected = Schema.match(Parser(GraphQLLexer(gql)))
+    actual = parse(Parser(GraphQLLexer(gql)))
+    return nodes(actual), nodes(expected)
+
+
+def test_ll1_matches_parser():
+    actual, expected = both(SCHEMA)
+    assert_equal(actual, expected)
+    assert_greater(len(actual), 50)
+
+
+def test_ll1_matches_parser_on_generated_schemas():
+    for shape, Shape in SHAPES.items():
+        if Shape.parses:
+            assert_equal(*both(generate(50, shape)))
+
+
+def test_ll1_deep_nesting():
+    depth = 10000
+    gql = f"type Deep {{ field: {'[' * depth}String{']' * depth} }}\n"
+
+    assert_equal(*both(gql))
+
+
+def test_ll1_errors():
+    with assert_raises(UnexpectedToken) as raised:
+        parse(Parser(GraphQLLexer('type Human {\n  name String\n}\n')))
+    assert_in('line 2, column 8', str(raised.exception))
+    assert_in('Colon', str(raised.exception))
+
+    with assert_raises(UnexpectedToken) as raised:
+        parse(Parser(GraphQLLexer('weasel Human {}\n')))
+    assert_in("'enum', 'input', 'query', 'type'", str(raised.exception))
+
+
+def test_grammar_conflicts():
+    grammar = Grammar("""
+    Start = Item* {first}
+    Item  = NAME ':' NAME {first}
+          | NAME {first}
+    """, ACTIONS)
+
+    with assert_raises(GrammarError) as raised:
+        Tables(grammar)
+    assert_in('Item is not LL(1)', str(raised.exception))
+
+
+def test_grammar_errors():
+    assert_raises(GrammarError, Grammar, 'Start = Missing', ACTIONS)
+    assert_raises(GrammarError, Grammar, 'Start = NAME NAME', ACTIONS)
+    assert_raises(GrammarError, Grammar, 'Start = NAME {weasel}', ACTIONS)
@@ -0,0 +1,99 @@
+import tempfile
+from pathlib import Path
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.batch import parse_files
+from gqlp.gql import *
+from gqlp.merge import *
+from gqlp.parser import Parser
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def test_merge():
+    schema, errors = merge([
+        parse('type Character { name: String }'),
+        parse('type Droid implements Character { friends: [Character] }'),
+        parse('enum Episode { JEDI }\ntype Character { name: String }'),
+    ])
+
+    assert_equal(errors, [])
+    assert_equal(
+        [str(definition._name) for definition in schema._types],
+        ['Character', 'Droid', 'Episode']
+    )
+    character = schema.type('Character')
+    droid = schema.type('Droid')
+    assert_equal(schema.implementors('Character'), [droid])
+    assert_is(droid._parent_target, character)
+    assert_is(schema.field('Droid', 'friends')._target, character)
+
+
+def test_conflicting_definitions():
+    schema, errors = merge([
+        parse('type Character { name: String }'),
+        parse('type Character { name: String! }'),
+        parse('enum Character { NAME }'),
+    ])
+
+    assert_equal(
+        [(type(error), error.name, error.sources) for error in errors],
+        [(ConflictingDefinition, 'Character', (0, 1)),
+         (ConflictingDefinition, 'Character', (0, 2))]
+    )
+    assert_equal(repr(schema.field('Character', 'name')), '<name: String>')
+
+
+def test_conflicting_queries():
+    query = 'query Q($id: ID{}) {{ c(id: $id) {{ name }} }}'
+    _, errors = merge([
+        parse(query.format('')), parse(query.format('')),
+        parse(query.format('!')),
+    ])
+
+    assert_equal([error.sources for error in errors], [(0, 2)])
+
+
+def test_unresolved_references():
+    _, errors = merge([
+        parse('type Human implements Character {\n  ship: Starship\n}'),
+        parse('type Droid { friends: [Human] }'),
+    ])
+
+    assert_equal(
+        [(type(error), str(error.name), error.source) for error in errors],
+        [(UnresolvedReference, 'Character', 0),
+         (UnresolvedReference, 'Starship', 0)]
+    )
+    assert_equal(
+        str(errors[1]), 'Unknown type "Starship" in 0, line 2, column 9.'
+    )
+
+
+def test_merge_file_results():
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        texts = {
+            'character.graphql': 'type Character { name: String }',
+            'droid.graphql': 'type Droid implements Character { a: Int }',
+            'broken.graphql': 'type {',
+        }
+        paths = []
+        for name, text in texts.items():
+            path = directory / name
+            path.write_text(text)
+            paths.append(str(path))
+
+        schema, errors = merge(parse_files(paths, jobs=1))
+
+        assert_equal(len(errors), 1)
+        assert_is_instance(errors[0], UnparsedFile)
+        assert_equal(errors[0].path, paths[2])
+        assert_true(errors[0].error.startswith('UnexpectedToken'))
+        assert_is(
+            schema.type('Droid')._parent_target, schema.type('Character')
+        )
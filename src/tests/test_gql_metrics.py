@@ -0,0 +1,74 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.metrics import Metrics
+from gqlp.parser import *
+from gqlp.token_stream import TokenStream
+
+
+SCHEMA = """
+# Comment
+type Human {
+  id: ID!
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+
+type Droid {
+  name: String
+}
+"""
+
+
+def test_metrics():
+    metrics = Metrics()
+
+    parser = Parser(GraphQLLexer(SCHEMA, metrics=metrics), metrics=metrics)
+    Schema.match(parser, metrics)
+
+    assert_equal(set(metrics.seconds), {'lex', 'ignore', 'match'})
+    assert_equal(metrics.tokens['Comment'], 1)
+    assert_equal(metrics.tokens['Name'], 12)
+    assert_equal(metrics.tokens['Eof'], 1)
+    assert_equal(metrics.definitions, {'Type': 2, 'Enum': 1})
+    assert_equal(metrics.peak_buffer, 22)
+
+
+def test_metrics_callback():
+    reports = []
+    metrics = Metrics(callback=reports.append)
+
+    lexer = GraphQLLexer(SCHEMA, scanner=True, metrics=metrics)
+    Schema.match(Parser(lexer, stream=True, metrics=metrics))
+
+    report, = reports
+    assert_equal(report['definitions'], {'Type': 2, 'Enum': 1})
+    assert_equal(report['tokens']['NewLine'], 14)
+    assert report['peak_buffer'] <= TokenStream.SIZE
+    assert all(seconds >= 0 for seconds in report['seconds'].values())
+
+
+def test_metrics_table():
+    metrics = Metrics()
+
+    table = GraphQLLexer(SCHEMA, metrics=metrics).table()
+    Schema.match(Parser(table, metrics=metrics))
+
+    assert_equal(set(metrics.seconds), {'lex', 'ignore', 'match'})
+    assert_equal(metrics.tokens['Comment'], 1)
+    assert_equal(metrics.definitions['Enum'], 1)
+
+
+def test_nested_phases():
+    metrics = Metrics()
+
+    with metrics.phase('outer'):
+        with metrics.phase('inner'):
+            pass
+
+    assert_equal(set(metrics.seconds), {'outer', 'inner'})
+    assert_equal(metrics.as_dict()['peak_buffer'], 0)
@@ -196,6 +196,65 @@ def test_parse_comment_with_periods():
     print_schema(schema)
 
 
+def test_parse_nested_lists():
+    gql = """
+    type Matrix {
+        cells: [[[Int!]]!]!
+    }
+    """
+
+    parser = Parser(GraphQLLexer(gql))
+    cells = Schema.match(parser)._types[0]._fields[0]
+
+    assert_is_instance(cells, NonNullableField)
+    assert_equal(type(cells._type), NonNullableList)
+    assert_equal(type(cells._type._type), List)
+    assert_equal(type(cells._type._type._type), NonNullableList)
+    assert_equal(cells._type._type._type._type, Name('Int'))
+
+
+def test_parse_deeply_nested_list():
+    depth = 20000
+    gql = f"type Deep {{ field: {'[' * depth}String{'!]' * depth} }}\n"
+
+    parser = Parser(GraphQLLexer(gql, scanner=True))
+    type_ = Schema.match(parser)._types[0]._fields[0]._type
+
+    for _ in range(depth):
+        assert_equal(type(type_), NonNullableList)
+        type_ = type_._type
+    assert_equal(type_, Name('String'))
+
+
+def test_repr_deeply_nested_list():
+    depth = 20000
+    reference = '[' * (2 * depth + 1) + 'String!]' + '!]]' * depth
+    gql = f'type Deep {{ field: {reference}! }}\n'
+
+    parser = Parser(GraphQLLexer(gql, scanner=True))
+    field = Schema.match(parser)._types[0]._fields[0]
+
+    assert_equal(
+        repr(field),
+        f"<field: {'<List:<List!: ' * depth}<List!: String"
+        f"{'>>' * depth}>!>"
+    )
+
+
+def test_parse_deeply_nested_selection():
+    depth = 20000
+    selection = ' { field' * depth + ' }' * depth
+    gql = f"query Deep($id: ID) {{ deep(id: $id) {{ field{selection} }} }}\n"
+
+    parser = Parser(GraphQLLexer(gql, scanner=True))
+    fields = Schema.match(parser)._types[0]._document._document
+
+    for _ in range(depth):
+        assert_equal(len(fields), 2)
+        fields = fields[1]
+    assert_equal(fields, [Name('field')])
+
+
 # interface
 # union SearchResult = Human | Droid | Starship
 # Fragments
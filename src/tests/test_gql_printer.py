@@ -0,0 +1,129 @@
+import io
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import Parser
+from gqlp.printer import *
+
+from benchmarks.generate import SHAPES, generate
+
+
+SCHEMA = """
+type Human implements Character {
+  id: ID!
+  friends(first: Int = ten): [[Character!]]!
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+query DroidById($id: ID! = R2) {
+  droid(id: $id) {
+    name
+    friends {
+      name
+      starships {
+        name
+      }
+    }
+    height
+  }
+}
+"""
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def structure(node):
+    '''
+    Classes and values of a tree in depth-first order, without
+    positions.
+    '''
+    found = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            found.append(len(node))
+            stack.extend(reversed(node))
+        elif isinstance(node, Token):
+            found.append((type(node), node._value))
+        elif isinstance(node, Schema):
+            stack.append(node._types)
+        elif node is None or isinstance(node, bool):
+            found.append(node)
+        else:
+            found.append(type(node))
+            stack.extend(
+                getattr(node, slot)
+                for Class in reversed(type(node).__mro__)
+                for slot in getattr(Class, '__slots__', ())
+                if slot not in ('_frozen', '_target', '_parent_target')
+            )
+    return found
+
+
+def printed(schema, minified=False):
+    stream = io.StringIO()
+    print_schema(schema, stream, minified)
+    return stream.getvalue()
+
+
+def test_print_schema():
+    assert_equal(printed(parse(SCHEMA)), SCHEMA.lstrip())
+
+
+def test_print_minified():
+    text = printed(parse(SCHEMA), minified=True)
+
+    assert_true(text.startswith(
+        'type Human implements Character{id:ID! friends(first:Int=ten):'
+        '[[Character!]]!}enum Episode{NEWHOPE EMPIRE}'
+    ))
+    assert_in('{droid(id:$id){name friends{name starships{name}}height}}', text)
+    assert_equal(text.count('\n'), 1)
+
+
+def test_print_round_trip():
+    for shape, Shape in SHAPES.items():
+        if not Shape.parses:
+            continue
+        schema = parse(generate(50, shape))
+        for minified in (False, True):
+            assert_equal(
+                structure(parse(printed(schema, minified))),
+                structure(schema)
+            )
+
+
+def test_print_binary_stream_in_pieces():
+    schema = parse(generate(200))
+    stream = io.BytesIO()
+    writes = []
+    write = stream.write
+    stream.write = lambda data: writes.append(len(data)) or write(data)
+
+    printer = Printer(stream)
+    printer.BUFFER = 1024
+    printer.schema(schema)
+
+    assert_equal(stream.getvalue().decode('utf-8'), printed(schema))
+    assert_greater(len(writes), 10)
+    assert_less(max(writes), 2048)
+
+
+def test_print_deep_list():
+    depth = 10000
+    gql = f"type Deep {{\n  field: {'[' * depth}String{'!]' * depth}\n}}\n"
+
+    assert_equal(printed(parse(gql)), gql)
@@ -0,0 +1,110 @@
+import asyncio
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.push_lexer import *
+from gqlp.terminals import *
+
+from .test_gql_scanner import SCHEMAS
+
+
+SCHEMA = """
+type Human implements Character {
+  # The name, or "unknown"
+  name: String!
+  height: -3.1415
+  friends: [Character]
+}
+"""
+
+
+def described(tokens):
+    return [
+        (type(token), token._value, token.line, token.column)
+        for token in tokens
+    ]
+
+
+def pushed(chunks):
+    lexer = PushLexer()
+    tokens = []
+    for chunk in chunks:
+        tokens.extend(lexer.feed(chunk))
+    tokens.extend(lexer.close())
+    return tokens
+
+
+def split(text, size):
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+def test_push_lexer_matches_scanner():
+    for schema in SCHEMAS + [SCHEMA]:
+        expected = described(GraphQLLexer(schema, scanner=True))
+        for size in (1, 2, 3, 7, len(schema) or 1):
+            assert_equal(described(pushed(split(schema, size))), expected)
+
+
+def test_push_lexer_keeps_back_partial_tokens():
+    lexer = PushLexer()
+
+    assert_equal(lexer.feed('type Hu'), [Name('type')])
+    assert_equal(lexer.feed('man {'), [Name('Human'), LeftCurlyBracket()])
+    assert_equal(lexer.feed(' # a comm'), [])
+    assert_equal(lexer.feed('ent\n}'), [
+        Comment('a comment'), NewLine(), RightCurlyBracket()
+    ])
+    assert_equal(lexer.close(), [Eof()])
+    assert_raises(ValueError, lexer.feed, 'type')
+
+
+def test_push_lexer_keeps_back_partial_numbers():
+    lexer = PushLexer()
+
+    assert_equal(lexer.feed('a: -'), [Name('a'), Colon()])
+    assert_equal(lexer.feed('1.'), [])
+    assert_equal(lexer.feed('5 '), [Number(-1.5)])
+    assert_equal(lexer.close(), [Eof()])
+
+
+def test_push_lexer_bytes():
+    schema = '﻿type Cafe {\n  name: String # ☕\n}\n'
+    data = schema.encode('utf-8')
+    chunks = [data[start:start + 1] for start in range(len(data))]
+
+    tokens = pushed(chunks)
+
+    assert_equal(described(tokens), described(GraphQLLexer(schema, scanner=True)))
+    assert_equal(tokens[1], Name('Cafe'))
+
+
+def test_push_lexer_unexpected_character():
+    lexer = PushLexer()
+    lexer.feed('type A {\n')
+    with assert_raises(Terminals.UnexpectedCharacter) as raised:
+        lexer.feed('  ?')
+    assert_equal(raised.exception.line, 2)
+    assert_equal(raised.exception.column, 3)
+
+
+def test_push_lexer_invalid_tokens():
+    lexer = PushLexer(invalid=True)
+    tokens = lexer.feed('type A {\n  ?') + lexer.close()
+
+    assert_equal(tokens[-2], Invalid('?'))
+    assert_equal((tokens[-2].line, tokens[-2].column), (2, 3))
+
+
+def test_lex_stream():
+    async def lex():
+        reader = asyncio.StreamReader()
+        reader.feed_data(SCHEMA.encode('utf-8'))
+        reader.feed_eof()
+        return [token async for token in lex_stream(reader, size=5)]
+
+    tokens = asyncio.run(lex())
+
+    assert_equal(
+        described(tokens), described(GraphQLLexer(SCHEMA, scanner=True))
+    )
@@ -0,0 +1,120 @@
+import threading
+
+from nose.tools import *
+
+from gqlp.gql import *
+from gqlp.query_cache import QueryCache
+
+
+QUERY = """
+query DroidById($id: ID!) {
+  droid(id: $id) {
+    name
+  }
+}
+"""
+
+OTHER = """
+query HumanById($id: ID!) {
+  human(id: $id) {
+    name
+  }
+}
+"""
+
+
+def test_query_cache_hit():
+    cache = QueryCache()
+
+    first = cache.query(QUERY)
+    second = cache.query(QUERY)
+
+    assert_is(second, first)
+    assert_equal(first._name, Name('DroidById'))
+    assert_in(QUERY, cache)
+    stats = cache.stats()
+    assert_equal(stats['hits'], 1)
+    assert_equal(stats['misses'], 1)
+    assert_equal(stats['hit_rate'], 0.5)
+
+
+def test_query_cache_hashed():
+    cache = QueryCache(hashed=True)
+    cache.query(QUERY)
+
+    assert_in(QUERY, cache)
+    assert_equal(len(cache.key(QUERY)), 32)
+
+
+def test_query_cache_lru():
+    cache = QueryCache(capacity=2)
+    third = QUERY.replace('DroidById', 'Third')
+
+    cache.query(QUERY)
+    cache.query(OTHER)
+    cache.query(QUERY)
+    cache.query(third)
+
+    assert_in(QUERY, cache)
+    assert_not_in(OTHER, cache)
+    assert_in(third, cache)
+    assert_equal(cache.evictions, 1)
+
+
+def test_query_cache_max_bytes():
+    cache = QueryCache(max_bytes=1)
+    cache.query(QUERY)
+
+    assert_equal(len(cache), 0)
+    assert_equal(cache.bytes, 0)
+    assert_equal(cache.evictions, 1)
+
+
+def test_query_cache_frozen():
+    query = QueryCache().query(QUERY)
+
+    assert_raises(Frozen, setattr, query, '_name', 'weasel')
+    assert_raises(Frozen, setattr, query._arguments, '_required', False)
+    assert_is_instance(query._document._document, tuple)
+
+
+def test_query_cache_freezes_deep_selections():
+    depth = 5000
+    text = (
+        'query Deep($id: ID!) { node(id: $id) '
+        + '{ a ' * depth + '{ leaf }' + ' }' * depth + ' }'
+    )
+    query = QueryCache().query(text)
+
+    fields = query._document._document
+    for _ in range(depth):
+        assert_is_instance(fields, tuple)
+        assert_equal(fields[0], Name('a'))
+        fields = fields[1]
+    assert_equal(fields, (Name('leaf'),))
+
+
+def test_query_cache_parse_error_is_not_cached():
+    cache = QueryCache()
+
+    assert_raises(Exception, cache.query, 'query { }')
+    assert_equal(len(cache), 0)
+    assert_equal(cache.misses, 1)
+
+
+def test_query_cache_threads():
+    cache = QueryCache(capacity=1)
+    queries = [QUERY, OTHER] * 50
+
+    threads = [
+        threading.Thread(target=lambda: [cache.query(q) for q in queries])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert_equal(stats['hits'] + stats['misses'], 400)
+    assert_equal(len(cache), 1)
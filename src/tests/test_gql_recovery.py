@@ -0,0 +1,166 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import *
+from gqlp.terminals import Terminals
+
+
+SCHEMA = """
+type Human {
+  name: String
+  height Float
+}
+
+type Droid {
+  name: String
+}
+
+weasel
+
+enum Episode {
+  NEWHOPE
+  EMPIRE:
+}
+
+query DroidById($id: ID!) {
+  droid(id: $id) {
+    name {
+      first
+      last(
+    }
+  }
+}
+
+input ReviewInput {
+  stars: Int!
+}
+"""
+
+
+def names(schema):
+    return [str(definition._name) for definition in schema._types]
+
+
+def recover(gql, stream=False):
+    return Schema.recover(Parser(GraphQLLexer(gql), stream=stream))
+
+
+def test_recover():
+    schema, errors = recover(SCHEMA)
+
+    assert_equal(names(schema), ['Droid', 'ReviewInput'])
+    assert_equal(len(errors), 4)
+    assert_true(all(isinstance(error, UnexpectedToken) for error in errors))
+    assert_in('line 4, column 10', str(errors[0]))
+    assert_in('line 11, column 1', str(errors[1]))
+    assert_in('line 15, column 9', str(errors[2]))
+    assert_in('line 22, column 11', str(errors[3]))
+
+
+def test_recover_stream():
+    schema, errors = recover(SCHEMA, stream=True)
+
+    assert_equal(names(schema), ['Droid', 'ReviewInput'])
+    assert_equal(len(errors), 4)
+
+
+def test_recover_long_definition_in_stream():
+    fields = ''.join(f'  field{index}: String\n' for index in range(20))
+    gql = (
+        f'type Long {{\n{fields}  type: [String\n}}\n'
+        'type After {\n  type: String\n}\n'
+    )
+
+    schema, errors = recover(gql, stream=True)
+
+    assert_equal(names(schema), ['After'])
+    assert_equal(len(errors), 1)
+
+
+def test_recover_broken_header():
+    schema, errors = recover("""
+    type Human implements {
+      name: String
+    }
+    type Droid {
+      name: String
+    }
+    """)
+
+    assert_equal(names(schema), ['Droid'])
+    assert_equal(len(errors), 1)
+
+
+def test_recover_unclosed_definition():
+    schema, errors = recover("""
+    type Droid {
+      name: String
+    }
+    type Human {
+      name: String
+    """)
+
+    assert_equal(names(schema), ['Droid'])
+    assert_equal(len(errors), 1)
+
+
+def test_recover_unexpected_characters():
+    gql = 'type A { a: Int @x }\ntype B { b Int }\n% type C { c: Int }\n'
+
+    for scanner in (False, True):
+        for stream in (False, True):
+            lexer = GraphQLLexer(gql, scanner=scanner)
+            schema, errors = Schema.recover(Parser(lexer, stream=stream))
+
+            assert_equal(names(schema), ['C'])
+            assert_equal(
+                [type(error) for error in errors], [
+                    Terminals.UnexpectedCharacter, UnexpectedToken,
+                    Terminals.UnexpectedCharacter
+                ]
+            )
+            assert_equal((errors[0].line, errors[0].column), (1, 17))
+            assert_equal((errors[2].line, errors[2].column), (3, 1))
+
+
+def test_recover_malformed_numbers():
+    gql = (
+        'type A { a: Int }\ntype B { b: 1.2.3 }\n'
+        'type C { c: -- }\ntype D { d: Int }\n'
+    )
+
+    for scanner in (False, True):
+        lexer = GraphQLLexer(gql, scanner=scanner)
+        schema, errors = Schema.recover(Parser(lexer))
+
+        assert_equal(names(schema), ['A', 'D'])
+        assert_equal(
+            [type(error) for error in errors],
+            [UnexpectedToken, Terminals.UnexpectedCharacter]
+        )
+        assert_equal((errors[1].line, errors[1].column), (3, 13))
+        assert_false(lexer.invalid)
+
+
+def test_recover_valid_schema():
+    gql = SCHEMA.replace('height Float', 'height: Float')
+    gql = gql.replace('weasel', '').replace('EMPIRE:', 'EMPIRE')
+    gql = gql.replace('last(', 'last')
+
+    schema, errors = recover(gql)
+
+    assert_equal(errors, [])
+    assert_equal(
+        names(schema), names(Schema.match(Parser(GraphQLLexer(gql))))
+    )
+
+
+def test_match_still_raises():
+    assert_raises(
+        UnexpectedToken, Schema.match, Parser(GraphQLLexer(SCHEMA))
+    )
+    assert_raises(
+        Terminals.UnexpectedCharacter,
+        Schema.match, Parser(GraphQLLexer('type A { a: Int @ }'))
+    )
@@ -0,0 +1,141 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import Schema
+from gqlp.ignore_tokens import IgnoreTokens
+from gqlp.parser import Parser
+from gqlp.terminals import *
+
+
+SCHEMAS = [
+    """
+    type Images {
+        TEASER: Image
+        PORTRAIT: Image
+        BANDEROLE: Image
+    }
+    """,
+    """weasel
+    """,
+    """wea2sel
+    """,
+    """_wea2sel: weas_el
+    """,
+    """1337
+    """,
+    """3.1415
+    """,
+    """-3.1415
+    """,
+    """
+    type Type {
+        # This is a comment
+        key: value
+    }
+    """,
+    """
+    type Type {
+        key: [ value ]
+    }
+    """,
+    '''"Hello, World!" ''',
+    '''"""Hello, World!""" ''',
+    '''
+"""
+The set of languages supported by `translate`.
+"""
+enum Language {
+  "English"
+  EN
+
+  "French"
+  FR
+
+  "Chinese"
+  CH
+}
+    ''',
+]
+
+
+def positions(tokens):
+    return [(token, token.line, token.column) for token in tokens]
+
+
+def test_scanner_parity():
+    for gql in SCHEMAS:
+        expected_tokens = positions(GraphQLLexer(gql))
+        tokens = positions(GraphQLLexer(gql, scanner=True))
+        assert_equal(tokens, expected_tokens)
+
+
+def test_scanner_positions():
+    gql = """
+    type Type {
+        key: [ value ]
+    }
+    """
+
+    tokens = list(GraphQLLexer(gql, scanner=True))
+
+    assert_equal((tokens[1].line, tokens[1].column), (2, 5))
+    assert_equal((tokens[5].line, tokens[5].column), (3, 9))
+    assert_equal((tokens[-1].line, tokens[-1].column), (5, 5))
+
+
+def test_scanner_errors():
+    gql = """
+    type Type {
+        # this is a comment
+        % key: value
+    }
+    """
+
+    lexer = GraphQLLexer(gql, scanner=True)
+
+    with assert_raises(Terminals.UnexpectedCharacter) as context:
+        list(lexer)
+
+    assert_equal(context.exception.line, 4)
+    assert_equal(context.exception.column, 9)
+
+
+def test_scanner_invalid_tokens():
+    gql = 'type A {\n  % a: Int é\n}'
+    text = list(GraphQLLexer(gql, scanner=True, invalid=True))
+    binary = list(GraphQLLexer(gql.encode('utf-8'), invalid=True))
+    lexed = list(GraphQLLexer(gql, invalid=True))
+
+    invalid = [token for token in text if isinstance(token, Invalid)]
+    assert_equal([str(token) for token in invalid], ['%', 'é'])
+    assert_equal((invalid[0].line, invalid[0].column), (2, 3))
+    assert_equal(text, binary)
+    assert_equal(text, lexed)
+    assert_equal(
+        [(token.line, token.column) for token in binary],
+        [(token.line, token.column) for token in text]
+    )
+
+
+def test_scanner_ignore():
+    for gql in SCHEMAS:
+        expected = positions(
+            IgnoreTokens(GraphQLLexer(gql, scanner=True), [NewLine, Comment])
+        )
+        tokens = positions(GraphQLLexer(gql, ignore=(NewLine, Comment)))
+        assert_equal(tokens, expected)
+
+    table = GraphQLLexer(SCHEMAS[7], ignore=(NewLine, Comment)).table()
+    assert_equal(
+        [table.kind(index) for index in range(len(table))],
+        [Name, Name, LeftCurlyBracket, Name, Colon, Name,
+         RightCurlyBracket, Eof]
+    )
+
+
+def test_parser_skips_filtering_ignored_tokens():
+    lexer = GraphQLLexer(SCHEMAS[7], ignore=(NewLine, Comment))
+    parser = Parser(lexer)
+
+    assert_equal(parser.buffered(), 8)
+    assert_equal(len(Schema.match(parser)._types), 1)
@@ -0,0 +1,146 @@
+import pickle
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import *
+
+
+SCHEMA = """
+type Human implements Character {
+  id: ID!
+  friends: [Character]
+}
+
+type Droid implements Character {
+  id: ID!
+  primaryFunction: String
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+  JEDI
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+query DroidById($id: ID!) {
+  droid(id: $id) {
+    name
+  }
+}
+"""
+
+
+def parse(gql):
+    return Schema.match(Parser(GraphQLLexer(gql)))
+
+
+def test_type_index():
+    schema = parse(SCHEMA)
+
+    assert_equal(repr(schema.type('Human')), '<Type: Human (Character)>')
+    assert_equal(repr(schema.type('ReviewInput')), '<Input: ReviewInput>')
+    assert_equal(repr(schema.type('Episode')), '<Enum: Episode>')
+    assert_equal(schema.type('DroidById'), None)
+    assert_equal(schema.type('Weasel'), None)
+
+
+def test_field_index():
+    schema = parse(SCHEMA)
+
+    assert_equal(repr(schema.field('Human', 'friends')),
+                 '<friends: <List:Character>>')
+    assert_equal(list(schema.fields('Droid')), ['id', 'primaryFunction'])
+    assert_equal(schema.field('Human', 'primaryFunction'), None)
+    assert_equal(schema.field('Weasel', 'id'), None)
+
+
+def test_enum_values_and_implementors():
+    schema = parse(SCHEMA)
+
+    assert_equal(schema.enum_values('Episode'), {'NEWHOPE', 'EMPIRE', 'JEDI'})
+    assert_equal(
+        [str(type_) for type_ in schema.implementors('Character')],
+        ['Human', 'Droid']
+    )
+    assert_equal(schema.implementors('Episode'), [])
+
+
+def test_programmatic_changes():
+    schema = parse(SCHEMA)
+    starship = parse('type Starship implements Vehicle { length: Float }')
+
+    schema.add(starship.type('Starship'))
+    schema.add_field('Starship', Field(name=Name('name'), type=Name('String')))
+    droid = schema.remove('Droid')
+
+    assert_equal(str(droid), 'Droid')
+    assert_equal(schema.type('Droid'), None)
+    assert_equal(str(schema.field('Starship', 'name')._type), 'String')
+    assert_equal(len(schema.type('Starship')._fields), 2)
+    assert_equal([str(type_) for type_ in schema.implementors('Character')],
+                 ['Human'])
+    assert_equal(len(schema.implementors('Vehicle')), 1)
+    assert droid not in schema._types
+
+
+def test_duplicate_definitions():
+    schema = parse(
+        'type A { x: Int }\ntype A implements B { y: Int }\nenum A { Z }'
+    )
+    first, second, third = schema._types
+
+    assert_is(schema.type('A'), first)
+    assert_equal(list(schema.fields('A')), ['x'])
+    assert_equal(schema.duplicates('A'), [second, third])
+    assert_equal(schema.implementors('B'), [])
+
+    assert_is(schema.remove('A'), first)
+    assert_is(schema.type('A'), second)
+    assert_equal(list(schema.fields('A')), ['y'])
+    assert_equal(schema.implementors('B'), [second])
+
+    schema.remove('A')
+    assert_is(schema.type('A'), third)
+    assert_equal(schema.enum_values('A'), {'Z'})
+    assert_equal(schema.implementors('B'), [])
+
+    schema.remove('A')
+    assert_equal(schema.type('A'), None)
+    assert_equal(schema._types, [])
+
+
+def test_pickled_indexes():
+    schema = pickle.loads(pickle.dumps(parse(SCHEMA)))
+
+    assert_equal(str(schema.field('Droid', 'id')._name), 'id')
+    assert_equal(len(schema.implementors('Character')), 2)
+
+
+def test_nodes_have_no_dict():
+    schema = parse(SCHEMA)
+    human = schema.type('Human')
+    episode = schema.type('Episode')
+    review = schema.type('ReviewInput')
+    field = human._fields[1]
+
+    for node in (human, review, episode, field, field._type, field._name):
+        assert_false(hasattr(node, '__dict__'), node)
+
+
+def test_names_are_interned_and_scalars_shared():
+    schema = parse(SCHEMA)
+    human, droid = schema._types[:2]
+
+    assert_is(human._parent._value, droid._parent._value)
+    assert_is(human._fields[0]._type, droid._fields[0]._type)
+    assert_is(human._fields[0]._type, SCALAR_NAMES['ID'])
+    assert_equal(repr(human._fields[0]), '<id: ID!>')
+
+    restored = pickle.loads(pickle.dumps(schema))
+    assert_equal(restored.field('Human', 'friends')._type._type, Name('Character'))
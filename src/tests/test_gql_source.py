@@ -0,0 +1,98 @@
+import mmap
+import tempfile
+from pathlib import Path
+
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import *
+from gqlp.terminals import *
+
+
+SCHEMA = """
+type Type {
+    # Größe in cm
+    size: Int
+    key: [ value ]
+}
+"""
+
+
+def positions(tokens):
+    return [(token, token.line, token.column) for token in tokens]
+
+
+def test_bytes():
+    gql = SCHEMA + '"Größe" key\n'
+    expected_tokens = positions(GraphQLLexer(gql))
+
+    data = gql.encode('utf-8')
+    assert_equal(positions(GraphQLLexer(data)), expected_tokens)
+    assert_equal(positions(GraphQLLexer(memoryview(data))), expected_tokens)
+
+
+def test_byte_order_mark():
+    expected_tokens = list(GraphQLLexer(SCHEMA))
+
+    marked = '﻿' + SCHEMA
+    assert_equal(list(GraphQLLexer(marked)), expected_tokens)
+    assert_equal(list(GraphQLLexer(marked, scanner=True)), expected_tokens)
+    assert_equal(list(GraphQLLexer(marked.encode('utf-8'))), expected_tokens)
+
+
+def test_path():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'schema.graphql'
+        path.write_bytes(b'\xef\xbb\xbf' + SCHEMA.encode('utf-8'))
+
+        lexer = GraphQLLexer(path)
+        schema = Schema.match(Parser(lexer))
+
+        assert isinstance(lexer._schema, mmap.mmap)
+        assert_equal(repr(schema._types), '[<Type: Type>]')
+        name = schema._types[0]._fields[1]._name
+        assert_equal((name.line, name.column), (5, 5))
+
+
+def test_empty_path():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'schema.graphql'
+        path.write_bytes(b'')
+
+        assert_equal(list(GraphQLLexer(path)), [Eof()])
+
+
+def test_table_bytes():
+    data = SCHEMA.encode('utf-8')
+
+    table = GraphQLLexer(data).table()
+
+    assert_equal(list(table), list(GraphQLLexer(SCHEMA)))
+    assert_equal(table.value(5), 'Größe in cm')
+
+
+def test_binary_errors():
+    data = '\n  "größe" %'.encode('utf-8')
+
+    with assert_raises(Terminals.UnexpectedCharacter) as context:
+        list(GraphQLLexer(data))
+
+    assert_equal(context.exception.character, '%')
+    assert_equal(context.exception.column, 11)
+
+
+def test_path_mapping_is_closed_after_lexing():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'schema.graphql'
+        path.write_bytes(SCHEMA.encode('utf-8'))
+
+        lexer = GraphQLLexer(path)
+        tokens = list(lexer)
+
+        assert_true(lexer._schema.closed)
+        assert_equal(tokens, list(GraphQLLexer(SCHEMA)))
+        assert_equal(
+            [(token.line, token.column) for token in tokens],
+            [(token.line, token.column) for token in GraphQLLexer(SCHEMA)]
+        )
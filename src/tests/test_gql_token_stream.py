@@ -0,0 +1,78 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import *
+from gqlp.terminals import *
+from gqlp.token_stream import TokenStream
+
+
+def test_token_stream_pulls_lazily():
+    pulled = []
+
+    def tokens():
+        for number in range(100):
+            pulled.append(number)
+            yield Number(number)
+
+    stream = TokenStream(tokens(), size=4)
+
+    assert_equal(stream[0], Number(0))
+    assert_equal(stream[2], Number(2))
+    assert_equal(len(pulled), 3)
+
+
+def test_token_stream_forgets_old_tokens():
+    stream = TokenStream((Number(n) for n in range(100)), size=4)
+
+    assert_equal(stream[10], Number(10))
+    assert_equal(stream[7], Number(7))
+    assert_raises(TokenStream.Rewound, lambda: stream[6])
+
+
+def test_token_stream_end():
+    stream = TokenStream([Name('weasel')])
+
+    assert_equal(stream[0], Name('weasel'))
+    assert_raises(IndexError, lambda: stream[1])
+
+
+def test_streaming_parser():
+    gql = """
+    type Images {
+        TEASER: Image
+        # Comment
+        PORTRAIT: [Image!]!
+    }
+
+    enum Episode {
+      NEWHOPE
+      EMPIRE
+    }
+    """
+
+    parser = Parser(GraphQLLexer(gql), stream=True)
+    schema = Schema.match(parser)
+
+    assert_equal(len(schema._types), 2)
+    assert_equal(len(parser._tokens._buffer), TokenStream.SIZE)
+
+
+def test_streaming_parser_errors():
+    gql = """
+    type Images {
+        TEASER Image
+    }
+    """
+
+    def error(parser):
+        try:
+            Schema.match(parser)
+        except UnexpectedToken as e:
+            return str(e)
+
+    expected = error(Parser(GraphQLLexer(gql)))
+    message = error(Parser(GraphQLLexer(gql), stream=True))
+
+    assert_equal(message, expected)
+    assert message
@@ -0,0 +1,100 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.ignore_tokens import IgnoreTokens
+from gqlp.parser import *
+from gqlp.terminals import *
+
+
+def test_table_columns():
+    gql = """type Point {
+        x: Float # horizontal
+    }"""
+
+    table = GraphQLLexer(gql).table()
+
+    assert_equal(len(table), 11)
+    assert_equal(table.kind(1), Name)
+    assert_equal(table.text(1), 'Point')
+    assert_equal(table.kind(7), Comment)
+    assert_equal(table.value(7), 'horizontal')
+    assert_equal(table.kind(10), Eof)
+
+
+def test_table_views():
+    gql = """
+    type Type {
+        key: [ value ]
+        count: -12
+        "described"
+    }
+    """
+
+    table = GraphQLLexer(gql).table()
+
+    assert_equal(list(table), list(GraphQLLexer(gql)))
+    assert_equal(table[13], Number(-12))
+    assert_equal(table[15], String('described'))
+    assert_equal((table[15].line, table[15].column), (5, 9))
+
+
+def test_table_ignore_tokens():
+    gql = """
+    # Comment
+    enum Episode { JEDI }
+    """
+
+    table = IgnoreTokens(GraphQLLexer(gql).table(), [NewLine, Comment])
+    table = table.table()
+
+    expected_tokens = [
+        Name('enum'), Name('Episode'), LeftCurlyBracket(),
+        Name('JEDI'), RightCurlyBracket(), Eof()
+    ]
+    assert_equal(list(table), expected_tokens)
+
+
+def test_table_parser():
+    gql = """
+    type Human implements Character {
+      id: ID!
+      # Comment
+      friends: [Character]
+    }
+
+    enum Episode {
+      NEWHOPE
+      EMPIRE
+    }
+    """
+
+    parser = Parser(GraphQLLexer(gql).table())
+    schema = Schema.match(parser)
+
+    assert_equal(len(schema._types), 2)
+    assert_equal(schema._types[0]._parent, Name('Character'))
+
+
+def test_table_invalid_tokens():
+    gql = 'type A {\n  % a: Int\n}'
+
+    table = GraphQLLexer(gql, invalid=True).table()
+
+    assert_equal(list(table), list(GraphQLLexer(gql, invalid=True)))
+    assert_is(table.kind(4), Invalid)
+    assert_equal(table.position(4), (2, 3))
+
+
+def test_table_errors():
+    gql = """
+    type Type {
+        % key: value
+    }
+    """
+
+    with assert_raises(Terminals.UnexpectedCharacter) as context:
+        GraphQLLexer(gql).table()
+
+    assert_equal(context.exception.line, 3)
+    assert_equal(context.exception.column, 9)
@@ -0,0 +1,70 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.terminals import *
+
+
+SCHEMA = """
+# Someone in the films
+type Human {
+  name: String # Full name
+  # Meters
+  height: Float
+}
+"""
+
+
+def lex(schema):
+    lexer = GraphQLLexer(schema, ignore=(NewLine, Comment), trivia=True)
+    return list(lexer), lexer.trivia
+
+
+def test_trivia():
+    tokens, trivia = lex(SCHEMA)
+
+    assert_equal(len(tokens), 11)
+    assert_equal(len(trivia), 3)
+    assert_equal(list(trivia), [
+        Comment('Someone in the films'), Comment('Full name'),
+        Comment('Meters')
+    ])
+    assert_equal((trivia[1].line, trivia[1].column), (4, 16))
+    assert_equal(trivia.text(2), '# Meters')
+    assert_equal(trivia.range(0), (1, 23))
+
+
+def test_trivia_between():
+    tokens, trivia = lex(SCHEMA)
+    human = tokens[1]
+
+    assert_equal(trivia.between(0, human.offset), [
+        Comment('Someone in the films')
+    ])
+    assert_equal(len(trivia.between(human.offset, len(SCHEMA))), 2)
+
+
+def test_trivia_binary():
+    tokens, trivia = lex(SCHEMA.encode('utf-8'))
+
+    assert_equal(trivia[-1], Comment('Meters'))
+    assert_equal(trivia[-1].line, 5)
+
+
+def test_no_trivia_without_comments_ignored():
+    lexer = GraphQLLexer(SCHEMA, ignore=(NewLine,), trivia=True)
+    tokens = list(lexer)
+
+    assert_equal(len(lexer.trivia), 0)
+    assert_equal(sum(isinstance(token, Comment) for token in tokens), 3)
+    assert_is_none(GraphQLLexer(SCHEMA).trivia)
+
+
+def test_table_trivia():
+    lexer = GraphQLLexer(SCHEMA, ignore=(NewLine, Comment), trivia=True)
+    table = lexer.table()
+    tokens, trivia = lex(SCHEMA)
+
+    assert_equal(list(table), tokens)
+    assert_equal(list(table.trivia), list(trivia))
+    assert_equal(table.trivia.range(1), trivia.range(1))
+    assert_is_none(GraphQLLexer(SCHEMA, ignore=(Comment,)).table().trivia)
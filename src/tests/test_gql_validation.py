@@ -0,0 +1,195 @@
+from nose.tools import *
+
+from gqlp import GraphQLLexer
+from gqlp.gql import *
+from gqlp.parser import Parser
+from gqlp.validation import *
+
+
+SCHEMA = """
+type Query {
+  hero(episode: Episode): Character
+  droid(id: ID): Droid
+}
+
+type Character {
+  name: String
+  friends: [[Character]]
+}
+
+type Droid implements Character {
+  name: String
+  primaryFunction: String
+}
+
+input ReviewInput {
+  stars: Int!
+}
+
+enum Episode {
+  NEWHOPE
+  EMPIRE
+}
+"""
+
+
+def parse(gql):
+    parser = Parser(GraphQLLexer(gql))
+    return Schema.match(parser)
+
+
+def query(gql):
+    return parse(gql)._types[0]
+
+
+def errors(gql):
+    return Validator(parse(SCHEMA)).validate(query(gql))
+
+
+def test_parse_nested_selection():
+    friends = query("""
+    query Hero($episode: Episode) {
+      hero(episode: $episode) {
+        friends {
+          name
+        }
+        name
+      }
+    }
+    """)
+    document = friends._document
+
+    assert_equal(document._signature._name, Name('hero'))
+    assert_equal(document._signature._variable, Name('episode'))
+    assert_equal(
+        document._document,
+        [Name('friends'), [Name('name')], Name('name')]
+    )
+
+
+def test_valid_query():
+    assert_equal(errors("""
+    query Hero($episode: Episode) {
+      hero(episode: $episode) {
+        name
+        friends {
+          name
+          friends {
+            name
+          }
+        }
+      }
+    }
+    """), [])
+
+
+def test_unknown_fields():
+    found = errors("""
+    query Hero($episode: Episode) {
+      hero(episode: $episode) {
+        weasel
+        friends {
+          height
+        }
+      }
+    }
+    """)
+
+    assert_equal([type(error) for error in found], [UnknownField] * 2)
+    assert_equal(found[0].node, Name('weasel'))
+    assert_in('Type "Character" has no field "weasel"', str(found[0]))
+    assert_in('line 4', str(found[0]))
+    assert_in('"Character" has no field "height"', str(found[1]))
+
+
+def test_unknown_root_field():
+    found = errors("""
+    query Human($id: ID) {
+      human(id: $id) {
+        name
+      }
+    }
+    """)
+
+    assert_equal(len(found), 1)
+    assert_in('Type "Query" has no field "human"', str(found[0]))
+
+
+def test_selection_on_leaf():
+    found = errors("""
+    query Droid($id: ID) {
+      droid(id: $id) {
+        name {
+          length
+        }
+      }
+    }
+    """)
+
+    assert_equal([type(error) for error in found], [SelectionOnLeaf])
+    assert_in('Field "name" of type "String"', str(found[0]))
+
+
+def test_arguments_and_variables():
+    assert_equal(
+        [type(error) for error in errors("""
+        query Droid($id: ID) {
+          droid(name: $id) {
+            name
+          }
+        }
+        """)],
+        [UnknownArgument]
+    )
+    assert_equal(
+        [type(error) for error in errors("""
+        query Droid($id: ID) {
+          droid(id: $other) {
+            name
+          }
+        }
+        """)],
+        [UnknownVariable]
+    )
+    assert_equal(
+        [type(error) for error in errors("""
+        query Droid($id: Int) {
+          droid(id: $id) {
+            name
+          }
+        }
+        """)],
+        [VariableTypeMismatch]
+    )
+    assert_equal(
+        [type(error) for error in errors("""
+        query Droid($id: Droid) {
+          droid(id: $id) {
+            name
+          }
+        }
+        """)],
+        [NotAnInputType, VariableTypeMismatch]
+    )
+
+
+def test_validator_follows_schema_changes():
+    schema = parse(SCHEMA)
+    validator = Validator(schema)
+    droid = query("""
+    query Droid($id: ID) {
+      droid(id: $id) {
+        model
+      }
+    }
+    """)
+
+    assert_equal([type(error) for error in validator.validate(droid)],
+                 [UnknownField])
+
+    schema.add_field('Droid', Field(Name('model'), Name('String')))
+    assert_equal(validator.validate(droid), [])
+
+    schema.remove('Droid')
+    assert_equal([type(error) for error in validator.validate(droid)],
+                 [SelectionOnLeaf])